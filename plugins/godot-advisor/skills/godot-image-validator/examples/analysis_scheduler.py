@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Analysis Scheduler for Godot Image Validator
+
+This module orders analysis jobs by asset importance instead of load order. Images
+visible in the grid come first, then images the user selected, then assets referenced
+by the project's scenes and resources, then recently modified files. Visibility and
+selection change while a run is in progress, so the scheduler is a thread-safe priority
+queue the UI re-ranks as the user scrolls, and the pipeline pops from.
+"""
+
+import heapq
+import logging
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+from asset_scanner import ScanConfig, iter_asset_paths
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Priority flags, summed into a job's priority; each outranks all below it
+PRIORITY_VISIBLE = 8  # Card currently on screen
+PRIORITY_SELECTED = 4  # Selected by the user
+PRIORITY_SCENE = 2  # Referenced by a scene or resource
+PRIORITY_RECENT = 1  # Modified recently
+
+# Files modified within this window count as recent
+RECENT_SECONDS = 7 * 24 * 3600
+
+# Scenes and text resources (SpriteFrames, themes, tile sets) referencing textures
+SCENE_EXTENSIONS = [".tscn", ".tres"]
+
+# Marker file of a Godot project root
+PROJECT_FILE = "project.godot"
+
+# External resource references, in both Godot 3 and Godot 4 syntax
+_EXT_RESOURCE_PATTERN = re.compile(r'\[ext_resource\b[^\]]*?\bpath="([^"]+)"')
+
+
+def find_project_root(path: Path) -> Optional[Path]:
+    """Nearest folder at or above a path that holds project.godot"""
+    path = Path(path).resolve()
+    for folder in [path, *path.parents]:
+        if (folder / PROJECT_FILE).is_file():
+            return folder
+    return None
+
+
+def scene_references(project_root: Path) -> Set[Path]:
+    """
+    Resolved paths of all files referenced by the project's scenes
+
+    Args:
+        project_root: Folder holding project.godot
+
+    Returns:
+        Set[Path]: Referenced files (res:// paths mapped to the file system)
+    """
+    project_root = Path(project_root).resolve()
+    config = ScanConfig(extensions=list(SCENE_EXTENSIONS))
+    references = set()
+    for scene_path in iter_asset_paths(project_root, config):
+        try:
+            text = scene_path.read_text(encoding="utf-8", errors="replace")
+        except OSError as e:
+            logger.debug(f"Skipping unreadable scene {scene_path}: {e}")
+            continue
+        for res_path in _EXT_RESOURCE_PATTERN.findall(text):
+            if res_path.startswith("res://"):
+                references.add(project_root / res_path[len("res://") :])
+    return references
+
+
+def asset_importance(
+    image_paths: Sequence[Path],
+    project_root: Optional[Path] = None,
+    recent_seconds: float = RECENT_SECONDS,
+) -> Dict[int, int]:
+    """
+    Static priority flags of images: scene references and recent changes
+
+    Args:
+        image_paths: Images of the run
+        project_root: Godot project folder (looked up from the first image
+            if omitted; scene references are skipped outside a project)
+        recent_seconds: Age below which a file counts as recently modified
+
+    Returns:
+        Dict[int, int]: Priority flags per image index (zero flags left out)
+    """
+    if not image_paths:
+        return {}
+
+    if project_root is None:
+        project_root = find_project_root(Path(image_paths[0]).parent)
+    references = scene_references(project_root) if project_root else set()
+
+    cutoff = time.time() - recent_seconds
+    flags = {}
+    for index, image_path in enumerate(image_paths):
+        value = 0
+        if references and Path(os.path.realpath(image_path)) in references:
+            value |= PRIORITY_SCENE
+        try:
+            if os.stat(image_path).st_mtime >= cutoff:
+                value |= PRIORITY_RECENT
+        except OSError:
+            pass
+        if value:
+            flags[index] = value
+    return flags
+
+
+class AnalysisScheduler:
+    """
+    Thread-safe priority queue of image indices
+
+    Jobs are popped by priority, then in load order. Changing a job's
+    priority pushes a new heap entry and leaves the old one to be skipped,
+    so re-ranking on every scroll step stays cheap.
+    """
+
+    def __init__(self, count: int, flags: Optional[Dict[int, int]] = None):
+        """
+        Initialize scheduler
+
+        Args:
+            count: Number of jobs (image indices 0..count-1)
+            flags: Initial priority flags per index
+        """
+        self._flags = [0] * count
+        self._versions = [0] * count
+        self._taken = [False] * count
+        self._remaining = count
+        self._visible: Set[int] = set()
+        self._selected: Set[int] = set()
+        self._lock = threading.Lock()
+
+        for index, value in (flags or {}).items():
+            self._flags[index] = value
+        self._heap = [(-self._flags[i], i, 0) for i in range(count)]
+        heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        """Number of jobs not yet popped"""
+        return self._remaining
+
+    def priority(self, index: int) -> int:
+        """Current priority of a job"""
+        return self._flags[index]
+
+    def add_flags(self, flags: Dict[int, int]):
+        """Raise jobs' priorities by static flags (e.g. from asset_importance)"""
+        with self._lock:
+            for index, value in flags.items():
+                self._set_locked(index, self._flags[index] | value)
+
+    def set_visible(self, indices: Iterable[int]):
+        """Replace the set of jobs whose cards are on screen"""
+        with self._lock:
+            self._visible = self._replace_flag_locked(
+                self._visible, set(indices), PRIORITY_VISIBLE
+            )
+
+    def set_selected(self, indices: Iterable[int]):
+        """Replace the set of jobs selected by the user"""
+        with self._lock:
+            self._selected = self._replace_flag_locked(
+                self._selected, set(indices), PRIORITY_SELECTED
+            )
+
+    def _replace_flag_locked(
+        self, current: Set[int], new: Set[int], flag: int
+    ) -> Set[int]:
+        """Clear a flag on jobs leaving a set and set it on jobs joining it"""
+        new = {i for i in new if 0 <= i < len(self._flags)}
+        for index in current - new:
+            self._set_locked(index, self._flags[index] & ~flag)
+        for index in new - current:
+            self._set_locked(index, self._flags[index] | flag)
+        return new
+
+    def _set_locked(self, index: int, value: int):
+        """Change a job's priority by pushing a fresh heap entry"""
+        if value == self._flags[index] or self._taken[index]:
+            self._flags[index] = value
+            return
+        self._flags[index] = value
+        self._versions[index] += 1
+        heapq.heappush(self._heap, (-value, index, self._versions[index]))
+
+        # Stale entries pile up with scrolling; rebuild once they dominate
+        if len(self._heap) > 4 * max(self._remaining, 64):
+            self._heap = [
+                (-self._flags[i], i, self._versions[i])
+                for i in range(len(self._flags))
+                if not self._taken[i]
+            ]
+            heapq.heapify(self._heap)
+
+    def _is_current(self, entry) -> bool:
+        _, index, version = entry
+        return not self._taken[index] and version == self._versions[index]
+
+    def pop(self) -> Optional[int]:
+        """Take the most important remaining job, or None when all are taken"""
+        with self._lock:
+            while self._heap:
+                entry = heapq.heappop(self._heap)
+                if self._is_current(entry):
+                    self._taken[entry[1]] = True
+                    self._remaining -= 1
+                    return entry[1]
+            return None
+
+    def peek(self, count: int) -> List[int]:
+        """
+        The next jobs pop() would return, most important first
+
+        Walks the heap from its root in order, through a small frontier heap
+        of child positions, so the cost grows with count (and the stale
+        entries met on the way) rather than with the number of jobs.
+        """
+        indices: List[int] = []
+        with self._lock:
+            heap = self._heap
+            frontier = [(heap[0], 0)] if heap else []
+            while frontier and len(indices) < count:
+                entry, position = heapq.heappop(frontier)
+                if self._is_current(entry):
+                    indices.append(entry[1])
+                for child in (2 * position + 1, 2 * position + 2):
+                    if child < len(heap):
+                        heapq.heappush(frontier, (heap[child], child))
+        return indices
+
+
+# Example usage
+def main():
+    """Rank the images of a Godot project by importance"""
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python analysis_scheduler.py <project folder>")
+        return
+
+    root = Path(sys.argv[1])
+    image_paths = list(iter_asset_paths(root))
+
+    start_time = time.time()
+    flags = asset_importance(image_paths, find_project_root(root))
+    elapsed = time.time() - start_time
+
+    scheduler = AnalysisScheduler(len(image_paths), flags)
+    scheduler.set_visible(range(len(image_paths) - 3, len(image_paths)))
+    order = [scheduler.pop() for _ in range(min(10, len(image_paths)))]
+
+    scene_count = sum(1 for value in flags.values() if value & PRIORITY_SCENE)
+    recent_count = sum(1 for value in flags.values() if value & PRIORITY_RECENT)
+    print(
+        f"{len(image_paths)} images: {scene_count} referenced by scenes, "
+        f"{recent_count} recently modified (ranked in {elapsed:.2f}s)"
+    )
+    print("First to analyze (last three marked visible):")
+    for index in order:
+        print(f"  [{scheduler.priority(index):2d}] {image_paths[index]}")
+
+
+if __name__ == "__main__":
+    main()
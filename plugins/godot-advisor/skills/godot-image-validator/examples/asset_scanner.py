@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Asset Scanner for Godot Image Validator
+
+This module enumerates image assets in a Godot project folder lazily. A generator walks
+the tree with os.scandir, skipping folders Godot itself ignores (.gdignore, .godot,
+.import), excluded globs and anything beyond the maximum depth, so callers can stream
+paths into the UI in chunks instead of waiting for the whole project to be listed.
+"""
+
+import fnmatch
+import logging
+import os
+import time
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, List, Optional
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Image formats Godot can import (matches MCPClient._is_supported_format)
+IMAGE_EXTENSIONS = (
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".webp",
+    ".svg",
+    ".exr",
+    ".tga",
+    ".bmp",
+    ".tiff",
+    ".tif",
+)
+
+# Godot skips every folder containing this marker file
+GDIGNORE_FILE = ".gdignore"
+
+
+@dataclass
+class ScanConfig:
+    """Configuration for folder scanning"""
+
+    extensions: List[str] = field(default_factory=lambda: list(IMAGE_EXTENSIONS))
+    max_depth: Optional[int] = None  # 0 = only the root folder, None = unlimited
+    # Shell globs matched against paths relative to the scan root
+    exclude_globs: List[str] = field(default_factory=lambda: [".godot", ".import"])
+    respect_gdignore: bool = True
+    imported_only: bool = False  # Only images Godot imported (have a .import file)
+    skip_hidden: bool = True  # Hidden files and folders (.git, .godot, ...)
+    follow_symlinks: bool = False
+
+    def validate(self):
+        """Validate scan configuration"""
+        if self.max_depth is not None and self.max_depth < 0:
+            raise ValueError("max_depth must be None or >= 0")
+        if not self.extensions:
+            raise ValueError("At least one extension is required")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return asdict(self)
+
+
+def _is_excluded(relative_path: str, exclude_globs: List[str]) -> bool:
+    """Check a root-relative POSIX path against the exclude globs"""
+    return any(fnmatch.fnmatch(relative_path, pattern) for pattern in exclude_globs)
+
+
+def iter_asset_paths(root: Path, config: Optional[ScanConfig] = None) -> Iterator[Path]:
+    """
+    Lazily yield image paths below a folder
+
+    Folders are visited depth-first in name order, and each folder is read
+    with a single os.scandir call, so the first paths are available almost
+    immediately even in very large projects.
+
+    Args:
+        root: Folder to scan
+        config: Scan configuration
+
+    Yields:
+        Path: Image paths that pass the filters
+    """
+    config = config or ScanConfig()
+    config.validate()
+
+    root = Path(root)
+    extensions = {ext.lower() for ext in config.extensions}
+    stack = [(str(root), "", 0)]  # (folder, root-relative prefix, depth)
+
+    while stack:
+        folder, prefix, depth = stack.pop()
+        try:
+            with os.scandir(folder) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError as e:
+            logger.debug(f"Skipping unreadable folder {folder}: {e}")
+            continue
+
+        names = {entry.name for entry in entries}
+        if config.respect_gdignore and GDIGNORE_FILE in names:
+            continue
+
+        subfolders = []
+        for entry in entries:
+            name = entry.name
+            if config.skip_hidden and name.startswith("."):
+                continue
+
+            relative = f"{prefix}{name}"
+            if config.exclude_globs and _is_excluded(relative, config.exclude_globs):
+                continue
+
+            try:
+                is_dir = entry.is_dir(follow_symlinks=config.follow_symlinks)
+            except OSError:
+                continue
+
+            if is_dir:
+                if config.max_depth is None or depth < config.max_depth:
+                    subfolders.append((entry.path, f"{relative}/", depth + 1))
+                continue
+
+            if os.path.splitext(name)[1].lower() not in extensions:
+                continue
+            if config.imported_only and f"{name}.import" not in names:
+                continue
+
+            yield Path(entry.path)
+
+        # Reversed so the stack pops subfolders in name order
+        stack.extend(reversed(subfolders))
+
+
+def iter_chunks(
+    paths: Iterable[Path], chunk_size: int = 500, max_wait: Optional[float] = 0.1
+) -> Iterator[List[Path]]:
+    """
+    Group paths into chunks for streaming
+
+    A chunk is emitted when it is full or, if max_wait is set, when it has
+    been collecting for that long, so slow folders still show up promptly.
+
+    Args:
+        paths: Paths to group
+        chunk_size: Maximum paths per chunk
+        max_wait: Maximum seconds a non-empty chunk is held back
+
+    Yields:
+        List[Path]: Chunks of paths
+    """
+    chunk = []
+    started = 0.0
+    for path in paths:
+        if not chunk:
+            started = time.monotonic()
+        chunk.append(path)
+        if len(chunk) >= chunk_size or (
+            max_wait is not None and time.monotonic() - started >= max_wait
+        ):
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+# Example usage
+def main():
+    """Scan a folder and report what the validator would load"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Scan a Godot project for images")
+    parser.add_argument("folder", help="Folder to scan")
+    parser.add_argument("--max-depth", type=int, default=None)
+    parser.add_argument("--exclude", action="append", default=[], help="Exclude glob")
+    parser.add_argument("--imported-only", action="store_true")
+    args = parser.parse_args()
+
+    config = ScanConfig(max_depth=args.max_depth, imported_only=args.imported_only)
+    config.exclude_globs.extend(args.exclude)
+
+    start_time = time.time()
+    first_chunk_time = None
+    total = 0
+    for chunk in iter_chunks(iter_asset_paths(Path(args.folder), config)):
+        if first_chunk_time is None:
+            first_chunk_time = time.time() - start_time
+        total += len(chunk)
+
+    elapsed = time.time() - start_time
+    print(f"Found {total} images in {elapsed:.2f}s")
+    if first_chunk_time is not None:
+        print(f"First chunk after {first_chunk_time * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Asset Watcher for Godot Image Validator
+
+This module watches a Godot project folder and reports added, modified and deleted
+images so only those need re-validation. It uses watchdog (inotify, FSEvents,
+ReadDirectoryChangesW) when installed and falls back to polling snapshots otherwise.
+Events are debounced per file, so editors that save several times produce one change.
+"""
+
+import fnmatch
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from asset_scanner import GDIGNORE_FILE, ScanConfig, iter_asset_paths
+
+# Optional native file system events
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+    WATCHDOG_AVAILABLE = False
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+ADDED = "added"
+MODIFIED = "modified"
+DELETED = "deleted"
+
+
+def merge_change(previous: Optional[str], current: str) -> Optional[str]:
+    """
+    Combine two changes to the same file into one
+
+    Returns:
+        Optional[str]: Net change, or None if they cancel out
+    """
+    if previous is None:
+        return current
+    if previous == ADDED:
+        return None if current == DELETED else ADDED
+    if previous == DELETED:
+        return MODIFIED if current == ADDED else DELETED
+    return DELETED if current == DELETED else MODIFIED
+
+
+class _WatchdogHandler(FileSystemEventHandler):
+    """Forwards watchdog file events to an AssetWatcher"""
+
+    def __init__(self, watcher: "AssetWatcher"):
+        super().__init__()
+        self.watcher = watcher
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self.watcher.record(Path(event.src_path), ADDED)
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self.watcher.record(Path(event.src_path), MODIFIED)
+
+    def on_deleted(self, event):
+        if not event.is_directory:
+            self.watcher.record(Path(event.src_path), DELETED)
+
+    def on_moved(self, event):
+        if not event.is_directory:
+            self.watcher.record(Path(event.src_path), DELETED)
+            self.watcher.record(Path(event.dest_path), ADDED)
+
+
+class AssetWatcher:
+    """
+    Debounced change notifications for the images below a folder
+
+    callback(changes) is called on a background thread with a mapping of
+    path to ADDED, MODIFIED or DELETED, once every changed file has been
+    quiet for the debounce interval. Paths are filtered with the same
+    ScanConfig rules as folder scanning.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        callback: Callable[[Dict[Path, str]], None],
+        scan_config: Optional[ScanConfig] = None,
+        debounce: float = 0.5,
+        poll_interval: float = 1.0,
+        use_polling: Optional[bool] = None,
+    ):
+        """
+        Initialize asset watcher
+
+        Args:
+            root: Folder to watch (the project's res:// directory)
+            callback: Receives debounced changes
+            scan_config: Filters for watched files
+            debounce: Seconds a file must be quiet before it is reported
+            poll_interval: Seconds between snapshots in polling mode
+            use_polling: Force (True) or forbid (False) polling; None picks
+                watchdog when installed
+        """
+        self.root = Path(root).resolve()
+        self.callback = callback
+        self.scan_config = scan_config or ScanConfig()
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.use_polling = (
+            not WATCHDOG_AVAILABLE if use_polling is None else use_polling
+        )
+        if not self.use_polling and not WATCHDOG_AVAILABLE:
+            raise ImportError(
+                "watchdog is required for native events: pip install watchdog"
+            )
+
+        self._extensions = {ext.lower() for ext in self.scan_config.extensions}
+        # path -> (change, time of its last event)
+        self._pending: Dict[Path, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads = []
+        self._observer = None
+
+    @property
+    def backend(self) -> str:
+        """Name of the active event source"""
+        return "polling" if self.use_polling else "watchdog"
+
+    def start(self):
+        """Start watching"""
+        self._stop.clear()
+        if self.use_polling:
+            self._start_thread(self._poll_loop, "asset-poll")
+        else:
+            self._observer = Observer()
+            self._observer.schedule(
+                _WatchdogHandler(self), str(self.root), recursive=True
+            )
+            self._observer.start()
+        self._start_thread(self._debounce_loop, "asset-debounce")
+        logger.info(f"Watching {self.root} ({self.backend})")
+
+    def stop(self):
+        """Stop watching, dropping changes that are still debouncing"""
+        self._stop.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        with self._lock:
+            self._pending.clear()
+
+    def _start_thread(self, target: Callable, name: str):
+        thread = threading.Thread(target=target, name=name, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def is_watched(self, path: Path) -> bool:
+        """Check a path against the extension, hidden, exclude and .gdignore rules"""
+        if path.suffix.lower() not in self._extensions:
+            return False
+        try:
+            relative = path.resolve().relative_to(self.root)
+        except ValueError:
+            return False
+
+        config = self.scan_config
+        parts = relative.parts
+        if config.max_depth is not None and len(parts) - 1 > config.max_depth:
+            return False
+        if config.skip_hidden and any(part.startswith(".") for part in parts):
+            return False
+
+        # Folders are excluded with everything below them, as when scanning
+        for i in range(1, len(parts) + 1):
+            prefix = "/".join(parts[:i])
+            if any(
+                fnmatch.fnmatch(prefix, pattern) for pattern in config.exclude_globs
+            ):
+                return False
+
+        if config.respect_gdignore:
+            folder = self.root
+            for part in parts[:-1]:
+                if (folder / GDIGNORE_FILE).exists():
+                    return False
+                folder = folder / part
+            if (folder / GDIGNORE_FILE).exists():
+                return False
+        return True
+
+    def record(self, path: Path, change: str):
+        """Record a raw file event (called from backend threads)"""
+        if not self.is_watched(path):
+            return
+
+        with self._lock:
+            previous = self._pending.get(path)
+            merged = merge_change(previous[0] if previous else None, change)
+            if merged is None:
+                del self._pending[path]
+            else:
+                self._pending[path] = (merged, time.monotonic())
+
+    def _debounce_loop(self):
+        """Report files that have been quiet for the debounce interval"""
+        tick = min(0.1, self.debounce / 2) if self.debounce > 0 else 0.05
+        while not self._stop.wait(tick):
+            now = time.monotonic()
+            with self._lock:
+                ready = {
+                    path: change
+                    for path, (change, last_event) in self._pending.items()
+                    if now - last_event >= self.debounce
+                }
+                for path in ready:
+                    del self._pending[path]
+
+            if ready:
+                try:
+                    self.callback(ready)
+                except Exception as e:
+                    logger.error(f"Asset change callback failed: {e}")
+
+    def _snapshot(self) -> Dict[Path, Tuple[int, int]]:
+        """(mtime, size) of every watched image"""
+        snapshot = {}
+        for path in iter_asset_paths(self.root, self.scan_config):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def _poll_loop(self):
+        """Diff periodic snapshots into change events"""
+        previous = self._snapshot()
+        while not self._stop.wait(self.poll_interval):
+            current = self._snapshot()
+            for path, signature in current.items():
+                before = previous.get(path)
+                if before is None:
+                    self.record(path, ADDED)
+                elif before != signature:
+                    self.record(path, MODIFIED)
+            for path in previous.keys() - current.keys():
+                self.record(path, DELETED)
+            previous = current
+
+    def __enter__(self) -> "AssetWatcher":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+# Example usage
+def main():
+    """Print debounced image changes below a folder until interrupted"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Watch a Godot project for images")
+    parser.add_argument("folder", help="Folder to watch")
+    parser.add_argument("--poll", action="store_true", help="Force polling")
+    parser.add_argument("--debounce", type=float, default=0.5)
+    args = parser.parse_args()
+
+    def on_changes(changes: Dict[Path, str]):
+        for path, change in sorted(changes.items()):
+            print(f"{change:>8}: {path}")
+
+    watcher = AssetWatcher(
+        Path(args.folder),
+        on_changes,
+        debounce=args.debounce,
+        use_polling=True if args.poll else None,
+    )
+    with watcher:
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
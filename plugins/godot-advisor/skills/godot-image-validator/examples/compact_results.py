@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+Compact Result Store for Godot Image Validator
+
+This module keeps the validator's in-memory results as a struct of arrays instead of one
+dict per image. Confidences and flags live in typed arrays, category and issue lists are
+interned once per distinct combination and referenced by id, image paths are shared with
+the image list, and the rarely read rest of a result (metadata, review notes) is kept as
+marshalled bytes, with the key sets of its dicts interned like the lists. Rows are
+materialized as ordinary result dicts on access, so the store drops in wherever a list of
+results was used.
+"""
+
+import logging
+import marshal
+import os
+import sys
+from array import array
+from collections.abc import MutableSequence
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Row flags
+FLAG_PENDING = 1  # Placeholder until the analysis finishes
+FLAG_SUCCESS = 2
+FLAG_MANUAL_REVIEW = 4
+
+# Keys stored in dedicated columns; all others go to the packed extras
+_COLUMN_KEYS = frozenset(
+    (
+        "image_path",
+        "pending",
+        "success",
+        "confidence",
+        "categories",
+        "issues",
+        "manual_review",
+    )
+)
+_FLAG_KEYS = (("success", FLAG_SUCCESS), ("manual_review", FLAG_MANUAL_REVIEW))
+
+
+class CompactResults(MutableSequence):
+    """
+    Struct-of-arrays result list
+
+    A row costs a confidence, a flag byte, two interned-list ids, a shared
+    path reference and its packed extras (the fields without a column).
+    Reads build a fresh dict, so changes must be stored back with
+    results[row] = result to stick (as with LazyResults). Only appending is
+    supported.
+    """
+
+    def __init__(self, results: Iterable[Dict[str, Any]] = ()):
+        """
+        Initialize compact result list
+
+        Args:
+            results: Initial results
+        """
+        self._paths: List[Path] = []
+        self._confidences = array("d")
+        self._flags = bytearray()
+        self._categories = array("I")
+        self._issues = array("I")
+        self._extras: List[Optional[bytes]] = []
+
+        # Interned string tuples (lists and dict key sets), shared by all rows
+        # and by selections
+        self._tuples: List[Tuple[str, ...]] = [()]
+        self._tuple_ids: Dict[Tuple[str, ...], int] = {(): 0}
+
+        for result in results:
+            self.append(result)
+
+    @classmethod
+    def pending(cls, image_paths: Sequence[Path]) -> "CompactResults":
+        """Placeholder rows for images about to be analyzed"""
+        results = cls()
+        count = len(image_paths)
+        results._paths = list(image_paths)
+        results._confidences = array("d", bytes(8 * count))
+        results._flags = bytearray([FLAG_PENDING]) * count
+        results._categories = array("I", bytes(4 * count))
+        results._issues = array("I", bytes(4 * count))
+        results._extras = [None] * count
+        return results
+
+    @property
+    def paths(self) -> List[Path]:
+        """Image path of every row (the store's own list; don't modify it)"""
+        return self._paths
+
+    def _intern(self, values: Optional[Iterable[Any]]) -> int:
+        """Id of an interned tuple of strings"""
+        key = tuple(sys.intern(str(value)) for value in values or ())
+        tuple_id = self._tuple_ids.get(key)
+        if tuple_id is None:
+            tuple_id = len(self._tuples)
+            self._tuples.append(key)
+            self._tuple_ids[key] = tuple_id
+        return tuple_id
+
+    def _freeze(self, value: Any) -> Any:
+        """
+        Marshal-ready copy of a value: dicts become (key set id, *values)
+
+        Lists and tuples become lists and unknown types strings, as they
+        would in the JSON result files.
+        """
+        if isinstance(value, dict):
+            return (self._intern(value.keys()), *map(self._freeze, value.values()))
+        if isinstance(value, (list, tuple)):
+            return [self._freeze(item) for item in value]
+        if value is None or isinstance(value, bool):
+            return value
+        if isinstance(value, int):
+            return int(value)
+        if isinstance(value, float):
+            return float(value)
+        return str(value)
+
+    def _thaw(self, value: Any) -> Any:
+        """Rebuild a value frozen by _freeze"""
+        if isinstance(value, tuple):
+            return dict(zip(self._tuples[value[0]], map(self._thaw, value[1:])))
+        if isinstance(value, list):
+            return [self._thaw(item) for item in value]
+        return value
+
+    def _pack(self, result: Dict[str, Any]) -> tuple:
+        """Column values of a result"""
+        image_path = result["image_path"]
+        if not isinstance(image_path, Path):
+            image_path = Path(image_path)
+
+        if result.get("pending", False):
+            flags = FLAG_PENDING
+        else:
+            flags = 0
+            for key, flag in _FLAG_KEYS:
+                if result.get(key, False):
+                    flags |= flag
+
+        extras = {
+            key: value for key, value in result.items() if key not in _COLUMN_KEYS
+        }
+        return (
+            image_path,
+            float(result.get("confidence", 0.0)),
+            flags,
+            self._intern(result.get("categories")),
+            self._intern(result.get("issues")),
+            marshal.dumps(self._freeze(extras)) if extras else None,
+        )
+
+    def _row(self, row: int) -> int:
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError(row)
+        return row
+
+    def __len__(self) -> int:
+        return len(self._flags)
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self[i] for i in range(*row.indices(len(self)))]
+        row = self._row(row)
+
+        flags = self._flags[row]
+        result: Dict[str, Any] = {"image_path": self._paths[row]}
+        if flags & FLAG_PENDING:
+            result["pending"] = True
+            result["confidence"] = self._confidences[row]
+            return result
+
+        result["success"] = bool(flags & FLAG_SUCCESS)
+        result["confidence"] = self._confidences[row]
+        result["categories"] = list(self._tuples[self._categories[row]])
+        result["issues"] = list(self._tuples[self._issues[row]])
+        if flags & FLAG_MANUAL_REVIEW:
+            result["manual_review"] = True
+        extras = self._extras[row]
+        if extras is not None:
+            result.update(self._thaw(marshal.loads(extras)))
+        return result
+
+    def __setitem__(self, row: int, result: Dict[str, Any]):
+        row = self._row(row)
+        (
+            self._paths[row],
+            self._confidences[row],
+            self._flags[row],
+            self._categories[row],
+            self._issues[row],
+            self._extras[row],
+        ) = self._pack(result)
+
+    def __delitem__(self, row: int):
+        raise TypeError("CompactResults rows can't be deleted; use select() instead")
+
+    def insert(self, row: int, result: Dict[str, Any]):
+        if row != len(self):
+            raise TypeError("CompactResults only supports appending")
+        path, confidence, flags, categories, issues, extras = self._pack(result)
+        self._paths.append(path)
+        self._confidences.append(confidence)
+        self._flags.append(flags)
+        self._categories.append(categories)
+        self._issues.append(issues)
+        self._extras.append(extras)
+
+    def state(self, row: int) -> Tuple[bool, float]:
+        """(pending, confidence) of a row, without building its result"""
+        row = self._row(row)
+        return bool(self._flags[row] & FLAG_PENDING), self._confidences[row]
+
+    def confidences(self) -> Dict[int, float]:
+        """Confidence of every analyzed row"""
+        flags = self._flags
+        return {
+            row: confidence
+            for row, confidence in enumerate(self._confidences)
+            if not flags[row] & FLAG_PENDING
+        }
+
+    def select(self, rows: Iterable[int]) -> "CompactResults":
+        """New result list of the given rows, in the given order"""
+        rows = [self._row(row) for row in rows]
+        selected = CompactResults()
+        selected._tuples = self._tuples
+        selected._tuple_ids = self._tuple_ids
+        selected._paths = [self._paths[row] for row in rows]
+        selected._confidences = array("d", (self._confidences[row] for row in rows))
+        selected._flags = bytearray(self._flags[row] for row in rows)
+        selected._categories = array("I", (self._categories[row] for row in rows))
+        selected._issues = array("I", (self._issues[row] for row in rows))
+        selected._extras = [self._extras[row] for row in rows]
+        return selected
+
+
+def select_results(
+    results: Sequence[Dict[str, Any]], rows: Iterable[int]
+) -> CompactResults:
+    """Compact copy of some rows of any result list"""
+    if isinstance(results, CompactResults):
+        return results.select(rows)
+    return CompactResults(results[row] for row in rows)
+
+
+def _rss_bytes() -> int:
+    """Current resident set size of this process"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+
+        # Peak rather than current outside Linux; still fine for one build
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def synthetic_result(image_path: Path, index: int) -> Dict[str, Any]:
+    """Result shaped like the pipeline's, with a full technical profile"""
+    from technical_profile import TechnicalProfile
+
+    width, height = 16 << (index % 5), 16 << (index % 4)
+    profile = TechnicalProfile(
+        image_path=str(image_path),
+        readable=True,
+        decoded=True,
+        file_size=200 + index % 5000,
+        width=width,
+        height=height,
+        mode="RGBA",
+        image_format="PNG",
+        has_alpha=True,
+        alpha_used=index % 3 != 0,
+        power_of_two=True,
+        grid_aligned=True,
+        pixel_scale=1 + index % 2,
+        palette_size=index % 400,
+        unbled_edge_ratio=(index % 10) / 10,
+    )
+    issues = profile.get_issues()
+    if index % 7 == 0:
+        issues.append("Sprite may need transparency cleanup")
+    return {
+        "image_path": image_path,
+        "success": True,
+        "confidence": (index % 100) / 100,
+        "categories": [("character", "environment", "ui", "effect")[index % 4]],
+        "issues": issues,
+        "metadata": {
+            "file_size": profile.file_size,
+            "file_extension": ".png",
+            "analysis_timestamp": 1700000000.0 + index,
+            "technical_profile": profile.to_dict(),
+        },
+        "processing_time": 0.25 + (index % 50) / 100,
+    }
+
+
+def measure_rss(layout: str, count: int) -> float:
+    """
+    RSS growth from holding results in one layout
+
+    Paths are created before the baseline, as the image list already
+    holds them when results arrive; so are the modules used to build them.
+
+    Args:
+        layout: "dicts" (one dict per image) or "compact" (CompactResults)
+        count: Number of results
+
+    Returns:
+        float: Megabytes of RSS added by the results
+    """
+    import gc
+
+    image_paths = [
+        Path(f"res/sprites/set_{i // 100:03d}/sprite_{i:06d}.png") for i in range(count)
+    ]
+    synthetic_result(image_paths[0], 0)  # Imports (NumPy among them) go first
+    gc.collect()
+    before = _rss_bytes()
+
+    if layout == "dicts":
+        results = [synthetic_result(path, i) for i, path in enumerate(image_paths)]
+    else:
+        results = CompactResults(
+            synthetic_result(path, i) for i, path in enumerate(image_paths)
+        )
+    gc.collect()
+    after = _rss_bytes()
+
+    assert len(results) == count
+    return (after - before) / (1024 * 1024)
+
+
+# Example usage
+def main():
+    """Measure RSS per 10k results for dict and compact layouts"""
+    import argparse
+    import subprocess
+
+    parser = argparse.ArgumentParser(description="Result store memory benchmark")
+    parser.add_argument("--count", type=int, default=10000, help="Results to hold")
+    parser.add_argument(
+        "--layout",
+        choices=["dicts", "compact"],
+        help="Measure one layout in this process (default: both, isolated)",
+    )
+    args = parser.parse_args()
+
+    if args.layout:
+        print(f"{measure_rss(args.layout, args.count):.3f}")
+        return
+
+    # A fresh interpreter per layout, so freed memory isn't reused
+    per_10k = {}
+    for layout in ("dicts", "compact"):
+        output = subprocess.run(
+            [sys.executable, __file__, "--layout", layout, "--count", str(args.count)],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        per_10k[layout] = float(output.split()[-1]) * 10000 / args.count
+        print(f"{layout:8s} {per_10k[layout]:8.2f} MB RSS per 10k images")
+
+    if per_10k["compact"] > 0:
+        print(f"Compact store is {per_10k['dicts'] / per_10k['compact']:.1f}x smaller")
+
+
+if __name__ == "__main__":
+    main()
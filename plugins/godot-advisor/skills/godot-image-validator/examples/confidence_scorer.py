@@ -7,12 +7,32 @@ results. It supports multi-aspect confidence scoring, configurable thresholds, a
 custom validation rules.
 """
 
+import bisect
+import copy
+import fnmatch
+import json
+import operator
+import pickle
+import re
+import string
+import threading
+import time
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    TimeoutError as FuturesTimeoutError,
+)
 from dataclasses import dataclass
-from typing import Dict, Any, List, Callable
+from typing import Dict, Any, List, Callable, Optional, Set, Union
 from enum import Enum
 import logging
+import os
 from pathlib import Path
 
+import numpy as np
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -27,6 +47,29 @@ class ValidationLevel(Enum):
     ERROR = "error"
 
 
+# Levels from lowest to highest confidence; score_batch returns indices into this
+LEVEL_ORDER = [
+    ValidationLevel.ERROR,
+    ValidationLevel.MANUAL_REVIEW_REQUIRED,
+    ValidationLevel.MANUAL_REVIEW_SUGGESTED,
+    ValidationLevel.AUTO_ACCEPT,
+]
+
+STATUS_COLORS = {
+    ValidationLevel.AUTO_ACCEPT: "#4CAF50",  # Green
+    ValidationLevel.MANUAL_REVIEW_SUGGESTED: "#FFC107",  # Yellow
+    ValidationLevel.MANUAL_REVIEW_REQUIRED: "#FF9800",  # Orange
+    ValidationLevel.ERROR: "#F44336",  # Red
+}
+
+ASPECTS = (
+    "content_match",
+    "quality_assessment",
+    "category_confidence",
+    "technical_analysis",
+)
+
+
 @dataclass
 class ThresholdConfig:
     """Configuration for validation thresholds"""
@@ -50,6 +93,16 @@ class ThresholdConfig:
                 "Thresholds must be in ascending order: error <= manual_required <= manual_suggested <= auto_accept <= 1.0"
             )
 
+    def level_edges(self) -> np.ndarray:
+        """Lower bounds of the non-error levels, ascending (for np.searchsorted)"""
+        return np.array(
+            [
+                self.manual_review_required,
+                self.manual_review_suggested,
+                self.auto_accept,
+            ]
+        )
+
     def to_dict(self) -> Dict[str, float]:
         """Convert to dictionary"""
         return {
@@ -80,6 +133,10 @@ class AspectWeights:
         if not abs(total - 1.0) < 0.01:  # Allow small floating point errors
             raise ValueError(f"Aspect weights must sum to 1.0, got {total}")
 
+    def as_vector(self) -> np.ndarray:
+        """Weights in ASPECTS order"""
+        return np.array([getattr(self, aspect) for aspect in ASPECTS])
+
     def to_dict(self) -> Dict[str, float]:
         """Convert to dictionary"""
         return {
@@ -103,6 +160,679 @@ class ConfidenceBreakdown:
     recommendations: List[str]
 
 
+@dataclass
+class BatchScores:
+    """Vectorized scoring results for a batch of analyses"""
+
+    confidence: np.ndarray  # float64, one per row
+    level_index: np.ndarray  # int8 indices into LEVEL_ORDER
+    colors: np.ndarray  # Hex color per row
+
+    def __len__(self) -> int:
+        return len(self.confidence)
+
+    def levels(self) -> List[ValidationLevel]:
+        """Validation level per row"""
+        return [LEVEL_ORDER[i] for i in self.level_index]
+
+    def counts(self) -> Dict[ValidationLevel, int]:
+        """Number of rows per validation level"""
+        counts = np.bincount(self.level_index, minlength=len(LEVEL_ORDER))
+        return {level: int(count) for level, count in zip(LEVEL_ORDER, counts)}
+
+
+@dataclass
+class ImageHeader:
+    """Image properties available without decoding pixel data"""
+
+    width: int
+    height: int
+    mode: str
+    image_format: str = ""
+
+
+class ImageContext:
+    """
+    Per-image data shared by all custom rules
+
+    Every field is computed on first access and memoized, so N rules cost one
+    header parse, one stat() and at most one decode per image. Failures are
+    memoized too and re-raised to each rule that asks.
+    """
+
+    def __init__(self, image_path: Path, header: Optional[ImageHeader] = None):
+        """
+        Initialize image context
+
+        Args:
+            image_path: Path to the image file
+            header: Already known header info (skips the header parse)
+        """
+        self.path = Path(image_path)
+        self._header = header
+        self._stat = None
+        self._image = None
+        self._pixels = None
+        self._histogram = None
+        self._errors: Dict[str, Exception] = {}
+        # Concurrent rules wait for one decode instead of decoding twice
+        self._lock = threading.RLock()
+        # Concurrent rules still running; release() waits for the last one
+        self._holds = 0
+        self._release_pending = False
+        self._hold_lock = threading.Lock()
+
+    def _memoized(self, name: str, compute: Callable):
+        """Return a memoized field, computing it (or re-raising its error) once"""
+        value = getattr(self, f"_{name}")
+        if value is not None:
+            return value
+
+        with self._lock:
+            value = getattr(self, f"_{name}")
+            if value is not None:
+                return value
+            if name in self._errors:
+                raise self._errors[name]
+
+            try:
+                value = compute()
+            except Exception as e:
+                self._errors[name] = e
+                raise
+
+            setattr(self, f"_{name}", value)
+            return value
+
+    @property
+    def stat(self) -> os.stat_result:
+        """File stat"""
+        return self._memoized("stat", self.path.stat)
+
+    @property
+    def file_size(self) -> int:
+        """File size in bytes"""
+        return self.stat.st_size
+
+    @property
+    def header(self) -> ImageHeader:
+        """Header info (size, mode, format) without decoding pixels"""
+
+        def read_header() -> ImageHeader:
+            if self._image is not None:
+                image = self._image
+                return ImageHeader(*image.size, image.mode, image.format or "")
+
+            from PIL import Image
+
+            with Image.open(self.path) as img:
+                return ImageHeader(*img.size, img.mode, img.format or "")
+
+        return self._memoized("header", read_header)
+
+    @property
+    def size(self):
+        """Image dimensions as (width, height)"""
+        return self.header.width, self.header.height
+
+    @property
+    def image(self):
+        """Decoded PIL image"""
+
+        def decode():
+            from PIL import Image
+
+            with Image.open(self.path) as img:
+                img.load()
+                return img.copy()
+
+        return self._memoized("image", decode)
+
+    @property
+    def pixels(self):
+        """Decoded pixels as a NumPy array"""
+        return self._memoized("pixels", lambda: np.asarray(self.image))
+
+    @property
+    def histogram(self) -> List[int]:
+        """Per-band pixel histogram"""
+        return self._memoized("histogram", lambda: self.image.histogram())
+
+    def hold(self):
+        """Keep the context alive for a concurrent rule until it calls drop()"""
+        with self._hold_lock:
+            self._holds += 1
+
+    def drop(self):
+        """End a hold, carrying out a release() deferred while it was held"""
+        with self._hold_lock:
+            self._holds -= 1
+            release = self._holds == 0 and self._release_pending
+        if release:
+            self.release()
+
+    def release(self):
+        """
+        Drop decoded pixel data, keeping the cheap header and stat
+
+        Deferred while a concurrent rule (one that timed out, say) still
+        holds the context, so it never sees its data vanish mid-use.
+        """
+        with self._hold_lock:
+            self._release_pending = self._holds > 0
+            if self._release_pending:
+                return
+        with self._lock:
+            self._image = None
+            self._pixels = None
+            self._histogram = None
+
+    def __enter__(self) -> "ImageContext":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+
+def context_rule(rule_func: Callable) -> Callable:
+    """
+    Mark a custom rule as taking an ImageContext instead of a path
+
+    Context rules are called as rule_func(context, analysis_result) and share
+    the context's memoized header, stat and pixel data with the other rules.
+    """
+    rule_func.uses_image_context = True
+    return rule_func
+
+
+# How a custom rule runs: inline in the calling thread, on the I/O thread
+# pool, or (for pure, picklable rules) on the process pool
+RULE_KINDS = ("inline", "io", "pure")
+
+
+def rule_execution(kind: str = "inline", timeout: Optional[float] = None) -> Callable:
+    """
+    Declare how a custom rule may be executed
+
+    "io" rules run concurrently on a thread pool and may take an ImageContext.
+    "pure" rules must be picklable top-level functions without side effects;
+    they run on a process pool and always receive the image path. Concurrent
+    rules are abandoned after their timeout (the scorer's rule_timeout by
+    default); inline rules always run to completion. An abandoned rule that
+    is still running keeps its worker (and ImageContext) until it returns,
+    and is logged once; later rules get a fresh pool, and rules of a kind are
+    skipped while rule_workers of them hang.
+
+    Args:
+        kind: One of RULE_KINDS
+        timeout: Per-rule deadline in seconds
+    """
+    if kind not in RULE_KINDS:
+        raise ValueError(f"kind must be one of {RULE_KINDS}")
+
+    def decorator(rule_func: Callable) -> Callable:
+        rule_func.rule_kind = kind
+        rule_func.rule_timeout = timeout
+        return rule_func
+
+    return decorator
+
+
+def _timed_rule_call(rule_func: Callable, *args) -> tuple:
+    """Run a rule and measure it where it runs (top-level for worker processes)"""
+    start_time = time.perf_counter()
+    result = rule_func(*args)
+    return result, time.perf_counter() - start_time
+
+
+def _is_rule_hit(rule_result: Any) -> bool:
+    """Check if a rule result changes anything"""
+    return isinstance(rule_result, dict) and bool(
+        rule_result.get("confidence_adjustment")
+        or rule_result.get("issues")
+        or "categories" in rule_result
+    )
+
+
+@dataclass
+class RuleStats:
+    """Execution statistics of one custom rule"""
+
+    calls: int = 0
+    hits: int = 0  # Calls that adjusted confidence, issues or categories
+    errors: int = 0
+    timeouts: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+    def record(self, elapsed: float, hit: bool):
+        """Record a completed call"""
+        self.calls += 1
+        self.hits += int(hit)
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for display or JSON serialization"""
+        completed = self.calls - self.errors - self.timeouts
+        return {
+            "calls": self.calls,
+            "hits": self.hits,
+            "hit_rate": self.hits / self.calls if self.calls else 0.0,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "mean_time": self.total_time / completed if completed > 0 else 0.0,
+            "max_time": self.max_time,
+        }
+
+
+# Image properties declarative rules can test, looked up through an ImageContext
+RULE_PROPERTIES: Dict[str, Callable[[ImageContext], Any]] = {
+    "width": lambda c: c.size[0],
+    "height": lambda c: c.size[1],
+    "min_dimension": lambda c: min(c.size),
+    "max_dimension": lambda c: max(c.size),
+    "aspect_ratio": lambda c: c.size[0] / c.size[1] if c.size[1] else 0.0,
+    "mode": lambda c: c.header.mode,
+    "format": lambda c: c.header.image_format,
+    "has_alpha": lambda c: c.header.mode in ("RGBA", "LA", "PA"),
+    "file_size": lambda c: c.file_size,
+    "file_size_mb": lambda c: c.file_size / (1024 * 1024),
+    "extension": lambda c: c.path.suffix.lower(),
+    "name": lambda c: c.path.name,
+}
+
+# Comparison operators available in rule conditions
+RULE_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "in": lambda a, b: a in b,
+    "not_in": lambda a, b: a not in b,
+    "multiple_of": lambda a, b: a % b == 0,
+    "not_multiple_of": lambda a, b: a % b != 0,
+}
+
+# Top-level keys of a declarative rule specification
+RULE_SPEC_KEYS = frozenset(
+    ("name", "paths", "categories", "match", "conditions", "then", "otherwise")
+)
+
+
+class PropertyLookup(dict):
+    """
+    Property values of one image, computed on first use
+
+    One lookup is shared by every declarative rule evaluated for the image,
+    so a property is read once however many rules test it. It doubles as the
+    mapping for formatting issue messages like "{width}x{height}".
+    """
+
+    def __init__(self, context: ImageContext):
+        super().__init__()
+        self.context = context
+
+    def __missing__(self, name: str) -> Any:
+        value = RULE_PROPERTIES[name](self.context)
+        self[name] = value
+        return value
+
+
+@dataclass
+class CompiledRule:
+    """A declarative rule with its conditions resolved to callables"""
+
+    name: str
+    spec: Dict[str, Any]
+    path_pattern: Optional[re.Pattern]
+    categories: frozenset
+    conditions: List[tuple]  # (property, operator function, value)
+    match_all: bool
+    then: Dict[str, Any]
+    otherwise: Dict[str, Any]
+
+    def evaluate(self, lookup: PropertyLookup) -> Dict[str, Any]:
+        """
+        Evaluate the rule's conditions against an image
+
+        Returns:
+            Dict[str, Any]: Adjustments in the same form custom rules return
+        """
+        outcomes = (
+            compare(lookup[prop], value) for prop, compare, value in self.conditions
+        )
+        if not self.conditions:
+            matched = True
+        else:
+            matched = all(outcomes) if self.match_all else any(outcomes)
+        adjustments = self.then if matched else self.otherwise
+
+        result = dict(adjustments)
+        if "issues" in result:
+            result["issues"] = [issue.format_map(lookup) for issue in result["issues"]]
+        return result
+
+
+def _check_issue_template(name: str, issue: str):
+    """Reject issue messages with placeholders that aren't rule properties"""
+    try:
+        fields = [field for _, field, _, _ in string.Formatter().parse(issue)]
+    except ValueError as e:
+        raise ValueError(f"Rule {name}: malformed issue {issue!r}: {e}")
+
+    for field in fields:
+        if field is None:
+            continue
+        prop = re.split(r"[.\[]", field, maxsplit=1)[0]
+        if prop not in RULE_PROPERTIES:
+            raise ValueError(
+                f"Rule {name}: unknown property {prop!r} in issue {issue!r}"
+            )
+
+
+def compile_rule(spec: Dict[str, Any]) -> CompiledRule:
+    """
+    Compile a declarative rule specification
+
+    A rule looks like this (YAML or JSON)::
+
+        name: pixel_art_grid
+        paths: ["*/sprites/*"]          # optional shell globs on the full path
+        categories: [animations]        # optional, any of the result categories
+        match: all                      # all (default) or any condition
+        conditions:
+          - {property: width, op: not_multiple_of, value: 4}
+          - {property: height, op: not_multiple_of, value: 4}
+        then:
+          confidence_adjustment: -0.2
+          issues: ["Dimensions {width}x{height} not divisible by 4"]
+        otherwise:
+          confidence_adjustment: 0.1
+
+    A rule without conditions always applies its "then" adjustments.
+
+    Args:
+        spec: Rule specification
+
+    Returns:
+        CompiledRule: Rule ready for evaluation
+
+    Raises:
+        ValueError: If the specification is invalid
+    """
+    name = spec.get("name")
+    if not name:
+        raise ValueError("Declarative rule needs a name")
+
+    # A misspelled "conditions" would otherwise make the rule always apply
+    unknown = set(spec) - RULE_SPEC_KEYS
+    if unknown:
+        raise ValueError(f"Rule {name}: unknown keys {sorted(unknown)}")
+
+    match = spec.get("match", "all")
+    if match not in ("all", "any"):
+        raise ValueError(f"Rule {name}: match must be 'all' or 'any'")
+
+    conditions = []
+    for condition in spec.get("conditions", []):
+        prop = condition.get("property")
+        op = condition.get("op", "eq")
+        if prop not in RULE_PROPERTIES:
+            raise ValueError(f"Rule {name}: unknown property {prop!r}")
+        if op not in RULE_OPERATORS:
+            raise ValueError(f"Rule {name}: unknown operator {op!r}")
+        if "value" not in condition:
+            raise ValueError(f"Rule {name}: condition on {prop} needs a value")
+        conditions.append((prop, RULE_OPERATORS[op], condition["value"]))
+
+    then = spec.get("then", {})
+    otherwise = spec.get("otherwise", {})
+    for adjustments in (then, otherwise):
+        unknown = set(adjustments) - {"confidence_adjustment", "issues", "categories"}
+        if unknown:
+            raise ValueError(f"Rule {name}: unknown adjustments {sorted(unknown)}")
+        for issue in adjustments.get("issues", []):
+            _check_issue_template(name, issue)
+
+    paths = spec.get("paths", [])
+    if isinstance(paths, str):
+        paths = [paths]
+    path_pattern = (
+        re.compile("|".join(fnmatch.translate(p) for p in paths)) if paths else None
+    )
+
+    return CompiledRule(
+        name=name,
+        spec=spec,
+        path_pattern=path_pattern,
+        categories=frozenset(spec.get("categories", [])),
+        conditions=conditions,
+        match_all=match == "all",
+        then=then,
+        otherwise=otherwise,
+    )
+
+
+class RuleTable:
+    """
+    Decision table of compiled declarative rules
+
+    Rules are indexed by category, so an image only visits rules whose
+    category precondition it satisfies; the path glob is checked next and
+    the property conditions last, through one shared PropertyLookup.
+    """
+
+    def __init__(self, specs: List[Dict[str, Any]] = None):
+        self.rules: List[CompiledRule] = []
+        self._by_category: Dict[str, List[int]] = {}
+        self._any_category: List[int] = []
+        for spec in specs or []:
+            self.add(spec)
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def add(self, spec: Dict[str, Any]):
+        """Compile and add a rule, replacing any rule with the same name"""
+        rule = compile_rule(spec)
+        specs = [r.spec for r in self.rules if r.name != rule.name]
+        if len(specs) != len(self.rules):
+            self._reindex(specs)
+
+        slot = len(self.rules)
+        self.rules.append(rule)
+        if rule.categories:
+            for category in rule.categories:
+                self._by_category.setdefault(category, []).append(slot)
+        else:
+            self._any_category.append(slot)
+
+    def remove(self, name: str) -> bool:
+        """Remove a rule by name; returns True if it existed"""
+        specs = [r.spec for r in self.rules if r.name != name]
+        if len(specs) == len(self.rules):
+            return False
+        self._reindex(specs)
+        return True
+
+    def _reindex(self, specs: List[Dict[str, Any]]):
+        self.rules = []
+        self._by_category = {}
+        self._any_category = []
+        for spec in specs:
+            self.add(spec)
+
+    def names(self) -> List[str]:
+        """Rule names in evaluation order"""
+        return [rule.name for rule in self.rules]
+
+    def specs(self) -> List[Dict[str, Any]]:
+        """Rule specifications, as accepted by add()"""
+        return [rule.spec for rule in self.rules]
+
+    def candidates(self, image_path: Path, categories: List[str]) -> List[CompiledRule]:
+        """Rules whose category and path preconditions match an image"""
+        slots = set(self._any_category)
+        for category in categories or ():
+            slots.update(self._by_category.get(category, ()))
+
+        path = Path(image_path).as_posix()
+        return [
+            self.rules[slot]
+            for slot in sorted(slots)
+            if self.rules[slot].path_pattern is None
+            or self.rules[slot].path_pattern.match(path)
+        ]
+
+    def evaluate(
+        self, context: ImageContext, analysis_result: Dict[str, Any]
+    ) -> List[tuple]:
+        """
+        Evaluate the matching rules for one image
+
+        Returns:
+            List[tuple]: (rule name, adjustments, seconds) for every rule that ran
+        """
+        rules = self.candidates(context.path, analysis_result.get("categories", []))
+        if not rules:
+            return []
+
+        lookup = PropertyLookup(context)
+        results = []
+        for rule in rules:
+            try:
+                start_time = time.perf_counter()
+                adjustments = rule.evaluate(lookup)
+                results.append(
+                    (rule.name, adjustments, time.perf_counter() - start_time)
+                )
+            except Exception as e:
+                logger.debug(f"Rule {rule.name} skipped for {context.path}: {e}")
+        return results
+
+
+def load_rule_specs(rules_path: Path) -> List[Dict[str, Any]]:
+    """
+    Load declarative rules from a JSON or YAML file
+
+    The file holds either a list of rules or a mapping with a "rules" list.
+    YAML needs PyYAML.
+
+    Args:
+        rules_path: Path to a .json, .yaml or .yml file
+
+    Returns:
+        List[Dict[str, Any]]: Rule specifications
+    """
+    rules_path = Path(rules_path)
+    with open(rules_path, "r", encoding="utf-8") as f:
+        if rules_path.suffix.lower() in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError(
+                    "PyYAML is required for YAML rules: pip install pyyaml"
+                )
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+
+    if isinstance(data, dict):
+        data = data.get("rules", [])
+    return list(data or [])
+
+
+class TriageIndex:
+    """
+    Result indices kept sorted by confidence
+
+    Level boundaries are found with binary search, so counting a level,
+    listing results below a threshold, or finding which results change level
+    after a threshold change never needs a pass over the whole result set.
+    """
+
+    def __init__(self):
+        self._keys: List[float] = []  # Sorted confidences
+        self._order: List[int] = []  # Result index for each key
+        self._confidence: Dict[int, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, index: int) -> bool:
+        return index in self._confidence
+
+    def add(self, index: int, confidence: float):
+        """Add a result, or move it if its confidence changed"""
+        if index in self._confidence:
+            self.remove(index)
+
+        position = bisect.bisect_right(self._keys, confidence)
+        self._keys.insert(position, confidence)
+        self._order.insert(position, index)
+        self._confidence[index] = confidence
+
+    def remove(self, index: int):
+        """Remove a result"""
+        confidence = self._confidence.pop(index, None)
+        if confidence is None:
+            return
+
+        position = bisect.bisect_left(self._keys, confidence)
+        while self._order[position] != index:
+            position += 1
+        del self._keys[position]
+        del self._order[position]
+
+    def rebuild(self, confidences: Dict[int, float]):
+        """Replace the contents with a full set of results"""
+        pairs = sorted((confidence, index) for index, confidence in confidences.items())
+        self._keys = [confidence for confidence, _ in pairs]
+        self._order = [index for _, index in pairs]
+        self._confidence = dict(confidences)
+
+    def clear(self):
+        """Remove all results"""
+        self.rebuild({})
+
+    def count_below(self, threshold: float) -> int:
+        """Number of results with confidence below threshold"""
+        return bisect.bisect_left(self._keys, threshold)
+
+    def indices_below(self, threshold: float) -> List[int]:
+        """Result indices with confidence below threshold, in index order"""
+        return sorted(self._order[: self.count_below(threshold)])
+
+    def level_counts(self, thresholds: ThresholdConfig) -> Dict[ValidationLevel, int]:
+        """Number of results per validation level"""
+        positions = [0] + [self.count_below(edge) for edge in thresholds.level_edges()]
+        positions.append(len(self._keys))
+        return {
+            level: positions[i + 1] - positions[i]
+            for i, level in enumerate(LEVEL_ORDER)
+        }
+
+    def retriage(
+        self, old_thresholds: ThresholdConfig, new_thresholds: ThresholdConfig
+    ) -> Set[int]:
+        """
+        Find results whose validation level changes between two threshold sets
+
+        Only results between an old and a new level boundary can change, so
+        this costs two binary searches per boundary plus the changed results.
+        """
+        changed = set()
+        for old_edge, new_edge in zip(
+            old_thresholds.level_edges(), new_thresholds.level_edges()
+        ):
+            low, high = sorted((old_edge, new_edge))
+            changed.update(self._order[self.count_below(low) : self.count_below(high)])
+        return changed
+
+
 class ConfidenceScorer:
     """Manages confidence calculation and threshold decisions"""
 
@@ -111,6 +841,8 @@ class ConfidenceScorer:
         thresholds: ThresholdConfig = None,
         weights: AspectWeights = None,
         debug_mode: bool = False,
+        rule_timeout: float = 5.0,
+        rule_workers: int = 4,
     ):
         """
         Initialize confidence scorer
@@ -119,6 +851,11 @@ class ConfidenceScorer:
             thresholds: Configuration for validation thresholds
             weights: Configuration for aspect weightings
             debug_mode: Enable debug logging
+            rule_timeout: Default deadline in seconds for concurrent rules
+            rule_workers: Worker threads/processes for concurrent rules; a rule
+                still running after its timeout blocks its worker, so the pool
+                is replaced for later rules, and once rule_workers rules of a
+                kind hang, rules of that kind are skipped until one returns
         """
         self.thresholds = thresholds or ThresholdConfig()
         self.weights = weights or AspectWeights()
@@ -133,6 +870,14 @@ class ConfidenceScorer:
 
         # Custom rules engine
         self.custom_rules: Dict[str, Callable] = {}
+        self.rule_table = RuleTable()
+        self.rule_timeout = rule_timeout
+        self.rule_workers = rule_workers
+        self.rule_stats: Dict[str, RuleStats] = {}
+        self._rule_kinds: Dict[str, str] = {}
+        self._rule_executors: Dict[str, Executor] = {}
+        self._hung_rules: Dict[Future, tuple] = {}  # Future -> (kind, rule name)
+        self._rule_lock = threading.Lock()  # Rules may run from several threads
 
     def calculate_confidence(self, analysis_result: Dict[str, Any]) -> float:
         """
@@ -262,6 +1007,79 @@ class ConfidenceScorer:
         else:
             return ValidationLevel.ERROR
 
+    def score_batch(self, batch) -> BatchScores:
+        """
+        Score many analyses at once with vectorized operations
+
+        Args:
+            batch: Aspect scores in columnar form: a dict of arrays keyed by
+                aspect name, a NumPy structured array with aspect fields, or
+                an (N, 4) array in ASPECTS order
+
+        Returns:
+            BatchScores: Confidence, level index and color per row
+        """
+        scores = self._batch_aspect_matrix(batch)
+
+        invalid = ~np.isfinite(scores)
+        out_of_range = (scores < 0.0) | (scores > 1.0)
+        if invalid.any() or out_of_range.any():
+            logger.warning(
+                f"score_batch: {int(invalid.sum())} invalid and "
+                f"{int(out_of_range.sum())} out-of-range aspect scores"
+            )
+            scores = np.clip(np.where(invalid, 0.0, scores), 0.0, 1.0)
+
+        confidence = np.clip(scores @ self.weights.as_vector(), 0.0, 1.0)
+        return self.classify_batch(confidence)
+
+    def classify_batch(self, confidence: np.ndarray) -> BatchScores:
+        """
+        Bin already computed confidences into validation levels
+
+        This is all that needs to run again after a threshold change.
+
+        Args:
+            confidence: Overall confidence per row
+
+        Returns:
+            BatchScores: Confidence, level index and color per row
+        """
+        confidence = np.asarray(confidence, dtype=np.float64)
+        level_index = np.searchsorted(
+            self.thresholds.level_edges(), confidence, side="right"
+        ).astype(np.int8)
+        palette = np.array([self.get_status_color(level) for level in LEVEL_ORDER])
+
+        return BatchScores(
+            confidence=confidence,
+            level_index=level_index,
+            colors=palette[level_index],
+        )
+
+    def _batch_aspect_matrix(self, batch) -> np.ndarray:
+        """Convert a columnar batch into an (N, 4) float matrix"""
+        if isinstance(batch, np.ndarray) and batch.dtype.names is None:
+            matrix = np.asarray(batch, dtype=np.float64)
+            if matrix.ndim != 2 or matrix.shape[1] != len(ASPECTS):
+                raise ValueError(
+                    f"Expected an (N, {len(ASPECTS)}) array of aspect scores"
+                )
+            return matrix
+
+        if isinstance(batch, np.ndarray):
+            names, length = batch.dtype.names, len(batch)
+        else:
+            names = batch.keys()
+            length = len(next(iter(batch.values()), ()))
+
+        # Missing aspects score 0.0, as in calculate_confidence
+        matrix = np.zeros((length, len(ASPECTS)))
+        for column, aspect in enumerate(ASPECTS):
+            if aspect in names:
+                matrix[:, column] = batch[aspect]
+        return matrix
+
     def should_require_manual_review(self, confidence: float) -> bool:
         """
         Check if manual review is required for given confidence
@@ -284,22 +1102,18 @@ class ConfidenceScorer:
         Returns:
             str: Hex color code
         """
-        color_map = {
-            ValidationLevel.AUTO_ACCEPT: "#4CAF50",  # Green
-            ValidationLevel.MANUAL_REVIEW_SUGGESTED: "#FFC107",  # Yellow
-            ValidationLevel.MANUAL_REVIEW_REQUIRED: "#FF9800",  # Orange
-            ValidationLevel.ERROR: "#F44336",  # Red
-        }
-        return color_map.get(validation_level, "#9E9E9E")  # Gray default
+        return STATUS_COLORS.get(validation_level, "#9E9E9E")  # Gray default
 
     def apply_custom_rules(
-        self, image_path: Path, analysis_result: Dict[str, Any]
+        self,
+        image_path: Union[Path, ImageContext],
+        analysis_result: Dict[str, Any],
     ) -> Dict[str, Any]:
         """
         Apply custom validation rules to adjust confidence
 
         Args:
-            image_path: Path to the image file
+            image_path: Path to the image file, or an ImageContext to share
             analysis_result: Original analysis result
 
         Returns:
@@ -307,37 +1121,139 @@ class ConfidenceScorer:
         """
         modified_result = analysis_result.copy()
 
+        if isinstance(image_path, ImageContext):
+            context, owns_context = image_path, False
+        else:
+            context, owns_context = ImageContext(image_path), True
+
+        # Held until the rules return, should the caller release it meanwhile
+        context.hold()
+        try:
+            self._run_custom_rules(context, analysis_result, modified_result)
+        finally:
+            context.drop()
+            if owns_context:
+                context.release()
+
+        return modified_result
+
+    def _run_custom_rules(
+        self,
+        context: ImageContext,
+        analysis_result: Dict[str, Any],
+        modified_result: Dict[str, Any],
+    ):
+        """Run every custom rule against one shared image context"""
+        # Start concurrent rules first so they overlap with the inline ones
+        pending = {}
         for rule_name, rule_func in self.custom_rules.items():
+            kind = self._rule_kinds.get(rule_name, "inline")
+            if kind == "inline":
+                continue
+
+            if kind == "pure":
+                args = (str(context.path), analysis_result)
+            elif getattr(rule_func, "uses_image_context", False):
+                args = (context, analysis_result)
+            else:
+                args = (context.path, analysis_result)
+
+            timeout = getattr(rule_func, "rule_timeout", None) or self.rule_timeout
+            future = self._submit_rule(kind, rule_name, rule_func, args)
+            if future is None:
+                continue
+            if args[0] is context:
+                context.hold()
+                future.add_done_callback(lambda _: context.drop())
+            pending[rule_name] = (future, kind, time.perf_counter() + timeout)
+
+        outcomes = {}
+        for rule_name, rule_func in self.custom_rules.items():
+            if self._rule_kinds.get(rule_name, "inline") != "inline":
+                continue
             try:
                 if self.debug_mode:
                     logger.debug(f"Applying custom rule: {rule_name}")
 
-                rule_result = rule_func(image_path, analysis_result)
+                if getattr(rule_func, "uses_image_context", False):
+                    outcomes[rule_name] = _timed_rule_call(
+                        rule_func, context, analysis_result
+                    )
+                else:
+                    outcomes[rule_name] = _timed_rule_call(
+                        rule_func, context.path, analysis_result
+                    )
+            except Exception as e:
+                stats = self._get_rule_stats(rule_name)
+                stats.calls += 1
+                stats.errors += 1
+                logger.error(f"Custom rule {rule_name} failed: {e}")
 
-                # Apply rule adjustments
-                if isinstance(rule_result, dict):
-                    if "confidence_adjustment" in rule_result:
-                        current_confidence = modified_result.get("confidence", 0.0)
-                        adjustment = rule_result["confidence_adjustment"]
-                        modified_result["confidence"] = max(
-                            0.0, min(1.0, current_confidence + adjustment)
-                        )
+        for rule_name, (future, kind, deadline) in pending.items():
+            try:
+                outcomes[rule_name] = future.result(
+                    timeout=max(0.0, deadline - time.perf_counter())
+                )
+            except FuturesTimeoutError:
+                stats = self._get_rule_stats(rule_name)
+                stats.calls += 1
+                stats.timeouts += 1
+                if future.cancel():
+                    logger.warning(
+                        f"Custom rule {rule_name} timed out waiting for a worker "
+                        f"on {context.path}"
+                    )
+                else:
+                    # A running rule can't be interrupted; its result is ignored
+                    self._retire_hung_rule(kind, rule_name, future, context.path)
+            except Exception as e:
+                stats = self._get_rule_stats(rule_name)
+                stats.calls += 1
+                stats.errors += 1
+                logger.error(f"Custom rule {rule_name} failed: {e}")
 
-                    if "issues" in rule_result:
-                        if "issues" not in modified_result:
-                            modified_result["issues"] = []
-                        modified_result["issues"].extend(rule_result["issues"])
+        # Apply in registration order so clamping is deterministic
+        for rule_name in self.custom_rules:
+            if rule_name not in outcomes:
+                continue
+            rule_result, elapsed = outcomes[rule_name]
+            self._get_rule_stats(rule_name).record(elapsed, _is_rule_hit(rule_result))
+            self._apply_rule_result(modified_result, rule_result)
 
-                    if "categories" in rule_result:
-                        modified_result["categories"] = rule_result["categories"]
+            if self.debug_mode:
+                logger.debug(f"Rule {rule_name} result: {rule_result}")
 
-                if self.debug_mode:
-                    logger.debug(f"Rule {rule_name} result: {rule_result}")
+        for rule_name, rule_result, elapsed in self.rule_table.evaluate(
+            context, analysis_result
+        ):
+            self._get_rule_stats(rule_name).record(elapsed, _is_rule_hit(rule_result))
+            self._apply_rule_result(modified_result, rule_result)
 
-            except Exception as e:
-                logger.error(f"Custom rule {rule_name} failed: {e}")
+            if self.debug_mode:
+                logger.debug(f"Rule {rule_name} result: {rule_result}")
 
-        return modified_result
+    def _apply_rule_result(
+        self, modified_result: Dict[str, Any], rule_result: Dict[str, Any]
+    ):
+        """Apply one rule's adjustments to the analysis result"""
+        if not isinstance(rule_result, dict):
+            return
+
+        if "confidence_adjustment" in rule_result:
+            current_confidence = modified_result.get("confidence", 0.0)
+            adjustment = rule_result["confidence_adjustment"]
+            modified_result["confidence"] = max(
+                0.0, min(1.0, current_confidence + adjustment)
+            )
+
+        if "issues" in rule_result:
+            # Copy so the caller's issue list isn't extended in place
+            modified_result["issues"] = (
+                list(modified_result.get("issues", [])) + rule_result["issues"]
+            )
+
+        if "categories" in rule_result:
+            modified_result["categories"] = rule_result["categories"]
 
     def add_custom_rule(self, name: str, rule_func: Callable):
         """
@@ -345,11 +1261,129 @@ class ConfidenceScorer:
 
         Args:
             name: Rule name/identifier
-            rule_func: Function that takes (image_path, analysis_result) and returns modifications
+            rule_func: Function that takes (image_path, analysis_result) and returns
+                modifications; rules marked with @context_rule take an ImageContext,
+                and @rule_execution declares how the rule may run
         """
+        kind = getattr(rule_func, "rule_kind", "inline")
+        if kind == "pure":
+            try:
+                pickle.dumps(rule_func)
+            except Exception:
+                logger.warning(
+                    f"Pure rule {name} can't be sent to a worker process, "
+                    "running it on the I/O thread pool"
+                )
+                kind = "io"
+
         self.custom_rules[name] = rule_func
+        self._rule_kinds[name] = kind
+        self.rule_stats.pop(name, None)
         logger.info(f"Added custom rule: {name}")
 
+    def _submit_rule(
+        self, kind: str, rule_name: str, rule_func: Callable, args: tuple
+    ) -> Optional[Future]:
+        """Start a concurrent rule, or None while too many of its kind hang"""
+        with self._rule_lock:
+            hung = sum(1 for k, _ in self._hung_rules.values() if k == kind)
+            if hung < self.rule_workers:
+                return self._get_rule_executor(kind).submit(
+                    _timed_rule_call, rule_func, *args
+                )
+
+        stats = self._get_rule_stats(rule_name)
+        stats.calls += 1
+        stats.timeouts += 1
+        logger.debug(f"Skipping custom rule {rule_name}: {hung} {kind} rules hang")
+        return None
+
+    def _retire_hung_rule(
+        self, kind: str, rule_name: str, future: Future, image_path: Path
+    ):
+        """Keep a timed-out, still running rule from blocking later rules"""
+        with self._rule_lock:
+            self._hung_rules[future] = (kind, rule_name)
+            hung = sum(1 for k, _ in self._hung_rules.values() if k == kind)
+            # Its worker stays blocked; later rules get a fresh pool
+            executor = self._rule_executors.pop(kind, None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+        logger.warning(
+            f"Custom rule {rule_name} timed out on {image_path} and is still "
+            f"running ({hung} of at most {self.rule_workers} hung {kind} rules; "
+            "rules of this kind are skipped at the limit)"
+        )
+        future.add_done_callback(self._hung_rule_returned)
+
+    def _hung_rule_returned(self, future: Future):
+        """Forget a hung rule once it finally returns"""
+        with self._rule_lock:
+            kind, rule_name = self._hung_rules.pop(future, (None, None))
+        if rule_name is not None:
+            logger.info(f"Hung custom rule {rule_name} returned")
+
+    def _get_rule_executor(self, kind: str) -> Executor:
+        """Get (creating on first use) the pool for a rule kind"""
+        executor = self._rule_executors.get(kind)
+        if executor is None:
+            if kind == "pure":
+                executor = ProcessPoolExecutor(max_workers=self.rule_workers)
+            else:
+                executor = ThreadPoolExecutor(
+                    max_workers=self.rule_workers, thread_name_prefix="custom-rule"
+                )
+            self._rule_executors[kind] = executor
+        return executor
+
+    def _get_rule_stats(self, name: str) -> RuleStats:
+        """Get (creating on first use) the statistics of a rule"""
+        stats = self.rule_stats.get(name)
+        if stats is None:
+            stats = self.rule_stats.setdefault(name, RuleStats())
+        return stats
+
+    def shutdown(self):
+        """Stop the rule worker pools, dropping queued rule calls"""
+        with self._rule_lock:
+            executors = list(self._rule_executors.values())
+            self._rule_executors.clear()
+        for executor in executors:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def add_declarative_rule(self, spec: Dict[str, Any]):
+        """
+        Add a declarative validation rule
+
+        Unlike callable rules, declarative rules are exported with the
+        configuration. See compile_rule for the format.
+
+        Args:
+            spec: Rule specification
+
+        Raises:
+            ValueError: If the specification is invalid
+        """
+        self.rule_table.add(spec)
+        logger.info(f"Added declarative rule: {spec['name']}")
+
+    def load_rules(self, rules_path: Path) -> int:
+        """
+        Add declarative rules from a JSON or YAML file
+
+        Args:
+            rules_path: Path to the rules file
+
+        Returns:
+            int: Number of rules loaded
+        """
+        specs = load_rule_specs(rules_path)
+        for spec in specs:
+            self.rule_table.add(spec)
+        logger.info(f"Loaded {len(specs)} declarative rules from {rules_path}")
+        return len(specs)
+
     def remove_custom_rule(self, name: str):
         """
         Remove a custom validation rule
@@ -359,16 +1393,41 @@ class ConfidenceScorer:
         """
         if name in self.custom_rules:
             del self.custom_rules[name]
+            del self._rule_kinds[name]
             logger.info(f"Removed custom rule: {name}")
+        elif self.rule_table.remove(name):
+            logger.info(f"Removed declarative rule: {name}")
+        self.rule_stats.pop(name, None)
 
-    def get_custom_rules(self) -> List[str]:
+    def get_custom_rules(
+        self, include_stats: bool = False
+    ) -> Union[List[str], Dict[str, Dict[str, Any]]]:
         """
         Get list of custom rule names
 
+        Args:
+            include_stats: Return execution kind and statistics per rule
+
         Returns:
-            List[str]: List of custom rule names
+            Union[List[str], Dict[str, Dict[str, Any]]]: Callable rule names
+            followed by declarative rule names, or a mapping of rule name to
+            kind, latency, hit and timeout statistics
         """
-        return list(self.custom_rules.keys())
+        names = list(self.custom_rules.keys()) + self.rule_table.names()
+        if not include_stats:
+            return names
+
+        return {
+            name: {
+                "kind": self._rule_kinds.get(name, "declarative"),
+                **self.rule_stats.get(name, RuleStats()).to_dict(),
+            }
+            for name in names
+        }
+
+    def reset_rule_statistics(self):
+        """Reset per-rule execution statistics"""
+        self.rule_stats.clear()
 
     def _extract_aspect_score(
         self, analysis_result: Dict[str, Any], aspect: str
@@ -473,6 +1532,7 @@ class ConfidenceScorer:
             "thresholds": self.thresholds.to_dict(),
             "weights": self.weights.to_dict(),
             "custom_rules": self.get_custom_rules(),
+            "rules": copy.deepcopy(self.rule_table.specs()),
         }
 
     def import_config(self, config: Dict[str, Any]):
@@ -490,6 +1550,10 @@ class ConfidenceScorer:
             self.weights = AspectWeights(**config["weights"])
             self.weights.validate()
 
+        if "rules" in config:
+            # Compile into a fresh table so an invalid rule leaves the old set
+            self.rule_table = RuleTable(copy.deepcopy(config["rules"]))
+
         logger.info("Configuration imported successfully")
 
 
@@ -497,14 +1561,12 @@ class ConfidenceScorer:
 def create_pixel_art_rule(min_size_multiple: int = 4) -> Callable:
     """Create rule for pixel art validation"""
 
+    @context_rule
     def validate_pixel_art(
-        image_path: Path, analysis_result: Dict[str, Any]
+        context: ImageContext, analysis_result: Dict[str, Any]
     ) -> Dict[str, Any]:
         try:
-            from PIL import Image
-
-            with Image.open(image_path) as img:
-                width, height = img.size
+            width, height = context.size
 
             # Pixel art should have dimensions divisible by specified value
             if width % min_size_multiple != 0 or height % min_size_multiple != 0:
@@ -528,14 +1590,12 @@ def create_pixel_art_rule(min_size_multiple: int = 4) -> Callable:
 def create_hd_asset_rule(min_resolution: int = 1024) -> Callable:
     """Create rule for HD asset validation"""
 
+    @context_rule
     def validate_hd_asset(
-        image_path: Path, analysis_result: Dict[str, Any]
+        context: ImageContext, analysis_result: Dict[str, Any]
     ) -> Dict[str, Any]:
         try:
-            from PIL import Image
-
-            with Image.open(image_path) as img:
-                width, height = img.size
+            width, height = context.size
 
             min_dimension = min(width, height)
 
@@ -558,11 +1618,12 @@ def create_hd_asset_rule(min_resolution: int = 1024) -> Callable:
 def create_file_size_rule(max_size_mb: int = 10) -> Callable:
     """Create rule for file size validation"""
 
+    @context_rule
     def validate_file_size(
-        image_path: Path, analysis_result: Dict[str, Any]
+        context: ImageContext, analysis_result: Dict[str, Any]
     ) -> Dict[str, Any]:
         try:
-            file_size_bytes = image_path.stat().st_size
+            file_size_bytes = context.file_size
             file_size_mb = file_size_bytes / (1024 * 1024)
 
             if file_size_mb > max_size_mb:
@@ -658,13 +1719,56 @@ async def main():
         print(f"  Weighted Contributions: {breakdown.weighted_contributions}")
         print(f"  Recommendations: {breakdown.recommendations}")
 
+    # Vectorized re-scoring of a large cached result set
+    import time
+
+    rng = np.random.default_rng(0)
+    batch = {aspect: rng.random(100_000) for aspect in ASPECTS}
+
+    start_time = time.perf_counter()
+    scores = scorer.score_batch(batch)
+    score_time = time.perf_counter() - start_time
+
+    scorer.update_thresholds(auto_accept=0.8)
+    start_time = time.perf_counter()
+    scores = scorer.classify_batch(scores.confidence)
+    classify_time = time.perf_counter() - start_time
+
+    print(f"\nScored 100k results in {score_time * 1000:.1f}ms")
+    print(f"Re-binned after threshold change in {classify_time * 1000:.1f}ms")
+    print(f"Level counts: { {k.value: v for k, v in scores.counts().items()} }")
+
+    # Declarative rules travel with the exported configuration
+    scorer.add_declarative_rule(
+        {
+            "name": "ui_power_of_two",
+            "categories": ["ui_elements"],
+            "match": "any",
+            "conditions": [
+                {"property": "width", "op": "not_in", "value": [32, 64, 128, 256]},
+                {"property": "height", "op": "not_in", "value": [32, 64, 128, 256]},
+            ],
+            "then": {
+                "confidence_adjustment": -0.1,
+                "issues": ["UI element size {width}x{height} is not a standard size"],
+            },
+        }
+    )
+
     # Test custom rules
     print(f"\nCustom Rules: {scorer.get_custom_rules()}")
+    print(f"Rule statistics: {scorer.get_custom_rules(include_stats=True)}")
 
     # Export configuration
     config = scorer.export_config()
     print(f"\nConfiguration: {config}")
 
+    restored = ConfidenceScorer()
+    restored.import_config(config)
+    print(f"Restored declarative rules: {restored.rule_table.names()}")
+
+    scorer.shutdown()
+
 
 if __name__ == "__main__":
     import asyncio
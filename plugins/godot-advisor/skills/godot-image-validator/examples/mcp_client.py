@@ -8,12 +8,20 @@ mechanisms for robust operation.
 """
 
 import asyncio
+import base64
+import hashlib
+import io
 import logging
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 import time
 
+from client_metrics import ClientMetrics, FileSpanExporter, Tracer
+
+from perceptual_hash import DedupConfig, MultiIndexHash, hash_image
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -47,6 +55,23 @@ class AnalysisResult:
             error_message=error_message,
         )
 
+    def as_duplicate(
+        self, image_path: Path, source_path: Path, similarity: float
+    ) -> "AnalysisResult":
+        """Copy of this result for a near-duplicate image, scaled by similarity"""
+        return AnalysisResult(
+            success=self.success,
+            confidence=self.confidence * similarity,
+            categories=list(self.categories),
+            issues=list(self.issues),
+            metadata={
+                **self.metadata,
+                "image_path": str(image_path),
+                "duplicate_of": str(source_path),
+                "similarity": round(similarity, 4),
+            },
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
         return asdict(self)
@@ -57,6 +82,275 @@ class AnalysisResult:
         return cls(**data)
 
 
+@dataclass
+class BatchConfig:
+    """Configuration for batched multi-image analysis requests"""
+
+    max_batch_size: int = 8  # Images packed into a single request
+    # Latency deadline before a partial batch is flushed (seconds)
+    max_wait: float = 0.25
+    max_image_bytes: int = 256 * 1024  # Only images up to this size are batched
+
+    def validate(self):
+        """Validate batch configuration"""
+        if self.max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if self.max_wait < 0.0:
+            raise ValueError("max_wait must not be negative")
+
+
+class ImageBatcher:
+    """
+    Collects small images and sends them to the MCP tool as one multi-image request
+
+    A batch is flushed as soon as it holds ``max_batch_size`` images, or when
+    ``max_wait`` seconds have passed since its first image was queued, whichever
+    comes first. Images are grouped by category list so every batch shares a prompt.
+    """
+
+    def __init__(self, client: "MCPClient", config: BatchConfig):
+        self.client = client
+        self.config = config
+        self._pending: Dict[
+            Tuple[str, ...], List[Tuple[Path, asyncio.Future, float]]
+        ] = {}
+        self._timers: Dict[Tuple[str, ...], asyncio.TimerHandle] = {}
+        self._in_flight: set = set()
+
+    def accepts(self, image_path: Path) -> bool:
+        """Check if an image is small enough to be batched"""
+        try:
+            return image_path.stat().st_size <= self.config.max_image_bytes
+        except OSError:
+            return False
+
+    async def submit(self, image_path: Path, categories: List[str]) -> AnalysisResult:
+        """Queue an image and wait for the result of the batch it ends up in"""
+        loop = asyncio.get_running_loop()
+        key = tuple(categories)
+        future = loop.create_future()
+
+        # Time spent waiting for the batch to fill is this request's queue wait
+        start = self.client.metrics.request_start() or time.perf_counter()
+        self.client.metrics.mark_sent()
+
+        pending = self._pending.setdefault(key, [])
+        pending.append((image_path, future, start))
+
+        if len(pending) >= self.config.max_batch_size:
+            self._flush(key)
+        elif len(pending) == 1:
+            self._timers[key] = loop.call_later(self.config.max_wait, self._flush, key)
+
+        return await future
+
+    async def flush_all(self):
+        """Flush every partial batch and wait for all in-flight requests"""
+        for key in list(self._pending):
+            self._flush(key)
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    def _flush(self, key: Tuple[str, ...]):
+        """Send the pending batch for a category key"""
+        timer = self._timers.pop(key, None)
+        if timer:
+            timer.cancel()
+
+        batch = self._pending.pop(key, [])
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._send(list(key), batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _send(
+        self,
+        categories: List[str],
+        batch: List[Tuple[Path, asyncio.Future, float]],
+    ):
+        """Run one batched request and resolve the waiting futures"""
+        # The batch serves several requests, so it is traced on its own
+        self.client.metrics.detach()
+        sent = time.perf_counter()
+        for _, _, start in batch:
+            self.client.metrics.record_queue_wait(sent - start)
+
+        image_paths = [image_path for image_path, _, _ in batch]
+
+        try:
+            results = await self.client._analyze_batch(image_paths, categories)
+        except Exception as e:
+            logger.error(f"Batched analysis failed: {e}")
+            results = [
+                AnalysisResult.fallback_result(image_path, f"Batch error: {e}")
+                for image_path in image_paths
+            ]
+
+        for (_, future, _), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+@dataclass
+class PreprocessConfig:
+    """Configuration for client-side image preparation before upload"""
+
+    max_edge: int = 1024  # Longest edge of the uploaded image in pixels
+    output_format: str = "WEBP"  # Compact in-memory encoding (WEBP keeps alpha)
+    quality: int = 85  # Encoder quality for lossy formats
+    cache_size: int = 256  # Prepared payloads kept in memory
+
+    def validate(self):
+        """Validate preprocessing configuration"""
+        if self.max_edge < 16:
+            raise ValueError("max_edge must be at least 16 pixels")
+        if not 1 <= self.quality <= 100:
+            raise ValueError("quality must be between 1 and 100")
+
+    def cache_tag(self) -> str:
+        """Part of the cache key that changes when the output would change"""
+        return f"{self.max_edge}:{self.output_format}:{self.quality}"
+
+
+@dataclass
+class PreparedImage:
+    """Downscaled, re-encoded image payload ready for upload"""
+
+    content_hash: str
+    data: bytes
+    mime_type: str
+    original_size: Tuple[int, int]
+    prepared_size: Tuple[int, int]
+    original_bytes: int
+    prepare_time: float = 0.0
+
+    def to_data_uri(self) -> str:
+        """Encode payload as a data URI for the MCP image source"""
+        return f"data:{self.mime_type};base64,{base64.b64encode(self.data).decode()}"
+
+
+class ImagePreprocessor:
+    """
+    Decodes an image once, downsamples it and re-encodes it in memory
+
+    Prepared payloads are cached by content hash, so renamed or duplicated
+    files and retries of the same image reuse the same bytes.
+    """
+
+    def __init__(self, config: PreprocessConfig = None):
+        self.config = config or PreprocessConfig()
+        self.config.validate()
+        self._cache: "OrderedDict[str, PreparedImage]" = OrderedDict()
+        # path -> (mtime, size, content hash), avoids re-reading unchanged files
+        self._path_hashes: Dict[str, Tuple[float, int, str]] = {}
+
+    def prepare(self, image_path: Path) -> Optional[PreparedImage]:
+        """
+        Prepare an image for upload
+
+        Returns:
+            Optional[PreparedImage]: Prepared payload, or None if the image
+            can't be decoded locally (the path is then sent as-is)
+        """
+        start_time = time.time()
+        stat = image_path.stat()
+
+        cached = self._lookup(image_path, stat.st_mtime, stat.st_size)
+        if cached is not None:
+            return cached
+
+        raw = image_path.read_bytes()
+        content_hash = hashlib.sha1(raw).hexdigest()
+        self._path_hashes[str(image_path)] = (stat.st_mtime, stat.st_size, content_hash)
+
+        cache_key = f"{content_hash}:{self.config.cache_tag()}"
+        if cache_key in self._cache:
+            self._cache.move_to_end(cache_key)
+            return self._cache[cache_key]
+
+        try:
+            from PIL import Image
+
+            with Image.open(io.BytesIO(raw)) as img:
+                original_size = img.size
+                # Let JPEG decode at reduced scale instead of full resolution
+                img.draft(img.mode, (self.config.max_edge, self.config.max_edge))
+                img.load()
+
+                if max(img.size) > self.config.max_edge:
+                    img.thumbnail(
+                        (self.config.max_edge, self.config.max_edge),
+                        Image.Resampling.LANCZOS,
+                    )
+
+                if img.mode not in ("RGB", "RGBA"):
+                    has_alpha = img.mode in ("LA", "PA") or "transparency" in img.info
+                    img = img.convert("RGBA" if has_alpha else "RGB")
+
+                buffer = io.BytesIO()
+                img.save(buffer, self.config.output_format, quality=self.config.quality)
+                prepared_size = img.size
+
+        except Exception as e:
+            logger.debug(f"Preprocessing skipped for {image_path.name}: {e}")
+            return None
+
+        data = buffer.getvalue()
+        mime_type = f"image/{self.config.output_format.lower()}"
+
+        # Don't make already compact images bigger
+        if len(data) >= len(raw) and prepared_size == original_size:
+            original_format = Image.registered_extensions().get(
+                image_path.suffix.lower()
+            )
+            mime_type = Image.MIME.get(original_format, mime_type)
+            data = raw
+
+        prepared = PreparedImage(
+            content_hash=content_hash,
+            data=data,
+            mime_type=mime_type,
+            original_size=original_size,
+            prepared_size=prepared_size,
+            original_bytes=len(raw),
+            prepare_time=time.time() - start_time,
+        )
+
+        self._cache[cache_key] = prepared
+        if len(self._cache) > self.config.cache_size:
+            self._cache.popitem(last=False)
+
+        return prepared
+
+    def get_cached(self, image_path: Path) -> Optional[PreparedImage]:
+        """Get an already prepared payload for a path without touching the file"""
+        entry = self._path_hashes.get(str(image_path))
+        if entry is None:
+            return None
+        return self._cache.get(f"{entry[2]}:{self.config.cache_tag()}")
+
+    def _lookup(
+        self, image_path: Path, mtime: float, size: int
+    ) -> Optional[PreparedImage]:
+        """Find a cached payload for an unchanged file"""
+        entry = self._path_hashes.get(str(image_path))
+        if entry is None or entry[0] != mtime or entry[1] != size:
+            return None
+
+        cache_key = f"{entry[2]}:{self.config.cache_tag()}"
+        prepared = self._cache.get(cache_key)
+        if prepared is not None:
+            self._cache.move_to_end(cache_key)
+        return prepared
+
+    def clear_cache(self):
+        """Drop all prepared payloads"""
+        self._cache.clear()
+        self._path_hashes.clear()
+
+
 class MCPClient:
     """Client for MCP image analysis tools"""
 
@@ -66,6 +360,11 @@ class MCPClient:
         max_retries: int = 3,
         retry_delay: float = 2.0,
         debug_mode: bool = False,
+        batch_config: Optional[BatchConfig] = None,
+        preprocess_config: Optional[PreprocessConfig] = None,
+        dedup_config: Optional[DedupConfig] = None,
+        tool_server: Optional[Any] = None,
+        trace_path: Optional[Path] = None,
     ):
         """
         Initialize MCP client
@@ -75,15 +374,48 @@ class MCPClient:
             max_retries: Maximum number of retry attempts
             retry_delay: Initial delay between retries (seconds)
             debug_mode: Enable debug logging
+            batch_config: Enable batched multi-image requests for small images
+            preprocess_config: Downscale and re-encode images before upload
+            dedup_config: Reuse results for perceptual near-duplicates
+            tool_server: Provider of the MCP tools as coroutines
+                analyze_image(image_source, prompt),
+                analyze_images(image_sources, prompt) and
+                analyze_image_fallback(image_source, prompt), each returning
+                the tool's JSON response (e.g. the benchmark's fake server);
+                the built-in mock is used if omitted
+            trace_path: Append OpenTelemetry spans of every request to this
+                file as OTLP/JSON lines
         """
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.debug_mode = debug_mode
+        self.tool_server = tool_server
 
         if debug_mode:
             logger.setLevel(logging.DEBUG)
 
+        # Optional batching of small images into multi-image requests
+        self.batcher = None
+        if batch_config is not None:
+            batch_config.validate()
+            self.batcher = ImageBatcher(self, batch_config)
+
+        # Optional client-side downscaling before upload
+        self.preprocessor = None
+        if preprocess_config is not None:
+            self.preprocessor = ImagePreprocessor(preprocess_config)
+
+        # Optional near-duplicate detection ahead of analysis
+        self.dedup_config = dedup_config
+        self._dedup_indexes: Dict[Tuple[str, ...], Any] = {}
+        if dedup_config is not None:
+            dedup_config.validate()
+
+        # Latency histograms, gauges and tracing
+        tracer = Tracer(FileSpanExporter(trace_path)) if trace_path else None
+        self.metrics = ClientMetrics(tracer)
+
         # Track statistics
         self.stats = {
             "total_requests": 0,
@@ -91,6 +423,12 @@ class MCPClient:
             "failed_requests": 0,
             "retry_attempts": 0,
             "fallback_used": 0,
+            "batch_requests": 0,
+            "batched_images": 0,
+            "bytes_original": 0,
+            "bytes_sent": 0,
+            "preprocess_time": 0.0,
+            "duplicates_skipped": 0,
         }
 
     async def analyze_image(
@@ -114,6 +452,27 @@ class MCPClient:
             FileNotFoundError: If image file doesn't exist
             ValueError: If image format is not supported
         """
+        with self.metrics.request(image_path) as span:
+            result = await self._analyze_image(image_path, categories, analysis_prompt)
+
+            span.set_attribute("analysis.success", result.success)
+            span.set_attribute("analysis.confidence", result.confidence)
+            if result.categories:
+                span.set_attribute("analysis.category", result.categories[0])
+            for key in ("batched", "duplicate_of"):
+                if key in result.metadata:
+                    span.set_attribute(f"analysis.{key}", result.metadata[key])
+            if not result.success:
+                span.set_error(result.error_message)
+            return result
+
+    async def _analyze_image(
+        self,
+        image_path: Path,
+        categories: Optional[List[str]],
+        analysis_prompt: Optional[str],
+    ) -> AnalysisResult:
+        """Validate the request, then analyze with deduplication if enabled"""
         start_time = time.time()
         self.stats["total_requests"] += 1
 
@@ -132,14 +491,46 @@ class MCPClient:
         if categories is None:
             categories = ["animations", "environments", "ui_elements", "effects"]
 
+        # Custom prompts are image specific, so only default prompts are deduplicated
+        if self.dedup_config is not None and analysis_prompt is None:
+            return await self._analyze_deduplicated(image_path, categories, start_time)
+
+        return await self._analyze(image_path, categories, analysis_prompt, start_time)
+
+    async def _analyze(
+        self,
+        image_path: Path,
+        categories: List[str],
+        analysis_prompt: Optional[str],
+        start_time: float,
+    ) -> AnalysisResult:
+        """Run the analysis for one image: primary call, retries and fallback"""
+        # Custom prompts are image specific, so only default prompts are batched
+        use_batch = (
+            self.batcher is not None
+            and analysis_prompt is None
+            and self.batcher.accepts(image_path)
+        )
+
         if analysis_prompt is None:
             analysis_prompt = self._build_default_prompt(categories)
 
         try:
+            if self.preprocessor is not None:
+                await self._prepare_image(image_path)
+
             # Primary analysis using MCP tool
-            result = await self._call_analyze_image_tool(
-                image_path, categories, analysis_prompt
-            )
+            if use_batch:
+                result = await self.batcher.submit(image_path, categories)
+            else:
+                with self.metrics.tool_call(
+                    "primary", "analyze_image", self._payload_size(image_path)
+                ) as span:
+                    result = await self._call_analyze_image_tool(
+                        image_path, categories, analysis_prompt
+                    )
+                    if not result.success:
+                        span.set_error(result.error_message)
 
             if not result.success:
                 # Retry with exponential backoff
@@ -187,9 +578,18 @@ class MCPClient:
                 logger.debug(f"Categories: {categories}")
                 logger.debug(f"Prompt: {prompt}")
 
+            if self.tool_server is not None:
+                response = await asyncio.wait_for(
+                    self.tool_server.analyze_image(
+                        self._image_source(image_path), prompt
+                    ),
+                    self.timeout,
+                )
+                return self._parse_analysis_response(response, image_path)
+
             # TODO: Replace with actual MCP tool call
             # result = await mcp__zai_mcp_server__analyze_image(
-            #     image_source=str(image_path),
+            #     image_source=self._image_source(image_path),
             #     prompt=prompt,
             #     output_format="json"
             # )
@@ -206,9 +606,263 @@ class MCPClient:
             return mock_result
 
         except Exception as e:
-            logger.error(f"MCP tool call failed: {e}")
+            logger.error(f"MCP tool call failed: {e!r}")
             return AnalysisResult.fallback_result(image_path, f"MCP tool error: {e}")
 
+    async def _analyze_deduplicated(
+        self, image_path: Path, categories: List[str], start_time: float
+    ) -> AnalysisResult:
+        """
+        Reuse the result of a perceptual near-duplicate, or analyze as a representative
+
+        Images arriving while their representative is still being analyzed wait
+        for it instead of sending their own request.
+        """
+        loop = asyncio.get_running_loop()
+        image_hashes = await loop.run_in_executor(None, hash_image, image_path)
+        if image_hashes is None:
+            return await self._analyze(image_path, categories, None, start_time)
+
+        value = image_hashes.get(self.dedup_config.hash_kind)
+        key = tuple(categories)
+        index = self._dedup_indexes.get(key)
+        if index is None:
+            index = MultiIndexHash(self.dedup_config.max_distance)
+            self._dedup_indexes[key] = index
+
+        for distance, (source_path, source_future) in index.search(value):
+            # Shield so a cancelled duplicate doesn't cancel the representative
+            source_result = await asyncio.shield(source_future)
+            if source_result.success:
+                similarity = self.dedup_config.similarity(distance)
+                result = source_result.as_duplicate(image_path, source_path, similarity)
+                result.processing_time = time.time() - start_time
+                self.stats["successful_requests"] += 1
+                self.stats["duplicates_skipped"] += 1
+                logger.info(
+                    f"Reused analysis of {source_path.name} for {image_path.name} "
+                    f"(similarity {similarity:.0%})"
+                )
+                return result
+
+        # No usable near-duplicate: this image becomes a representative
+        future = loop.create_future()
+        index.add(value, (image_path, future))
+
+        result = None
+        try:
+            result = await self._analyze(image_path, categories, None, start_time)
+            return result
+        finally:
+            if not future.done():
+                future.set_result(
+                    result
+                    or AnalysisResult.fallback_result(image_path, "Analysis cancelled")
+                )
+
+    def clear_duplicate_index(self):
+        """Forget analyzed representatives, e.g. after images changed on disk"""
+        self._dedup_indexes.clear()
+
+    async def _prepare_image(self, image_path: Path) -> Optional[PreparedImage]:
+        """Prepare the upload payload off the event loop and record bytes sent"""
+        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        prepared = await loop.run_in_executor(
+            None, self.preprocessor.prepare, image_path
+        )
+        self.stats["preprocess_time"] += time.time() - start_time
+
+        if prepared is not None:
+            self.stats["bytes_original"] += prepared.original_bytes
+            self.stats["bytes_sent"] += len(prepared.data)
+        else:
+            file_size = image_path.stat().st_size
+            self.stats["bytes_original"] += file_size
+            self.stats["bytes_sent"] += file_size
+
+        return prepared
+
+    def _image_source(self, image_path: Path) -> str:
+        """Image source passed to the MCP tool: prepared payload or the raw path"""
+        if self.preprocessor is not None:
+            prepared = self.preprocessor.get_cached(image_path)
+            if prepared is not None:
+                return prepared.to_data_uri()
+        return str(image_path)
+
+    def _payload_size(self, image_path: Path) -> int:
+        """Bytes of image data a tool call sends for an image"""
+        if self.preprocessor is not None:
+            prepared = self.preprocessor.get_cached(image_path)
+            if prepared is not None:
+                return len(prepared.data)
+        try:
+            return image_path.stat().st_size
+        except OSError:
+            return 0
+
+    async def analyze_batch(
+        self, image_paths: List[Path], categories: List[str] = None
+    ) -> List[AnalysisResult]:
+        """
+        Analyze several images concurrently
+
+        With batching enabled, small images are packed into shared multi-image
+        requests; the rest are analyzed individually.
+
+        Args:
+            image_paths: Paths to the image files
+            categories: List of categories to analyze
+
+        Returns:
+            List[AnalysisResult]: Results in the same order as image_paths
+        """
+        tasks = [
+            self.analyze_image(image_path, categories) for image_path in image_paths
+        ]
+        if self.batcher is not None:
+            # Nothing else will arrive, so don't wait out the deadline
+            tasks.append(self.batcher.flush_all())
+            results = await asyncio.gather(*tasks)
+            return list(results[:-1])
+        return list(await asyncio.gather(*tasks))
+
+    async def _analyze_batch(
+        self, image_paths: List[Path], categories: List[str]
+    ) -> List[AnalysisResult]:
+        """
+        Analyze a batch of images with a single MCP request
+
+        Entries missing from the response come back as failed results so the
+        caller can retry them individually.
+        """
+        start_time = time.time()
+        prompt = self._build_batch_prompt(categories, image_paths)
+
+        with self.metrics.tool_call(
+            "batch",
+            "analyze_images",
+            sum(self._payload_size(p) for p in image_paths),
+            {"batch.size": len(image_paths)},
+        ):
+            response = await self._call_analyze_batch_tool(
+                image_paths, categories, prompt
+            )
+        results = self._parse_batch_response(response, image_paths)
+
+        self.stats["batch_requests"] += 1
+        self.stats["batched_images"] += len(image_paths)
+
+        if self.debug_mode:
+            logger.debug(
+                f"Batch of {len(image_paths)} images analyzed in "
+                f"{time.time() - start_time:.2f}s"
+            )
+
+        return results
+
+    async def _call_analyze_batch_tool(
+        self, image_paths: List[Path], categories: List[str], prompt: str
+    ) -> Dict[str, Any]:
+        """
+        Call the MCP analyze_image tool with a multi-image payload
+
+        This is where the actual MCP tool integration would happen.
+        For demonstration purposes, this includes a mock implementation.
+        """
+        if self.debug_mode:
+            logger.debug(f"Calling MCP analyze_image with {len(image_paths)} images")
+
+        if self.tool_server is not None:
+            return await asyncio.wait_for(
+                self.tool_server.analyze_images(
+                    [self._image_source(p) for p in image_paths], prompt
+                ),
+                self.timeout,
+            )
+
+        # TODO: Replace with actual MCP tool call
+        # result = await mcp__zai_mcp_server__analyze_image(
+        #     image_sources=[self._image_source(p) for p in image_paths],
+        #     prompt=prompt,
+        #     output_format="json"
+        # )
+
+        # Mock implementation: one network round trip for the whole batch
+        await asyncio.sleep(0.5)
+
+        entries = []
+        for index, image_path in enumerate(image_paths):
+            mock_result = await self._generate_mock_analysis(image_path, categories)
+            entries.append(
+                {
+                    "index": index,
+                    "image_path": str(image_path),
+                    "category": mock_result.categories[0],
+                    "confidence": mock_result.confidence,
+                    "issues": mock_result.issues,
+                    "metadata": mock_result.metadata,
+                }
+            )
+
+        return {"results": entries}
+
+    def _parse_batch_response(
+        self, response: Dict[str, Any], image_paths: List[Path]
+    ) -> List[AnalysisResult]:
+        """Map a structured batch response back onto the requested image paths"""
+        results: List[Optional[AnalysisResult]] = [None] * len(image_paths)
+        path_index = {str(p): i for i, p in enumerate(image_paths)}
+
+        for entry in response.get("results", []):
+            if not isinstance(entry, dict):
+                continue
+
+            # Prefer the echoed path, fall back to position in the batch
+            index = path_index.get(entry.get("image_path"), entry.get("index"))
+            if not isinstance(index, int) or not 0 <= index < len(image_paths):
+                continue
+
+            try:
+                confidence = max(0.0, min(1.0, float(entry.get("confidence", 0.0))))
+            except (TypeError, ValueError):
+                continue
+
+            category = entry.get("category") or "other"
+            results[index] = AnalysisResult(
+                success=True,
+                confidence=confidence,
+                categories=[category],
+                issues=list(entry.get("issues", [])),
+                metadata={**entry.get("metadata", {}), "batched": True},
+            )
+
+        return [
+            result
+            or AnalysisResult.fallback_result(
+                image_paths[i], "Missing from batch response"
+            )
+            for i, result in enumerate(results)
+        ]
+
+    def _parse_analysis_response(
+        self, response: Dict[str, Any], image_path: Path
+    ) -> AnalysisResult:
+        """Turn a structured single-image response into an analysis result"""
+        try:
+            confidence = max(0.0, min(1.0, float(response["confidence"])))
+        except (KeyError, TypeError, ValueError):
+            return AnalysisResult.fallback_result(image_path, "Malformed tool response")
+
+        return AnalysisResult(
+            success=True,
+            confidence=confidence,
+            categories=[response.get("category") or "other"],
+            issues=list(response.get("issues", [])),
+            metadata=dict(response.get("metadata", {})),
+        )
+
     async def _retry_analysis(
         self, image_path: Path, categories: List[str], prompt: str
     ) -> AnalysisResult:
@@ -225,9 +879,17 @@ class MCPClient:
                 await asyncio.sleep(delay)
 
                 # Try primary tool again
-                result = await self._call_analyze_image_tool(
-                    image_path, categories, prompt
-                )
+                with self.metrics.tool_call(
+                    "retry",
+                    "analyze_image",
+                    self._payload_size(image_path),
+                    {"retry.attempt": attempt + 1},
+                ) as span:
+                    result = await self._call_analyze_image_tool(
+                        image_path, categories, prompt
+                    )
+                    if not result.success:
+                        span.set_error(result.error_message)
                 if result.success:
                     self.stats["retry_attempts"] += attempt + 1
                     return result
@@ -235,9 +897,16 @@ class MCPClient:
                 # Try fallback tool on last retry
                 if attempt == self.max_retries - 1:
                     logger.info(f"Trying fallback tool for {image_path.name}")
-                    result = await self._call_fallback_tool(
-                        image_path, categories, prompt
-                    )
+                    with self.metrics.tool_call(
+                        "fallback",
+                        "analyze_image_fallback",
+                        self._payload_size(image_path),
+                    ) as span:
+                        result = await self._call_fallback_tool(
+                            image_path, categories, prompt
+                        )
+                        if not result.success:
+                            span.set_error(result.error_message)
                     if result.success:
                         self.stats["fallback_used"] += 1
                         return result
@@ -260,9 +929,18 @@ class MCPClient:
             if self.debug_mode:
                 logger.debug(f"Calling fallback MCP tool for {image_path.name}")
 
+            if self.tool_server is not None:
+                response = await asyncio.wait_for(
+                    self.tool_server.analyze_image_fallback(
+                        self._image_source(image_path), prompt
+                    ),
+                    self.timeout,
+                )
+                return self._parse_analysis_response(response, image_path)
+
             # TODO: Replace with actual fallback MCP tool call
             # result = await mcp__4_5v_mcp__analyze_image(
-            #     imageSource=str(image_path),
+            #     imageSource=self._image_source(image_path),
             #     prompt=prompt
             # )
 
@@ -280,7 +958,7 @@ class MCPClient:
             return mock_result
 
         except Exception as e:
-            logger.error(f"Fallback tool call failed: {e}")
+            logger.error(f"Fallback tool call failed: {e!r}")
             return AnalysisResult.fallback_result(
                 image_path, f"Fallback tool error: {e}"
             )
@@ -347,6 +1025,25 @@ Provide:
 3. Any quality issues or recommendations
 4. Technical analysis of the image properties
 
+Focus on game development context and asset quality standards."""
+
+    def _build_batch_prompt(
+        self, categories: List[str], image_paths: List[Path]
+    ) -> str:
+        """Build analysis prompt for a multi-image request"""
+        categories_str = ", ".join(categories)
+        images_str = "\n".join(
+            f"{index}: {image_path.name}"
+            for index, image_path in enumerate(image_paths)
+        )
+        return f"""Analyze each of these {len(image_paths)} game asset images and classify each into one of these categories: {categories_str}.
+
+Images (in attachment order):
+{images_str}
+
+Respond with JSON only, one entry per image:
+{{"results": [{{"index": <int>, "image_path": <str>, "category": <str>, "confidence": <0.0-1.0>, "issues": [<str>]}}]}}
+
 Focus on game development context and asset quality standards."""
 
     def _is_supported_format(self, image_path: Path) -> bool:
@@ -374,7 +1071,19 @@ Focus on game development context and asset quality standards."""
         else:
             success_rate = 0.0
 
-        return {**self.stats, "success_rate_percent": round(success_rate, 2)}
+        if self.stats["bytes_original"] > 0:
+            bytes_saved = (
+                1 - self.stats["bytes_sent"] / self.stats["bytes_original"]
+            ) * 100
+        else:
+            bytes_saved = 0.0
+
+        return {
+            **self.stats,
+            "success_rate_percent": round(success_rate, 2),
+            "bytes_saved_percent": round(bytes_saved, 2),
+            **self.metrics.snapshot(),
+        }
 
     def reset_statistics(self):
         """Reset usage statistics"""
@@ -384,7 +1093,18 @@ Focus on game development context and asset quality standards."""
             "failed_requests": 0,
             "retry_attempts": 0,
             "fallback_used": 0,
+            "batch_requests": 0,
+            "batched_images": 0,
+            "bytes_original": 0,
+            "bytes_sent": 0,
+            "preprocess_time": 0.0,
+            "duplicates_skipped": 0,
         }
+        self.metrics.reset()
+
+    def close(self):
+        """Write out pending trace spans"""
+        self.metrics.tracer.shutdown()
 
 
 # Example usage and testing
@@ -426,6 +1146,30 @@ async def main():
     for key, value in stats.items():
         print(f"  {key}: {value}")
 
+    # Batched mode: small images share one request
+    existing = [image_path for image_path in test_images if image_path.exists()]
+    if existing:
+        batch_client = MCPClient(batch_config=BatchConfig(max_batch_size=4))
+        start_time = time.time()
+        results = await batch_client.analyze_batch(existing)
+        print(
+            f"\nBatched analysis of {len(results)} images in "
+            f"{time.time() - start_time:.2f}s "
+            f"({batch_client.stats['batch_requests']} requests)"
+        )
+
+        # Preprocessing: compare upload size against sending files as-is
+        prep_client = MCPClient(preprocess_config=PreprocessConfig(max_edge=512))
+        for image_path in existing:
+            await prep_client.analyze_image(image_path)
+        prep_stats = prep_client.get_statistics()
+        print(
+            f"Preprocessing: {prep_stats['bytes_original']} -> "
+            f"{prep_stats['bytes_sent']} bytes "
+            f"({prep_stats['bytes_saved_percent']}% saved, "
+            f"{prep_stats['preprocess_time']:.2f}s spent preparing)"
+        )
+
 
 if __name__ == "__main__":
     # Create test directory if it doesn't exist
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Perceptual Hashing for Godot Image Validator
+
+This module detects near-duplicate images (animation frames, recolors, re-exports) so only
+one representative per cluster needs an AI analysis. It computes average, difference and
+DCT perceptual hashes with vectorized NumPy operations and indexes them with multi-index
+hashing for fast Hamming-distance lookups.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+HASH_SIZE = 8  # 8x8 bits = 64-bit hashes
+HASH_BITS = HASH_SIZE * HASH_SIZE
+DCT_SIZE = 32  # pHash input resolution
+HASH_KINDS = ("ahash", "dhash", "phash")
+
+
+def _dct_matrix(size: int) -> np.ndarray:
+    """Orthonormal DCT-II matrix, so a 2D DCT is two matrix products"""
+    n = np.arange(size)
+    matrix = np.cos(np.pi * (2 * n[None, :] + 1) * n[:, None] / (2 * size))
+    matrix[0] *= 1 / np.sqrt(2)
+    return matrix * np.sqrt(2 / size)
+
+
+_DCT = _dct_matrix(DCT_SIZE)
+
+
+def load_hash_inputs(image_path: Path) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Decode an image once into the grayscale inputs needed by all hashes
+
+    Returns:
+        Optional[Tuple[np.ndarray, np.ndarray]]: (32x32 pixels, 8x9 pixels), or
+        None if the image can't be decoded
+    """
+    try:
+        from PIL import Image
+
+        with Image.open(image_path) as img:
+            img.draft("L", (DCT_SIZE, DCT_SIZE))
+            if img.mode in ("RGBA", "LA", "PA", "P"):
+                # Composite onto white so transparent pixels don't hash as black
+                rgba = img.convert("RGBA")
+                background = Image.new("RGBA", rgba.size, (255, 255, 255, 255))
+                img = Image.alpha_composite(background, rgba)
+            gray = img.convert("L")
+            large = gray.resize((DCT_SIZE, DCT_SIZE), Image.Resampling.BILINEAR)
+            small = gray.resize((HASH_SIZE + 1, HASH_SIZE), Image.Resampling.BILINEAR)
+            return (
+                np.asarray(large, dtype=np.float32),
+                np.asarray(small, dtype=np.float32),
+            )
+    except Exception as e:
+        logger.debug(f"Could not hash {image_path}: {e}")
+        return None
+
+
+def _pack_bits(bits: np.ndarray) -> List[int]:
+    """Pack an (N, 8, 8) boolean array into N 64-bit integers"""
+    packed = np.packbits(bits.reshape(len(bits), -1), axis=1)
+    return [int(v) for v in packed.view(">u8").ravel()]
+
+
+def average_hash_batch(large: np.ndarray) -> List[int]:
+    """aHash for a stack of (N, 32, 32) grayscale images"""
+    block = DCT_SIZE // HASH_SIZE
+    small = large.reshape(len(large), HASH_SIZE, block, HASH_SIZE, block).mean(
+        axis=(2, 4)
+    )
+    return _pack_bits(small > small.mean(axis=(1, 2), keepdims=True))
+
+
+def difference_hash_batch(small: np.ndarray) -> List[int]:
+    """dHash for a stack of (N, 8, 9) grayscale images"""
+    return _pack_bits(small[:, :, 1:] > small[:, :, :-1])
+
+
+def phash_batch(large: np.ndarray) -> List[int]:
+    """pHash (DCT low frequencies vs median) for a stack of (N, 32, 32) images"""
+    coefficients = _DCT @ large @ _DCT.T
+    low = coefficients[:, :HASH_SIZE, :HASH_SIZE].reshape(len(large), -1)
+    # The DC term only encodes overall brightness
+    median = np.median(low[:, 1:], axis=1, keepdims=True)
+    return _pack_bits((low > median).reshape(len(large), HASH_SIZE, HASH_SIZE))
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two hashes"""
+    return bin(a ^ b).count("1")
+
+
+@dataclass
+class ImageHashes:
+    """Perceptual hashes of one image"""
+
+    ahash: int
+    dhash: int
+    phash: int
+
+    def get(self, kind: str) -> int:
+        """Get hash by kind name"""
+        return getattr(self, kind)
+
+
+def hash_images(image_paths: List[Path]) -> Dict[Path, ImageHashes]:
+    """
+    Compute all perceptual hashes for a list of images
+
+    Decoding happens per image; the hash math runs once over the stacked batch.
+    Images that can't be decoded are left out of the result.
+    """
+    loaded = []
+    for image_path in image_paths:
+        inputs = load_hash_inputs(image_path)
+        if inputs is not None:
+            loaded.append((image_path, inputs))
+
+    if not loaded:
+        return {}
+
+    large = np.stack([inputs[0] for _, inputs in loaded])
+    small = np.stack([inputs[1] for _, inputs in loaded])
+
+    ahashes = average_hash_batch(large)
+    dhashes = difference_hash_batch(small)
+    phashes = phash_batch(large)
+
+    return {
+        image_path: ImageHashes(ahash=a, dhash=d, phash=p)
+        for (image_path, _), a, d, p in zip(loaded, ahashes, dhashes, phashes)
+    }
+
+
+def hash_image(image_path: Path) -> Optional[ImageHashes]:
+    """Compute all perceptual hashes for a single image"""
+    return hash_images([image_path]).get(image_path)
+
+
+class MultiIndexHash:
+    """
+    Hamming-distance index over 64-bit hashes using multi-index hashing
+
+    Each hash is split into max_distance + 1 disjoint bit ranges. Two hashes
+    within max_distance bits must agree exactly on at least one range
+    (pigeonhole), so candidates come from exact lookups on each range and
+    only those are checked with a full Hamming distance.
+    """
+
+    def __init__(self, max_distance: int, bits: int = HASH_BITS):
+        self.max_distance = max_distance
+        parts = max_distance + 1
+        edges = [round(i * bits / parts) for i in range(parts + 1)]
+        self._ranges = [
+            (start, (1 << (end - start)) - 1) for start, end in zip(edges, edges[1:])
+        ]
+        self._tables: List[Dict[int, List[int]]] = [{} for _ in self._ranges]
+        self._values: List[int] = []
+        self._items: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def add(self, value: int, item: Any):
+        """Add an item under a hash"""
+        slot = len(self._values)
+        self._values.append(value)
+        self._items.append(item)
+        for table, (shift, mask) in zip(self._tables, self._ranges):
+            table.setdefault((value >> shift) & mask, []).append(slot)
+
+    def search(self, value: int, max_distance: int = None) -> List[Tuple[int, Any]]:
+        """
+        Find all items within max_distance of a hash
+
+        Returns:
+            List[Tuple[int, Any]]: (distance, item) pairs, closest first
+        """
+        if max_distance is None or max_distance > self.max_distance:
+            max_distance = self.max_distance
+
+        candidates = set()
+        for table, (shift, mask) in zip(self._tables, self._ranges):
+            candidates.update(table.get((value >> shift) & mask, ()))
+
+        matches = []
+        for slot in candidates:
+            distance = hamming_distance(value, self._values[slot])
+            if distance <= max_distance:
+                matches.append((distance, self._items[slot]))
+
+        matches.sort(key=lambda match: match[0])
+        return matches
+
+
+@dataclass
+class DedupConfig:
+    """Configuration for near-duplicate detection"""
+
+    hash_kind: str = "phash"  # One of ahash, dhash, phash
+    max_distance: int = 6  # Max differing bits (of 64) to count as a duplicate
+
+    def validate(self):
+        """Validate dedup configuration"""
+        if self.hash_kind not in HASH_KINDS:
+            raise ValueError(f"hash_kind must be one of {HASH_KINDS}")
+        if not 0 <= self.max_distance < HASH_BITS:
+            raise ValueError(f"max_distance must be between 0 and {HASH_BITS - 1}")
+
+    def similarity(self, distance: int) -> float:
+        """Similarity (0.0-1.0) for a Hamming distance"""
+        return 1.0 - distance / HASH_BITS
+
+
+@dataclass
+class DuplicateCluster:
+    """A representative image and the near-duplicates that follow its result"""
+
+    representative: Path
+    members: List[Tuple[Path, int]] = field(default_factory=list)  # (path, distance)
+
+    def __len__(self) -> int:
+        return 1 + len(self.members)
+
+
+def cluster_near_duplicates(
+    hashes: Dict[Path, ImageHashes], config: DedupConfig = None
+) -> List[DuplicateCluster]:
+    """
+    Group images so each cluster has one representative to analyze
+
+    Images join the cluster of the closest representative within
+    max_distance; otherwise they become a new representative.
+    """
+    config = config or DedupConfig()
+    config.validate()
+
+    index = MultiIndexHash(config.max_distance)
+    clusters: List[DuplicateCluster] = []
+
+    for image_path, image_hashes in hashes.items():
+        value = image_hashes.get(config.hash_kind)
+        matches = index.search(value)
+        if matches:
+            distance, cluster = matches[0]
+            cluster.members.append((image_path, distance))
+        else:
+            cluster = DuplicateCluster(representative=image_path)
+            clusters.append(cluster)
+            index.add(value, cluster)
+
+    return clusters
+
+
+def _write_synthetic_corpus(target_dir: Path, count: int, seed: int = 0) -> List[Path]:
+    """Write sprite-like test images, with frames and recolors of shared bases"""
+    from PIL import Image
+
+    rng = np.random.default_rng(seed)
+    paths = []
+    bases = max(1, count // 10)
+    base_images = [
+        (rng.random((8, 8, 3)) * 255).astype(np.uint8).repeat(8, 0).repeat(8, 1)
+        for _ in range(bases)
+    ]
+
+    for index in range(count):
+        pixels = base_images[index % bases].copy()
+        variant = index // bases
+        if variant % 3 == 1:
+            pixels = np.roll(pixels, 1, axis=1)  # Next animation frame
+        elif variant % 3 == 2:
+            pixels = np.clip(pixels.astype(np.int16) + 12, 0, 255).astype(np.uint8)
+
+        image_path = target_dir / f"sprite_{index:05d}.png"
+        Image.fromarray(pixels).save(image_path)
+        paths.append(image_path)
+
+    return paths
+
+
+def benchmark(
+    image_paths: Iterable[Path], config: DedupConfig = None
+) -> Dict[str, Any]:
+    """
+    Measure hashing throughput and inference calls saved
+
+    Returns:
+        Dict[str, Any]: Benchmark figures
+    """
+    import time
+
+    image_paths = list(image_paths)
+    start_time = time.perf_counter()
+    hashes = hash_images(image_paths)
+    hash_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    clusters = cluster_near_duplicates(hashes, config)
+    cluster_time = time.perf_counter() - start_time
+
+    return {
+        "images": len(image_paths),
+        "hashed": len(hashes),
+        "hash_seconds": round(hash_time, 3),
+        "images_per_second": round(len(hashes) / hash_time, 1) if hash_time else 0.0,
+        "cluster_seconds": round(cluster_time, 3),
+        "inference_calls": len(clusters),
+        "inference_calls_saved": len(hashes) - len(clusters),
+    }
+
+
+# Example usage
+def main():
+    """Benchmark near-duplicate detection on a folder or a synthetic corpus"""
+    import argparse
+    import tempfile
+
+    parser = argparse.ArgumentParser(description="Perceptual hash benchmark")
+    parser.add_argument("folder", nargs="?", help="Folder of images to benchmark")
+    parser.add_argument(
+        "--synthetic", type=int, default=10000, help="Synthetic corpus size"
+    )
+    parser.add_argument("--hash", default="phash", choices=HASH_KINDS)
+    parser.add_argument("--max-distance", type=int, default=6)
+    args = parser.parse_args()
+
+    config = DedupConfig(hash_kind=args.hash, max_distance=args.max_distance)
+
+    if args.folder:
+        image_paths = sorted(p for p in Path(args.folder).rglob("*") if p.is_file())
+        results = benchmark(image_paths, config)
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            print(f"Writing {args.synthetic} synthetic sprites...")
+            image_paths = _write_synthetic_corpus(Path(tmp), args.synthetic)
+            results = benchmark(image_paths, config)
+
+    print("Perceptual hash benchmark:")
+    for key, value in results.items():
+        print(f"  {key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
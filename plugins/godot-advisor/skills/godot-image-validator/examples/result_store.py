@@ -0,0 +1,591 @@
+#!/usr/bin/env python3
+"""
+Result Store for Godot Image Validator
+
+This module persists validation results as JSON Lines: a header line with the scorer
+configuration (and, for a batch run, its manifest of images) followed by one record per
+analyzed image, appended and flushed as each result arrives. The file doubles as a
+checkpoint journal: a batch without a completion record can be resumed with only the
+images it hasn't analyzed yet, scored with the configuration it started with. Result
+files are memory-mapped and parsed lazily in pages, so very large runs load without
+holding every record in memory, and they can be exported to columnar Parquet or Arrow
+for analytics.
+"""
+
+import json
+import logging
+import mmap
+import os
+from array import array
+from collections import OrderedDict
+from collections.abc import MutableSequence
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, List, Optional
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+HEADER_TYPE = "header"
+COMPLETE_TYPE = "complete"
+
+# Records parsed together when a result is first read
+DEFAULT_PAGE_SIZE = 256
+
+
+def default_results_dir() -> Path:
+    """Directory for streamed result files under the XDG data home"""
+    data_home = os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share"
+    return Path(data_home) / "godot-image-validator" / "results"
+
+
+def result_record(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    JSON-ready record of a validation result
+
+    The image path comes first so files stay easy to grep, and transient
+    UI keys are dropped.
+    """
+    record = {"image_path": str(result["image_path"])}
+    for key, value in result.items():
+        if key not in ("image_path", "pending"):
+            record[key] = value
+    return record
+
+
+def _encode(data: Dict[str, Any]) -> bytes:
+    """Encode one JSON line"""
+    return (json.dumps(data, default=str) + "\n").encode("utf-8")
+
+
+class ResultWriter:
+    """
+    Appends results to a JSON Lines file as they arrive
+
+    Each record is flushed when written, so readers and a later resume see
+    it immediately. Reopening an existing file drops a record that was only
+    partially written when the previous run stopped, then appends after the
+    last complete one.
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        header: Optional[Dict[str, Any]] = None,
+        append: bool = True,
+    ):
+        """
+        Initialize result writer
+
+        Args:
+            file_path: JSON Lines file to write
+            header: Extra header fields (e.g. scorer configuration) for a new file
+            append: Continue an existing file instead of replacing it
+        """
+        self.file_path = Path(file_path)
+        self.records_written = 0
+
+        if append and self.file_path.exists():
+            self._truncate_partial_record()
+        self._file = open(self.file_path, "ab" if append else "wb")
+
+        if self._file.tell() == 0:
+            self._file.write(
+                _encode(
+                    {
+                        "type": HEADER_TYPE,
+                        "version": FORMAT_VERSION,
+                        "created": datetime.now().isoformat(),
+                        **(header or {}),
+                    }
+                )
+            )
+            self._file.flush()
+
+    def _truncate_partial_record(self):
+        """Cut the file back to the end of its last complete line"""
+        with open(self.file_path, "r+b") as f:
+            size = f.seek(0, os.SEEK_END)
+            if size == 0:
+                return
+
+            # Walk back from the end to the last newline
+            end = size
+            while end > 0:
+                start = max(0, end - 65536)
+                f.seek(start)
+                chunk = f.read(end - start)
+                newline = chunk.rfind(b"\n")
+                if newline >= 0:
+                    end = start + newline + 1
+                    break
+                end = start
+
+            if end != size:
+                logger.warning(
+                    f"Dropping {size - end} bytes of a partial record from "
+                    f"{self.file_path}"
+                )
+                f.truncate(end)
+
+    def write(self, result: Dict[str, Any]):
+        """Append one result"""
+        self._file.write(_encode(result_record(result)))
+        self._file.flush()
+        self.records_written += 1
+
+    def mark_complete(self, abandoned: bool = False):
+        """
+        Record that the batch finished, so it is not offered for resuming
+
+        Args:
+            abandoned: The batch was given up rather than finished
+        """
+        self._file.write(
+            _encode(
+                {
+                    "type": COMPLETE_TYPE,
+                    "abandoned": abandoned,
+                    "finished": datetime.now().isoformat(),
+                }
+            )
+        )
+        self._file.flush()
+
+    def write_all(self, results: Iterable[Dict[str, Any]]):
+        """Append many results, flushing once"""
+        for result in results:
+            self._file.write(_encode(result_record(result)))
+            self.records_written += 1
+        self._file.flush()
+
+    def close(self):
+        """Flush to disk and close the file"""
+        if self._file.closed:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+
+    def __enter__(self) -> "ResultWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class ResultFile:
+    """
+    Lazy, memory-mapped view of a JSON Lines result file
+
+    Opening the file makes one pass that keeps only each row's byte offset,
+    image path and confidence. Full records are parsed from the mapping on
+    demand, a page at a time, and only a few pages are cached. An image
+    written several times (re-validated or manually reviewed) appears once,
+    with its last record.
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cached_pages: int = 8,
+    ):
+        """
+        Open a result file
+
+        Args:
+            file_path: JSON Lines file to read
+            page_size: Records parsed together
+            cached_pages: Parsed pages kept in memory
+        """
+        self.file_path = Path(file_path)
+        self.page_size = page_size
+        self.cached_pages = cached_pages
+        self.header: Dict[str, Any] = {}
+        self.complete = False
+        self.image_paths: List[Path] = []
+        self.confidences = array("d")
+        self._offsets = array("q")
+        self._rows: Dict[str, int] = {}
+        self._pages: "OrderedDict[int, List[Dict[str, Any]]]" = OrderedDict()
+
+        self._file = open(self.file_path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty file
+            self._mmap = None
+        self._index()
+
+    def _iter_lines(self) -> Iterator[tuple]:
+        """(offset, line) for every complete line; a torn last line is skipped"""
+        if self._mmap is None:
+            return
+        data = self._mmap
+        start = 0
+        while True:
+            end = data.find(b"\n", start)
+            if end < 0:
+                return
+            yield start, data[start:end]
+            start = end + 1
+
+    def _index(self):
+        """Record the offset, path and confidence of the latest record per image"""
+        rows = self._rows
+        for offset, line in self._iter_lines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                logger.warning(f"Skipping corrupt record at byte {offset}")
+                continue
+
+            if record.get("type") == HEADER_TYPE:
+                if not self.header:
+                    self.header = record
+                continue
+            if record.get("type") == COMPLETE_TYPE:
+                self.complete = True
+                continue
+
+            image_path = record.get("image_path")
+            if image_path is None:
+                continue
+
+            confidence = float(record.get("confidence", 0.0))
+            row = rows.get(image_path)
+            if row is None:
+                rows[image_path] = len(self.image_paths)
+                self.image_paths.append(Path(image_path))
+                self._offsets.append(offset)
+                self.confidences.append(confidence)
+            else:
+                self._offsets[row] = offset
+                self.confidences[row] = confidence
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    @property
+    def manifest(self) -> List[Path]:
+        """Images the batch was started with (empty if it wasn't a batch run)"""
+        return [Path(p) for p in self.header.get("manifest", [])]
+
+    def remaining(self) -> List[Path]:
+        """Manifest images without a record, in manifest order"""
+        return [Path(p) for p in self.header.get("manifest", []) if p not in self._rows]
+
+    def is_resumable(self) -> bool:
+        """Check if this is an unfinished batch with images left to analyze"""
+        return not self.complete and bool(self.remaining())
+
+    def __getitem__(self, row: int) -> Dict[str, Any]:
+        """Full record of a row, with image_path as a Path"""
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError(row)
+
+        page_number = row // self.page_size
+        page = self._pages.get(page_number)
+        if page is None:
+            page = self._load_page(page_number)
+            self._pages[page_number] = page
+            while len(self._pages) > self.cached_pages:
+                self._pages.popitem(last=False)
+        else:
+            self._pages.move_to_end(page_number)
+        return page[row % self.page_size]
+
+    def _load_page(self, page_number: int) -> List[Dict[str, Any]]:
+        """Parse the records of one page"""
+        first = page_number * self.page_size
+        last = min(first + self.page_size, len(self))
+        page = []
+        for row in range(first, last):
+            offset = self._offsets[row]
+            end = self._mmap.find(b"\n", offset)
+            record = json.loads(self._mmap[offset:end])
+            record["image_path"] = Path(record["image_path"])
+            page.append(record)
+        return page
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for row in range(len(self)):
+            yield self[row]
+
+    def close(self):
+        """Release the mapping and file handle"""
+        self._pages.clear()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self) -> "ResultFile":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class LazyResults(MutableSequence):
+    """
+    Result list backed by a ResultFile
+
+    Reads go to the file unless a row has been replaced; replaced and
+    appended results are kept in memory. Parsed records are copies, so
+    changes must be stored back with results[row] = result to stick.
+    """
+
+    def __init__(self, result_file: ResultFile):
+        """
+        Initialize lazy result list
+
+        Args:
+            result_file: Open result file backing the list
+        """
+        self.result_file = result_file
+        self._overrides: Dict[int, Dict[str, Any]] = {}
+        self._appended: List[Dict[str, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self.result_file) + len(self._appended)
+
+    def _row(self, row: int) -> int:
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError(row)
+        return row
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self[i] for i in range(*row.indices(len(self)))]
+        row = self._row(row)
+        stored = len(self.result_file)
+        if row >= stored:
+            return self._appended[row - stored]
+        result = self._overrides.get(row)
+        return result if result is not None else dict(self.result_file[row])
+
+    def __setitem__(self, row: int, result: Dict[str, Any]):
+        row = self._row(row)
+        stored = len(self.result_file)
+        if row >= stored:
+            self._appended[row - stored] = result
+        else:
+            self._overrides[row] = result
+
+    def __delitem__(self, row: int):
+        raise TypeError("LazyResults rows can't be deleted; copy to a list first")
+
+    def insert(self, row: int, result: Dict[str, Any]):
+        if row != len(self):
+            raise TypeError("LazyResults only supports appending")
+        self._appended.append(result)
+
+    def confidences(self) -> Dict[int, float]:
+        """Confidence of every row without parsing the stored records"""
+        confidences = {}
+        for row, confidence in enumerate(self.result_file.confidences):
+            result = self._overrides.get(row)
+            if result is None:
+                confidences[row] = confidence
+            elif not result.get("pending", False):
+                confidences[row] = result.get("confidence", 0.0)
+        for row, result in enumerate(self._appended, len(self.result_file)):
+            if not result.get("pending", False):
+                confidences[row] = result.get("confidence", 0.0)
+        return confidences
+
+    def close(self):
+        """Close the backing file"""
+        self.result_file.close()
+
+
+def _last_line(file_path: Path, max_bytes: int = 4096) -> bytes:
+    """Last complete line of a file (enough to spot a completion record)"""
+    with open(file_path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        f.seek(max(0, size - max_bytes))
+        lines = f.read().rstrip(b"\n").rsplit(b"\n", 1)
+        return lines[-1]
+
+
+def find_interrupted_run(results_dir: Optional[Path] = None) -> Optional[Path]:
+    """
+    Newest batch journal that never recorded its completion
+
+    Only the first and last line of each file are read, so this is cheap
+    to call at startup even with many large result files.
+
+    Args:
+        results_dir: Directory of run files (defaults to default_results_dir())
+
+    Returns:
+        Optional[Path]: Journal to resume, or None
+    """
+    results_dir = Path(results_dir) if results_dir else default_results_dir()
+    try:
+        journals = sorted(
+            results_dir.glob("*.jsonl"), key=lambda p: p.stat().st_mtime, reverse=True
+        )
+    except OSError:
+        return None
+
+    for journal in journals:
+        try:
+            with open(journal, "rb") as f:
+                header = json.loads(f.readline())
+        except (OSError, ValueError):
+            continue
+        if header.get("type") != HEADER_TYPE or not header.get("manifest"):
+            continue
+
+        try:
+            last = json.loads(_last_line(journal))
+        except (OSError, ValueError):
+            last = {}  # Torn last line: the run stopped mid-write
+        if last.get("type") != COMPLETE_TYPE:
+            return journal
+    return None
+
+
+def export_columnar(
+    results: Iterable[Dict[str, Any]], file_path: Path, batch_size: int = 10000
+) -> int:
+    """
+    Export results to Parquet (.parquet) or Arrow IPC (.arrow, .feather)
+
+    Results are converted in record batches, so memory stays bounded no
+    matter how many are exported. Metadata is stored as a JSON string.
+
+    Args:
+        results: Results to export
+        file_path: Output file; the extension picks the format
+        batch_size: Rows per record batch
+
+    Returns:
+        int: Number of rows written
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError("Columnar export requires pyarrow: pip install pyarrow")
+
+    schema = pa.schema(
+        [
+            ("image_path", pa.string()),
+            ("success", pa.bool_()),
+            ("confidence", pa.float64()),
+            ("categories", pa.list_(pa.string())),
+            ("issues", pa.list_(pa.string())),
+            ("manual_review", pa.bool_()),
+            ("review_notes", pa.string()),
+            ("metadata", pa.string()),
+        ]
+    )
+
+    file_path = Path(file_path)
+    if file_path.suffix.lower() == ".parquet":
+        import pyarrow.parquet as pq
+
+        writer = pq.ParquetWriter(str(file_path), schema)
+    else:
+        writer = pa.ipc.new_file(str(file_path), schema)
+
+    def to_batch(rows: List[Dict[str, Any]]):
+        return pa.RecordBatch.from_pydict(
+            {
+                "image_path": [str(r["image_path"]) for r in rows],
+                "success": [bool(r.get("success", False)) for r in rows],
+                "confidence": [float(r.get("confidence", 0.0)) for r in rows],
+                "categories": [list(r.get("categories", [])) for r in rows],
+                "issues": [[str(i) for i in r.get("issues", [])] for r in rows],
+                "manual_review": [bool(r.get("manual_review", False)) for r in rows],
+                "review_notes": [r.get("review_notes", "") for r in rows],
+                "metadata": [
+                    json.dumps(r.get("metadata", {}), default=str) for r in rows
+                ],
+            },
+            schema=schema,
+        )
+
+    written = 0
+    rows = []
+    try:
+        for result in results:
+            if result.get("pending", False):
+                continue
+            rows.append(result)
+            if len(rows) >= batch_size:
+                writer.write_batch(to_batch(rows))
+                written += len(rows)
+                rows = []
+        if rows:
+            writer.write_batch(to_batch(rows))
+            written += len(rows)
+    finally:
+        writer.close()
+    return written
+
+
+# Example usage
+def main():
+    """Write, reopen and page through a large result file"""
+    import tempfile
+    import time
+
+    count = 100000
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = Path(temp_dir) / "results.jsonl"
+
+        start_time = time.time()
+        with ResultWriter(file_path, {"scorer": {"thresholds": {}}}) as writer:
+            for i in range(count):
+                writer.write(
+                    {
+                        "image_path": Path(f"textures/tile_{i:06d}.png"),
+                        "success": True,
+                        "confidence": (i % 100) / 100,
+                        "categories": ["texture"],
+                        "issues": [],
+                        "metadata": {"width": 64, "height": 64},
+                    }
+                )
+        print(f"Wrote {count} records in {time.time() - start_time:.2f}s")
+
+        # Simulate a crash in the middle of a record, then resume
+        with open(file_path, "ab") as f:
+            f.write(b'{"image_path": "textures/tor')
+        with ResultWriter(file_path) as writer:
+            writer.write({"image_path": "textures/late.png", "confidence": 0.5})
+
+        start_time = time.time()
+        with ResultFile(file_path) as result_file:
+            print(
+                f"Indexed {len(result_file)} records in "
+                f"{time.time() - start_time:.2f}s"
+            )
+            start_time = time.time()
+            record = result_file[len(result_file) // 2]
+            print(
+                f"Random record {record['image_path']} in "
+                f"{(time.time() - start_time) * 1000:.1f}ms"
+            )
+            print(f"Last record: {result_file[-1]['image_path']}")
+
+            try:
+                rows = export_columnar(result_file, Path(temp_dir) / "results.parquet")
+                print(f"Exported {rows} rows to Parquet")
+            except ImportError as e:
+                print(e)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+Technical Pre-Analysis for Godot Image Validator
+
+This module computes cheap, local technical checks (dimensions, alpha usage, file size,
+power-of-two sizes, pixel-art grid alignment) for each image before any MCP call, plus the
+NumPy texture heuristics (native pixel scale, palette size, alpha edges, blurry upscales).
+Work is spread across all cores with a process pool, and the resulting profile feeds the
+technical_analysis aspect of the confidence score.
+"""
+
+import logging
+import os
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from texture_heuristics import (
+    MAX_HEURISTIC_PIXELS,
+    SMALL_PALETTE,
+    analyze_texture,
+    read_import_settings,
+    to_rgba_array,
+)
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Files above this size are flagged for import performance
+LARGE_FILE_BYTES = 10 * 1024 * 1024
+
+# Supported by Godot but not decodable locally; left to the MCP analysis
+LOCAL_DECODE_UNSUPPORTED = {".svg", ".exr"}
+
+# Technical score used when the image can't be inspected locally
+UNINSPECTED_SCORE = 0.9
+
+
+@dataclass
+class TechnicalProfile:
+    """Locally computed technical properties of an image"""
+
+    image_path: str
+    readable: bool
+    decoded: bool = False  # Pixel data was inspected locally
+    file_size: int = 0
+    width: int = 0
+    height: int = 0
+    mode: str = ""
+    image_format: str = ""
+    has_alpha: bool = False  # Image has an alpha channel or transparency key
+    alpha_used: bool = False  # At least one pixel is not fully opaque
+    power_of_two: bool = False
+    grid_size: int = 4
+    grid_aligned: bool = False  # Dimensions divisible by grid_size
+    mipmaps: Optional[bool] = None  # Import setting, None without a .import file
+    fix_alpha_border: Optional[bool] = None  # Import setting, as above
+    heuristics: bool = False  # Texture heuristics were computed
+    pixel_scale: int = 1  # Art pixel size of nearest-neighbor upscaled art
+    palette_size: int = 0
+    unbled_edge_ratio: float = 0.0
+    premultiplied_edges: bool = False
+    blur_ratio: float = 0.0
+    blurry_upscale: bool = False
+    error: Optional[str] = None
+
+    def is_broken(self) -> bool:
+        """Check if the asset is obviously broken and not worth an inference call"""
+        return (
+            not self.readable
+            or self.file_size == 0
+            or (self.decoded and (self.width == 0 or self.height == 0))
+        )
+
+    def broken_reason(self) -> Optional[str]:
+        """Human readable reason for a broken asset"""
+        if not self.readable:
+            return f"Image could not be decoded: {self.error or 'unknown error'}"
+        if self.file_size == 0:
+            return "Image file is empty"
+        if self.decoded and (self.width == 0 or self.height == 0):
+            return f"Image has zero size ({self.width}x{self.height})"
+        return None
+
+    def technical_score(self) -> float:
+        """
+        Score the technical aspects of the image
+
+        Returns:
+            float: Technical analysis score (0.0-1.0)
+        """
+        if self.is_broken():
+            return 0.0
+
+        score = 1.0 if self.decoded else UNINSPECTED_SCORE
+        if self.file_size > LARGE_FILE_BYTES:
+            score -= 0.2
+        if not self.decoded:
+            return max(0.0, score)
+
+        if not self.power_of_two and self.mipmaps is not False:
+            # Without mipmaps Godot handles any size; with them NPOT costs more
+            score -= 0.15 if self.mipmaps else 0.1
+        if not self.grid_aligned:
+            score -= 0.1
+        if self.has_alpha and not self.alpha_used:
+            score -= 0.05  # Alpha channel that is never used wastes memory
+
+        if self.heuristics:
+            if self.blurry_upscale:
+                score -= 0.15
+            if self.premultiplied_edges:
+                score -= 0.1
+            if self.has_halo_risk():
+                score -= 0.05
+            if self.pixel_scale > 1:
+                score -= 0.05  # Stored larger than its art, wasting memory
+
+        return max(0.0, min(1.0, score))
+
+    def has_halo_risk(self) -> bool:
+        """Check for black transparent borders that darken filtered edges"""
+        return (
+            self.unbled_edge_ratio > 0.5
+            and self.fix_alpha_border is not True
+            # Unfiltered pixel art never samples the transparent neighbors
+            and self.pixel_scale == 1
+            and self.palette_size > SMALL_PALETTE
+        )
+
+    def get_issues(self) -> List[str]:
+        """List technical issues found locally"""
+        if self.is_broken():
+            return [self.broken_reason()]
+
+        issues = []
+        if self.file_size > LARGE_FILE_BYTES:
+            issues.append(f"Large file size: {self.file_size / (1024 * 1024):.1f}MB")
+        if not self.decoded:
+            return issues
+
+        if not self.power_of_two and self.mipmaps:
+            issues.append(
+                f"Dimensions {self.width}x{self.height} are not powers of two "
+                "but the texture is imported with mipmaps"
+            )
+        elif not self.power_of_two and self.mipmaps is None:
+            issues.append(
+                f"Dimensions {self.width}x{self.height} are not powers of two "
+                "(mipmaps and compression may be affected)"
+            )
+        if not self.grid_aligned:
+            issues.append(
+                f"Dimensions {self.width}x{self.height} not divisible by {self.grid_size}"
+            )
+        if self.has_alpha and not self.alpha_used:
+            issues.append("Alpha channel present but fully opaque")
+
+        if not self.heuristics:
+            return issues
+        if self.blurry_upscale:
+            issues.append(
+                f"Looks like a smooth upscale of a smaller image "
+                f"(blur ratio {self.blur_ratio:.2f})"
+            )
+        if self.premultiplied_edges:
+            issues.append(
+                "Semi-transparent edges look premultiplied; Godot expects straight "
+                "alpha, so edges will render dark"
+            )
+        if self.has_halo_risk():
+            issues.append(
+                f"{self.unbled_edge_ratio:.0%} of transparent edge pixels are black "
+                "(enable Fix Alpha Border on import to avoid dark halos)"
+            )
+        if self.pixel_scale > 1:
+            issues.append(
+                f"Pixel art stored at {self.pixel_scale}x scale; import it at "
+                f"{self.width // self.pixel_scale}x{self.height // self.pixel_scale} "
+                "and scale in the engine"
+            )
+        return issues
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TechnicalProfile":
+        """Create from dictionary"""
+        return cls(**data)
+
+
+def _is_power_of_two(value: int) -> bool:
+    """Check if a positive integer is a power of two"""
+    return value > 0 and (value & (value - 1)) == 0
+
+
+def compute_technical_profile(image_path: str, grid_size: int = 4) -> TechnicalProfile:
+    """
+    Compute the technical profile of a single image
+
+    Top-level so it can run in a worker process.
+
+    Args:
+        image_path: Path to the image file
+        grid_size: Pixel-art grid the dimensions should align to
+
+    Returns:
+        TechnicalProfile: Profile of the image (readable=False on failure)
+    """
+    try:
+        file_size = os.stat(image_path).st_size
+    except OSError as e:
+        return TechnicalProfile(
+            image_path=str(image_path),
+            readable=False,
+            grid_size=grid_size,
+            error=str(e),
+        )
+
+    uninspected = TechnicalProfile(
+        image_path=str(image_path),
+        readable=True,
+        file_size=file_size,
+        grid_size=grid_size,
+    )
+    if Path(image_path).suffix.lower() in LOCAL_DECODE_UNSUPPORTED:
+        return uninspected
+
+    try:
+        from PIL import Image
+    except ImportError:
+        return uninspected  # Without PIL only the file checks apply
+
+    try:
+        with Image.open(image_path) as img:
+            width, height = img.size
+            mode = img.mode
+            image_format = img.format or ""
+            has_alpha = mode in ("RGBA", "LA", "PA") or "transparency" in img.info
+
+            alpha_used = False
+            if has_alpha:
+                if mode in ("RGBA", "LA", "PA"):
+                    alpha_min, _ = img.getchannel("A").getextrema()
+                    alpha_used = alpha_min < 255
+                else:
+                    alpha_used = True  # Palette or color-key transparency
+
+            metrics = None
+            if width * height <= MAX_HEURISTIC_PIXELS:
+                metrics = analyze_texture(to_rgba_array(img))
+
+    except Exception as e:
+        return TechnicalProfile(
+            image_path=str(image_path),
+            readable=False,
+            file_size=file_size,
+            grid_size=grid_size,
+            error=str(e),
+        )
+
+    profile = TechnicalProfile(
+        image_path=str(image_path),
+        readable=True,
+        decoded=True,
+        file_size=file_size,
+        width=width,
+        height=height,
+        mode=mode,
+        image_format=image_format,
+        has_alpha=has_alpha,
+        alpha_used=alpha_used,
+        power_of_two=_is_power_of_two(width) and _is_power_of_two(height),
+        grid_size=grid_size,
+        grid_aligned=width % grid_size == 0 and height % grid_size == 0,
+    )
+    settings = read_import_settings(Path(image_path))
+    profile.mipmaps = settings.get("mipmaps")
+    profile.fix_alpha_border = settings.get("fix_alpha_border")
+    if metrics is not None:
+        profile.heuristics = True
+        profile.pixel_scale = metrics.pixel_scale
+        profile.palette_size = metrics.palette_size
+        profile.unbled_edge_ratio = metrics.unbled_edge_ratio
+        profile.premultiplied_edges = metrics.premultiplied_edges
+        profile.blur_ratio = metrics.blur_ratio
+        profile.blurry_upscale = metrics.blurry_upscale
+    return profile
+
+
+class TechnicalPreAnalyzer:
+    """Computes technical profiles for many images across all cores"""
+
+    def __init__(self, max_workers: Optional[int] = None, grid_size: int = 4):
+        """
+        Initialize pre-analyzer
+
+        Args:
+            max_workers: Worker processes (defaults to the number of cores)
+            grid_size: Pixel-art grid the dimensions should align to
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.grid_size = grid_size
+        self._executor: Optional[Executor] = None
+
+    def start(self):
+        """Start the worker pool"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def shutdown(self):
+        """Stop the worker pool, dropping queued work"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def submit(self, image_path: Path) -> Future:
+        """Queue a single image and return a future for its profile"""
+        self.start()
+        return self._executor.submit(
+            compute_technical_profile, str(image_path), self.grid_size
+        )
+
+    def analyze(self, image_paths: List[Path]) -> Dict[Path, TechnicalProfile]:
+        """
+        Compute profiles for all images and wait for the results
+
+        Args:
+            image_paths: Paths to the image files
+
+        Returns:
+            Dict[Path, TechnicalProfile]: Profile per image path
+        """
+        if not image_paths:
+            return {}
+
+        self.start()
+        chunksize = max(1, len(image_paths) // (self.max_workers * 4))
+        profiles = self._executor.map(
+            compute_technical_profile,
+            [str(p) for p in image_paths],
+            [self.grid_size] * len(image_paths),
+            chunksize=chunksize,
+        )
+        return dict(zip(image_paths, profiles))
+
+    def __enter__(self) -> "TechnicalPreAnalyzer":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+
+# Example usage
+def main():
+    """Example usage of the technical pre-analyzer"""
+    import sys
+    import time
+
+    image_paths = [Path(p) for p in sys.argv[1:]]
+    if not image_paths:
+        print("Usage: python technical_profile.py <image> [<image> ...]")
+        return
+
+    start_time = time.time()
+    with TechnicalPreAnalyzer() as analyzer:
+        profiles = analyzer.analyze(image_paths)
+    elapsed = time.time() - start_time
+
+    for image_path, profile in profiles.items():
+        if profile.is_broken():
+            status = "BROKEN"
+        else:
+            status = f"{profile.technical_score():.2f}"
+        print(f"{image_path.name}: {profile.width}x{profile.height} {status}")
+        for issue in profile.get_issues():
+            print(f"  - {issue}")
+
+    print(f"\nProfiled {len(profiles)} images in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+Thumbnail Service for Godot Image Validator
+
+This module renders image thumbnails off the GUI thread. Requests go into a priority
+queue served by a pool of worker threads, so visible items are rendered before
+prefetched ones. Each image is decoded once into a pyramid of thumbnail sizes
+(64/128/256/512), and every level is stored in an on-disk cache keyed by path,
+modification time and size, so zooming and reopening a project never decode again.
+"""
+
+import hashlib
+import heapq
+import io
+import itertools
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Any, Iterable, Optional, Tuple
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Square bounding boxes of the thumbnail pyramid levels, smallest first
+PYRAMID_LEVELS = (64, 128, 256, 512)
+
+# Request priorities; lower values are served first
+PRIORITY_VISIBLE = 0
+PRIORITY_PREFETCH = 1
+
+
+def default_cache_dir() -> Path:
+    """Thumbnail cache directory under the XDG cache home"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "godot-image-validator" / "thumbnails"
+
+
+class ThumbnailDiskCache:
+    """
+    Persistent thumbnail store
+
+    Layout follows the freedesktop thumbnail spec loosely: one directory per
+    thumbnail size holding <sha1>.png files. The hash covers the absolute
+    path, mtime and file size, so an edited image simply misses the cache
+    and stale entries are never returned.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Initialize disk cache
+
+        Args:
+            cache_dir: Cache directory (defaults to default_cache_dir())
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+
+    def entry_path(self, image_path: Path, size: Tuple[int, int]) -> Optional[Path]:
+        """Cache file for an image, or None if the image can't be stat'ed"""
+        try:
+            stat = os.stat(image_path)
+        except OSError:
+            return None
+
+        key = f"{Path(image_path).resolve()}\0{stat.st_mtime_ns}\0{stat.st_size}"
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{size[0]}x{size[1]}" / f"{digest}.png"
+
+    def get(self, image_path: Path, size: Tuple[int, int]) -> Optional[bytes]:
+        """Get cached PNG bytes, or None on a miss"""
+        entry = self.entry_path(image_path, size)
+        if entry is None:
+            return None
+        try:
+            return entry.read_bytes()
+        except OSError:
+            return None
+
+    def put(self, image_path: Path, size: Tuple[int, int], data: bytes):
+        """Store PNG bytes; failures only cost a future cache miss"""
+        entry = self.entry_path(image_path, size)
+        if entry is None:
+            return
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so readers never see a partial file
+            temp_path = entry.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            temp_path.write_bytes(data)
+            os.replace(temp_path, entry)
+        except OSError as e:
+            logger.debug(f"Could not cache thumbnail for {image_path}: {e}")
+
+    def clear(self):
+        """Remove all cached thumbnails"""
+        import shutil
+
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+
+def pyramid_level(edge: int, levels: Iterable[int] = PYRAMID_LEVELS) -> int:
+    """Smallest pyramid level at least as large as a display size"""
+    levels = sorted(levels)
+    for level in levels:
+        if level >= edge:
+            return level
+    return levels[-1]
+
+
+def render_thumbnail_pyramid(
+    image_path: Path, levels: Iterable[int] = PYRAMID_LEVELS
+) -> Dict[int, bytes]:
+    """
+    Decode an image once and encode every pyramid level as PNG
+
+    Each level is reduced from the next larger one rather than from the
+    source, so the cost is one decode plus a shrinking series of resizes.
+
+    Args:
+        image_path: Path to the image file
+        levels: Square bounding boxes to render
+
+    Returns:
+        Dict[int, bytes]: PNG-encoded thumbnail per level
+    """
+    from PIL import Image
+
+    levels = sorted(levels, reverse=True)
+    with Image.open(image_path) as img:
+        img.draft("RGB", (levels[0], levels[0]))
+        img.thumbnail((levels[0], levels[0]), Image.Resampling.LANCZOS)
+
+        # Keep transparency
+        if img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info:
+            img = img.convert("RGBA")
+        else:
+            img = img.convert("RGB")
+
+    thumbnails = {}
+    for level in levels:
+        img.thumbnail((level, level), Image.Resampling.LANCZOS)
+        buffer = io.BytesIO()
+        img.save(buffer, "PNG", compress_level=1)
+        thumbnails[level] = buffer.getvalue()
+    return thumbnails
+
+
+class ThumbnailService:
+    """
+    Renders thumbnail pyramids on worker threads, most urgent first
+
+    Results are delivered through callback(image_path, level, data, error)
+    on a worker thread: data is PNG bytes, or None with an error message.
+    The first request for an image renders and caches every level, so later
+    requests for other levels (zooming) are disk cache hits. GUI code should
+    hop to its own thread (e.g. with a queued Qt signal) before touching
+    widgets.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[Path, int, Optional[bytes], Optional[str]], None],
+        levels: Iterable[int] = PYRAMID_LEVELS,
+        max_workers: Optional[int] = None,
+        disk_cache: Optional[ThumbnailDiskCache] = None,
+    ):
+        """
+        Initialize thumbnail service
+
+        Args:
+            callback: Receives (image_path, level, png_bytes or None, error or None)
+            levels: Square bounding boxes of the pyramid levels
+            max_workers: Worker threads (defaults to min(4, cores))
+            disk_cache: Persistent cache (defaults to ThumbnailDiskCache())
+        """
+        self.callback = callback
+        self.levels = tuple(sorted(levels))
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.disk_cache = disk_cache or ThumbnailDiskCache()
+
+        self._heap = []
+        # Current heap entry per (path, level)
+        self._queued: Dict[Tuple[Path, int], tuple] = {}
+        self._in_flight = set()
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._workers = []
+        self._running = False
+
+        self.stats = {"disk_hits": 0, "rendered": 0, "errors": 0}
+
+    def start(self):
+        """Start the worker threads"""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+
+        for i in range(self.max_workers):
+            worker = threading.Thread(
+                target=self._worker, name=f"thumbnail-{i}", daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def shutdown(self):
+        """Stop the workers, dropping queued requests"""
+        with self._condition:
+            self._running = False
+            self._heap.clear()
+            self._queued.clear()
+            self._condition.notify_all()
+        self._workers = []
+
+    def request(self, image_path: Path, level: int, priority: int = PRIORITY_VISIBLE):
+        """
+        Queue a thumbnail
+
+        Among equal priorities the newest request wins, so items scrolled
+        into view are served before those scrolled past. Re-requesting a
+        queued thumbnail only ever raises its priority.
+
+        Args:
+            image_path: Path to the image file
+            level: Pyramid level (one of self.levels)
+            priority: PRIORITY_VISIBLE or PRIORITY_PREFETCH
+        """
+        self.start()
+        key = (image_path, level)
+        with self._condition:
+            if key in self._in_flight:
+                return
+            queued = self._queued.get(key)
+            if queued is not None and queued[0] < priority:
+                return
+
+            entry = (priority, -next(self._counter), image_path, level)
+            self._queued[key] = entry
+            heapq.heappush(self._heap, entry)
+            self._condition.notify()
+
+    def cancel_pending(self):
+        """Drop queued requests (in-flight renders still complete)"""
+        with self._condition:
+            self._heap.clear()
+            self._queued.clear()
+
+    def pending_count(self) -> int:
+        """Number of queued requests"""
+        with self._condition:
+            return len(self._queued)
+
+    def _next_request(self) -> Optional[Tuple[Path, int]]:
+        """Block until a request is available; None once shut down"""
+        with self._condition:
+            while self._running:
+                while self._heap:
+                    entry = heapq.heappop(self._heap)
+                    key = (entry[2], entry[3])
+                    # Skip entries superseded by a higher priority request
+                    if self._queued.get(key) is entry:
+                        del self._queued[key]
+                        self._in_flight.add(key)
+                        return key
+                self._condition.wait()
+            return None
+
+    def _worker(self):
+        """Serve requests until shutdown"""
+        while True:
+            key = self._next_request()
+            if key is None:
+                return
+
+            image_path, level = key
+            data, error = self.load(image_path, level)
+            with self._condition:
+                self._in_flight.discard(key)
+
+            try:
+                self.callback(image_path, level, data, error)
+            except Exception as e:
+                logger.error(f"Thumbnail callback failed for {image_path}: {e}")
+
+    def load(
+        self, image_path: Path, level: int
+    ) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        Load a thumbnail from the disk cache, rendering the pyramid on a miss
+
+        Returns:
+            Tuple[Optional[bytes], Optional[str]]: (PNG bytes, None) or
+            (None, short error message)
+        """
+        data = self.disk_cache.get(image_path, (level, level))
+        if data is not None:
+            self._count("disk_hits")
+            return data, None
+
+        if not Path(image_path).exists():
+            self._count("errors")
+            return None, "File Not Found"
+
+        try:
+            thumbnails = render_thumbnail_pyramid(image_path, self.levels)
+        except ImportError:
+            self._count("errors")
+            return None, "PIL Required"
+        except Exception as e:
+            logger.debug(f"Error loading image {image_path}: {e}")
+            self._count("errors")
+            return None, "Load Error"
+
+        self._count("rendered")
+        for thumbnail_level, thumbnail in thumbnails.items():
+            self.disk_cache.put(
+                image_path, (thumbnail_level, thumbnail_level), thumbnail
+            )
+        return thumbnails[level], None
+
+    def _count(self, key: str):
+        with self._condition:
+            self.stats[key] += 1
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get service statistics"""
+        return {**self.stats, "pending": self.pending_count()}
+
+
+# Example usage
+def main():
+    """Render thumbnails cold, warm, then at every zoom level"""
+    import sys
+    import time
+
+    image_paths = [Path(p) for p in sys.argv[1:]]
+    if not image_paths:
+        print("Usage: python thumbnail_service.py <image> [<image> ...]")
+        return
+
+    runs = [("cold", [256]), ("warm", [256]), ("zoom", list(PYRAMID_LEVELS))]
+    for label, levels in runs:
+        done = threading.Event()
+        remaining = [len(image_paths) * len(levels)]
+        lock = threading.Lock()
+
+        def on_thumbnail(image_path, level, data, error):
+            with lock:
+                remaining[0] -= 1
+                if remaining[0] == 0:
+                    done.set()
+
+        service = ThumbnailService(on_thumbnail)
+        start_time = time.time()
+        for level in levels:
+            for image_path in image_paths:
+                service.request(image_path, level)
+        done.wait()
+        elapsed = time.time() - start_time
+        service.shutdown()
+
+        count = len(image_paths) * len(levels)
+        print(f"{label}: {count} thumbnails in {elapsed:.2f}s")
+        print(f"  {service.get_statistics()}")
+
+
+if __name__ == "__main__":
+    main()
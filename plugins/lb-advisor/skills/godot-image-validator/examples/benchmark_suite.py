@@ -0,0 +1,679 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite for Godot Image Validator
+
+This module measures the validator on synthetic asset corpora of configurable size and
+formats, against a local fake MCP server with configurable latency and error
+distributions. Scenarios cover single-image analyze_image calls, batched requests and the
+end-to-end headless pipeline (with a cold and a warm result cache). Each scenario runs in
+its own process so peak RSS is measured per scenario, and reports throughput, p50/p95
+latency, retries, fallback rate, cache hit rate and peak RSS.
+
+Usage:
+    python benchmark_suite.py --images 500 --formats png,jpg --latency 0.05
+    python benchmark_suite.py --error-rate 0.1 --timeout-rate 0.02 --output bench.json
+"""
+
+import argparse
+import asyncio
+import hashlib
+import io
+import json
+import logging
+import math
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+try:
+    import resource
+except ImportError:  # Not available on Windows, peak RSS is reported as 0
+    resource = None
+
+from confidence_scorer import ConfidenceScorer
+from mcp_client import BatchConfig, DedupConfig, MCPClient, PreprocessConfig
+from validate_assets import BatchValidator, ResultCache
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Scenarios in the order they run
+SCENARIOS = ("analyze_image", "batch", "headless", "headless_warm")
+
+# Formats the corpus generator can write
+CORPUS_FORMATS = {"png", "jpg", "webp", "bmp", "tga"}
+
+# Categories the fake server answers with
+DEFAULT_CATEGORIES = ["animations", "environments", "ui_elements", "effects"]
+
+# How long a request the fake server drops takes to never answer
+HANG_SECONDS = 3600.0
+
+
+@dataclass
+class CorpusConfig:
+    """Configuration for a synthetic asset corpus"""
+
+    count: int = 200
+    formats: List[str] = field(default_factory=lambda: ["png", "jpg", "webp"])
+    sizes: List[int] = field(default_factory=lambda: [32, 64, 256, 1024])
+    seed: int = 0
+
+    def validate(self):
+        """Validate corpus configuration"""
+        if self.count < 1:
+            raise ValueError("count must be at least 1")
+        unknown = set(self.formats) - CORPUS_FORMATS
+        if unknown or not self.formats:
+            raise ValueError(f"formats must be among {sorted(CORPUS_FORMATS)}")
+        if not self.sizes or min(self.sizes) < 1:
+            raise ValueError("sizes must be positive")
+
+
+def make_corpus(directory: Path, config: CorpusConfig) -> List[Path]:
+    """
+    Write a reproducible corpus of synthetic game assets
+
+    Images cycle through the configured formats and sizes; some are blocky
+    pixel art with transparency, the rest smooth noise, so file sizes and
+    decode costs vary like in a real project.
+
+    Args:
+        directory: Folder to write the images to
+        config: Corpus configuration
+
+    Returns:
+        List[Path]: Paths of the written images
+    """
+    import numpy as np
+    from PIL import Image
+
+    config.validate()
+    directory.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(config.seed)
+    names = ["player_sprite", "ui_button", "texture", "particle", "background"]
+
+    image_paths = []
+    for i in range(config.count):
+        size = config.sizes[i % len(config.sizes)]
+        image_format = config.formats[i % len(config.formats)]
+        pixel_art = i % 3 == 0
+        block = max(1, size // 16) if pixel_art else max(1, size // 64)
+
+        cells = max(1, size // block)
+        pixels = rng.integers(0, 256, size=(cells, cells, 4), dtype=np.uint8)
+        if pixel_art:
+            pixels[..., 3] = np.where(pixels[..., 3] > 64, 255, 0)
+        else:
+            pixels[..., 3] = 255
+        resample = Image.Resampling.NEAREST if pixel_art else Image.Resampling.BICUBIC
+        image = Image.fromarray(pixels, "RGBA").resize((size, size), resample)
+        if image_format in ("jpg", "bmp"):
+            image = image.convert("RGB")
+
+        image_path = directory / f"{names[i % len(names)]}_{i:05d}.{image_format}"
+        image.save(image_path)
+        image_paths.append(image_path)
+    return image_paths
+
+
+def corpus_paths(directory: Path) -> List[Path]:
+    """Images of a corpus written by make_corpus"""
+    return sorted(
+        p
+        for p in Path(directory).iterdir()
+        if p.suffix.lstrip(".").lower() in CORPUS_FORMATS
+    )
+
+
+@dataclass
+class FakeServerConfig:
+    """Latency and error distributions of the fake MCP server"""
+
+    latency: float = 0.05  # Median primary call latency (seconds)
+    latency_sigma: float = 0.5  # Spread of the log-normal latency
+    batch_latency_per_image: float = 0.01  # Added per image of a batch
+    fallback_latency: float = 0.03  # Median fallback call latency
+    error_rate: float = 0.0  # Share of primary calls answering with an error
+    timeout_rate: float = 0.0  # Share of primary calls never answering
+    fallback_error_rate: float = 0.0  # Share of fallback calls failing
+    capacity: int = 0  # Requests served at once (0 = unlimited)
+    seed: int = 0
+
+    def validate(self):
+        """Validate fake server configuration"""
+        if min(self.latency, self.batch_latency_per_image, self.fallback_latency) < 0:
+            raise ValueError("latencies must not be negative")
+        if self.latency_sigma < 0:
+            raise ValueError("latency_sigma must not be negative")
+        for name in ("error_rate", "timeout_rate", "fallback_error_rate"):
+            if not 0.0 <= getattr(self, name) <= 1.0:
+                raise ValueError(f"{name} must be between 0.0 and 1.0")
+        if self.error_rate + self.timeout_rate > 1.0:
+            raise ValueError("error_rate and timeout_rate add up to more than 1.0")
+        if self.capacity < 0:
+            raise ValueError("capacity must not be negative")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return asdict(self)
+
+
+class FakeServerError(Exception):
+    """Error response from the fake MCP server"""
+
+
+class FakeMCPServer:
+    """
+    Local stand-in for the MCP image analysis tools
+
+    Implements the tool_server interface of MCPClient. Latencies are drawn
+    from a log-normal distribution around the configured median, and a
+    configurable share of calls fail or never answer, which exercises the
+    client's timeouts, retries and fallback. Answers are deterministic per
+    image source.
+    """
+
+    def __init__(
+        self, config: FakeServerConfig, categories: Optional[List[str]] = None
+    ):
+        """
+        Initialize fake server
+
+        Args:
+            config: Latency and error distributions
+            categories: Categories to answer with
+        """
+        config.validate()
+        self.config = config
+        self.categories = categories or DEFAULT_CATEGORIES
+        self.calls: Dict[str, int] = {}
+        self.errors = 0
+        self.timeouts = 0
+        self._random = random.Random(config.seed)
+        self._capacity = None
+
+    async def _serve(
+        self, tool: str, latency: float, error_rate: float, hang_rate: float
+    ):
+        """Simulate one request: queue for capacity, take time, maybe fail"""
+        self.calls[tool] = self.calls.get(tool, 0) + 1
+        if self.config.capacity and self._capacity is None:
+            self._capacity = asyncio.Semaphore(self.config.capacity)
+
+        outcome = self._random.random()
+        duration = latency
+        if latency > 0 and self.config.latency_sigma > 0:
+            duration = self._random.lognormvariate(
+                math.log(latency), self.config.latency_sigma
+            )
+
+        if self._capacity is not None:
+            await self._capacity.acquire()
+        try:
+            if outcome < hang_rate:
+                self.timeouts += 1
+                await asyncio.sleep(HANG_SECONDS)
+            await asyncio.sleep(duration)
+        finally:
+            if self._capacity is not None:
+                self._capacity.release()
+
+        if outcome < hang_rate + error_rate:
+            self.errors += 1
+            raise FakeServerError(f"{tool}: simulated server error")
+
+    def _answer(self, image_source: str, confidence_modifier: float = 0.0) -> Dict:
+        """Deterministic analysis of an image source"""
+        digest = int(hashlib.md5(image_source.encode("utf-8")).hexdigest()[:8], 16)
+        return {
+            "category": self.categories[digest % len(self.categories)],
+            "confidence": min(1.0, 0.5 + (digest % 50) / 100.0 + confidence_modifier),
+            "issues": [],
+            "metadata": {"fake_server": True},
+        }
+
+    async def analyze_image(self, image_source: str, prompt: str) -> Dict[str, Any]:
+        """Primary analyze_image tool"""
+        await self._serve(
+            "analyze_image",
+            self.config.latency,
+            self.config.error_rate,
+            self.config.timeout_rate,
+        )
+        return self._answer(image_source)
+
+    async def analyze_images(
+        self, image_sources: List[str], prompt: str
+    ) -> Dict[str, Any]:
+        """Primary analyze_image tool with a multi-image payload"""
+        await self._serve(
+            "analyze_images",
+            self.config.latency
+            + self.config.batch_latency_per_image * len(image_sources),
+            self.config.error_rate,
+            self.config.timeout_rate,
+        )
+        return {
+            "results": [
+                {"index": index, "image_path": source, **self._answer(source)}
+                for index, source in enumerate(image_sources)
+            ]
+        }
+
+    async def analyze_image_fallback(
+        self, image_source: str, prompt: str
+    ) -> Dict[str, Any]:
+        """Fallback analysis tool"""
+        await self._serve(
+            "analyze_image_fallback",
+            self.config.fallback_latency,
+            self.config.fallback_error_rate,
+            0.0,
+        )
+        return self._answer(image_source, confidence_modifier=-0.1)
+
+
+@dataclass
+class BenchmarkConfig:
+    """Client settings and fake server behaviour shared by all scenarios"""
+
+    concurrency: int = 8
+    timeout: float = 2.0  # Client request timeout (seconds)
+    max_retries: int = 3
+    retry_delay: float = 0.05  # Scaled down from the client default of 2s
+    preprocess: bool = False
+    dedup: bool = False
+    server: FakeServerConfig = field(default_factory=FakeServerConfig)
+
+    def validate(self):
+        """Validate benchmark configuration"""
+        if self.concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if self.timeout <= 0:
+            raise ValueError("timeout must be positive")
+        self.server.validate()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BenchmarkConfig":
+        """Create from dictionary"""
+        data = dict(data)
+        data["server"] = FakeServerConfig(**data.get("server", {}))
+        return cls(**data)
+
+
+@dataclass
+class ScenarioResult:
+    """Measurements of one benchmark scenario"""
+
+    scenario: str
+    images: int
+    elapsed: float
+    throughput: float  # Images per second
+    latency_p50: float  # Seconds per image
+    latency_p95: float
+    success_rate: float
+    retries: int  # Retry attempts that led to a result
+    fallback_rate: float  # Share of images answered by the fallback tool
+    cache_hit_rate: float  # Share of images served without an MCP call
+    peak_rss_mb: float  # Peak resident memory of the scenario's process,
+    # not counting the technical pre-analysis worker processes
+    server_calls: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return asdict(self)
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0-100) of a list of values"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB"""
+    # Linux keeps ru_maxrss across exec, so a child would report its parent's
+    # peak; the high-water mark in /proc belongs to this process image only
+    try:
+        with open("/proc/self/status", "r", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def make_client(config: BenchmarkConfig, server: FakeMCPServer, **kwargs) -> MCPClient:
+    """MCP client talking to the fake server"""
+    return MCPClient(
+        timeout=config.timeout,
+        max_retries=config.max_retries,
+        retry_delay=config.retry_delay,
+        preprocess_config=PreprocessConfig() if config.preprocess else None,
+        dedup_config=DedupConfig() if config.dedup else None,
+        tool_server=server,
+        **kwargs,
+    )
+
+
+def client_result(
+    scenario: str,
+    client: MCPClient,
+    server: FakeMCPServer,
+    latencies: List[float],
+    elapsed: float,
+    images: int,
+    cache_hits: int = 0,
+    successes: Optional[int] = None,
+) -> ScenarioResult:
+    """Collect the measurements of a finished scenario"""
+    stats = client.get_statistics()
+    if successes is None:
+        successes = stats["successful_requests"]
+    return ScenarioResult(
+        scenario=scenario,
+        images=images,
+        elapsed=round(elapsed, 3),
+        throughput=round(images / elapsed, 2) if elapsed > 0 else 0.0,
+        latency_p50=round(percentile(latencies, 50), 4),
+        latency_p95=round(percentile(latencies, 95), 4),
+        success_rate=round(successes / images, 4) if images else 0.0,
+        retries=stats["retry_attempts"],
+        fallback_rate=round(stats["fallback_used"] / images, 4) if images else 0.0,
+        cache_hit_rate=(
+            round((cache_hits + stats["duplicates_skipped"]) / images, 4)
+            if images
+            else 0.0
+        ),
+        peak_rss_mb=round(peak_rss_mb(), 1),
+        server_calls=sum(server.calls.values()),
+    )
+
+
+async def bench_analyze_image(
+    image_paths: List[Path], config: BenchmarkConfig
+) -> ScenarioResult:
+    """Individual analyze_image calls with bounded concurrency"""
+    server = FakeMCPServer(config.server)
+    client = make_client(config, server)
+    semaphore = asyncio.Semaphore(config.concurrency)
+
+    async def analyze(image_path: Path):
+        async with semaphore:
+            return await client.analyze_image(image_path)
+
+    start_time = time.perf_counter()
+    results = await asyncio.gather(*(analyze(p) for p in image_paths))
+    elapsed = time.perf_counter() - start_time
+
+    latencies = [r.processing_time for r in results]
+    return client_result(
+        "analyze_image", client, server, latencies, elapsed, len(image_paths)
+    )
+
+
+async def bench_batch(
+    image_paths: List[Path], config: BenchmarkConfig
+) -> ScenarioResult:
+    """Small images packed into multi-image requests"""
+    server = FakeMCPServer(config.server)
+    client = make_client(config, server, batch_config=BatchConfig())
+
+    start_time = time.perf_counter()
+    results = await client.analyze_batch(image_paths)
+    elapsed = time.perf_counter() - start_time
+
+    latencies = [r.processing_time for r in results]
+    return client_result("batch", client, server, latencies, elapsed, len(image_paths))
+
+
+async def bench_headless(
+    image_paths: List[Path], config: BenchmarkConfig, cache_path: Path, scenario: str
+) -> ScenarioResult:
+    """The headless validate_assets pipeline, including its result cache"""
+    server = FakeMCPServer(config.server)
+    client = make_client(config, server)
+    confidence_scorer = ConfidenceScorer()
+    cache = ResultCache(cache_path, "benchmark")
+    output = io.StringIO()
+
+    validator = BatchValidator(
+        client, confidence_scorer, output, config.concurrency, cache
+    )
+    start_time = time.perf_counter()
+    try:
+        await validator.run(image_paths)
+    finally:
+        confidence_scorer.shutdown()
+    elapsed = time.perf_counter() - start_time
+    cache.save()
+
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+    latencies = [
+        r["processing_time"]
+        for r in records
+        if not r["cached"] and "processing_time" in r
+    ]
+    return client_result(
+        scenario,
+        client,
+        server,
+        latencies,
+        elapsed,
+        len(image_paths),
+        cache_hits=cache.hits,
+        successes=sum(1 for r in records if r.get("success")),
+    )
+
+
+def run_scenario(
+    scenario: str, corpus_dir: Path, config: BenchmarkConfig
+) -> ScenarioResult:
+    """
+    Run one scenario in this process
+
+    Args:
+        scenario: One of SCENARIOS
+        corpus_dir: Folder written by make_corpus
+        config: Benchmark configuration
+
+    Returns:
+        ScenarioResult: Measurements of the scenario
+    """
+    image_paths = corpus_paths(corpus_dir)
+    cache_path = corpus_dir / "result-cache.json"
+
+    if scenario == "analyze_image":
+        return asyncio.run(bench_analyze_image(image_paths, config))
+    if scenario == "batch":
+        return asyncio.run(bench_batch(image_paths, config))
+    if scenario == "headless":
+        cache_path.unlink(missing_ok=True)
+        return asyncio.run(bench_headless(image_paths, config, cache_path, scenario))
+    if scenario == "headless_warm":
+        if not cache_path.exists():
+            # Fill the cache first when the cold scenario didn't run
+            asyncio.run(bench_headless(image_paths, config, cache_path, scenario))
+        return asyncio.run(bench_headless(image_paths, config, cache_path, scenario))
+    raise ValueError(f"Unknown scenario: {scenario}")
+
+
+def run_isolated(
+    scenario: str, corpus_dir: Path, config: BenchmarkConfig
+) -> ScenarioResult:
+    """Run one scenario in a fresh interpreter so its peak RSS is its own"""
+    completed = subprocess.run(
+        [
+            sys.executable,
+            str(Path(__file__).resolve()),
+            "--scenario",
+            scenario,
+            "--corpus-dir",
+            str(corpus_dir),
+            "--config-json",
+            json.dumps(config.to_dict()),
+        ],
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(
+            f"Scenario {scenario} failed:\n{completed.stderr.strip()[-2000:]}"
+        )
+    return ScenarioResult(**json.loads(completed.stdout.strip().splitlines()[-1]))
+
+
+def format_table(results: List[ScenarioResult]) -> str:
+    """Human readable summary of scenario results"""
+    header = (
+        f"{'scenario':<14} {'images':>6} {'img/s':>8} {'p50 ms':>8} {'p95 ms':>8} "
+        f"{'ok':>6} {'retries':>7} {'fallbk':>6} {'cache':>6} {'RSS MB':>7} {'calls':>6}"
+    )
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r.scenario:<14} {r.images:>6} {r.throughput:>8.1f} "
+            f"{r.latency_p50 * 1000:>8.1f} {r.latency_p95 * 1000:>8.1f} "
+            f"{r.success_rate:>6.1%} {r.retries:>7} {r.fallback_rate:>6.1%} "
+            f"{r.cache_hit_rate:>6.1%} {r.peak_rss_mb:>7.1f} {r.server_calls:>6}"
+        )
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Command line arguments"""
+    parser = argparse.ArgumentParser(
+        prog="benchmark_suite",
+        description="Benchmark the image validator against a fake MCP server",
+    )
+    corpus = parser.add_argument_group("corpus")
+    corpus.add_argument("--images", type=int, default=200, help="Corpus size")
+    corpus.add_argument("--formats", default="png,jpg,webp", help="Comma-separated")
+    corpus.add_argument("--sizes", default="32,64,256,1024", help="Edge lengths")
+    corpus.add_argument("--seed", type=int, default=0)
+    corpus.add_argument("--corpus-dir", help="Reuse or keep the corpus in this folder")
+
+    server = parser.add_argument_group("fake server")
+    server.add_argument("--latency", type=float, default=0.05, help="Median seconds")
+    server.add_argument("--latency-sigma", type=float, default=0.5)
+    server.add_argument("--error-rate", type=float, default=0.0)
+    server.add_argument("--timeout-rate", type=float, default=0.0)
+    server.add_argument("--fallback-error-rate", type=float, default=0.0)
+    server.add_argument("--capacity", type=int, default=0, help="0 = unlimited")
+
+    client = parser.add_argument_group("client")
+    client.add_argument("-j", "--concurrency", type=int, default=8)
+    client.add_argument("--timeout", type=float, default=2.0)
+    client.add_argument("--max-retries", type=int, default=3)
+    client.add_argument("--retry-delay", type=float, default=0.05)
+    client.add_argument("--preprocess", action="store_true")
+    client.add_argument("--dedup", action="store_true")
+
+    parser.add_argument(
+        "--scenarios", default=",".join(SCENARIOS), help="Comma-separated subset"
+    )
+    parser.add_argument("--output", help="Write results and settings as JSON")
+    # Used by run_isolated to run a single scenario in a child process
+    parser.add_argument("--scenario", help=argparse.SUPPRESS)
+    parser.add_argument("--config-json", help=argparse.SUPPRESS)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark suite and return the process exit code"""
+    args = build_parser().parse_args(argv)
+
+    if args.scenario:
+        # Child process: one scenario, result as the last stdout line
+        logging.getLogger().setLevel(logging.ERROR)
+        config = BenchmarkConfig.from_dict(json.loads(args.config_json))
+        result = run_scenario(args.scenario, Path(args.corpus_dir), config)
+        print(json.dumps(result.to_dict()))
+        return 0
+
+    try:
+        corpus_config = CorpusConfig(
+            count=args.images,
+            formats=[f.strip().lower() for f in args.formats.split(",") if f.strip()],
+            sizes=[int(s) for s in args.sizes.split(",") if s.strip()],
+            seed=args.seed,
+        )
+        corpus_config.validate()
+        config = BenchmarkConfig(
+            concurrency=args.concurrency,
+            timeout=args.timeout,
+            max_retries=args.max_retries,
+            retry_delay=args.retry_delay,
+            preprocess=args.preprocess,
+            dedup=args.dedup,
+            server=FakeServerConfig(
+                latency=args.latency,
+                latency_sigma=args.latency_sigma,
+                error_rate=args.error_rate,
+                timeout_rate=args.timeout_rate,
+                fallback_error_rate=args.fallback_error_rate,
+                capacity=args.capacity,
+                seed=args.seed,
+            ),
+        )
+        config.validate()
+        scenarios = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+        unknown = set(scenarios) - set(SCENARIOS)
+        if unknown:
+            raise ValueError(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+    except ValueError as e:
+        print(f"benchmark_suite: {e}", file=sys.stderr)
+        return 2
+
+    with tempfile.TemporaryDirectory(prefix="validator-bench-") as temp_dir:
+        corpus_dir = Path(args.corpus_dir or temp_dir)
+        if not corpus_dir.exists() or not corpus_paths(corpus_dir):
+            start_time = time.perf_counter()
+            make_corpus(corpus_dir, corpus_config)
+            print(
+                f"Wrote {corpus_config.count} images to {corpus_dir} in "
+                f"{time.perf_counter() - start_time:.1f}s",
+                file=sys.stderr,
+            )
+
+        results = []
+        for scenario in scenarios:
+            print(f"Running {scenario}...", file=sys.stderr)
+            results.append(run_isolated(scenario, corpus_dir, config))
+
+    print(format_table(results))
+    if args.output:
+        report = {
+            "corpus": asdict(corpus_config),
+            "config": config.to_dict(),
+            "python": sys.version.split()[0],
+            "cpu_count": os.cpu_count(),
+            "results": [r.to_dict() for r in results],
+        }
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
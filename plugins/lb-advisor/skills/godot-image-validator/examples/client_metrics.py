@@ -0,0 +1,524 @@
+#!/usr/bin/env python3
+"""
+Client Metrics and Tracing for Godot Image Validator
+
+This module instruments the MCP client. It keeps latency histograms per request path
+(primary, retry, fallback, batch), queue-wait and service-time histograms, in-flight
+gauges, byte counters and a sliding-window throughput. Every analysis is recorded as a
+trace of OpenTelemetry-compatible spans, which a file exporter writes as OTLP/JSON lines
+so traces work offline and can later be loaded by any OTLP-aware tool.
+"""
+
+import atexit
+import bisect
+import contextvars
+import json
+import logging
+import math
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Request paths with their own latency histogram
+LATENCY_PATHS = ("total", "primary", "retry", "fallback", "batch")
+
+# Histogram bucket upper bounds in seconds: 1ms to ~2 minutes, 25% apart,
+# so percentiles read from buckets are within about 12% of the true value
+BUCKET_BOUNDS = tuple(0.001 * 1.25**i for i in range(53))
+
+# Window for the live throughput
+THROUGHPUT_WINDOW = 10.0
+
+# Spans buffered before the exporter writes a line
+EXPORT_BATCH_SIZE = 64
+
+# OTLP enum values
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_CLIENT = 3
+STATUS_CODE_UNSET = 0
+STATUS_CODE_OK = 1
+STATUS_CODE_ERROR = 2
+
+SERVICE_NAME = "godot-image-validator"
+
+# Span of the operation running in the current task, for parenting
+_current_span: contextvars.ContextVar = contextvars.ContextVar(
+    "current_span", default=None
+)
+
+# Start time and queue-wait state of the request running in the current task
+_request_state: contextvars.ContextVar = contextvars.ContextVar(
+    "request_state", default=None
+)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with approximate percentiles"""
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)  # Last bucket is overflow
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        """Add one observation"""
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q: float) -> float:
+        """
+        Estimate a percentile by interpolating within its bucket
+
+        Args:
+            q: Percentile (0-100)
+
+        Returns:
+            float: Estimated latency in seconds (0.0 when empty)
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = q / 100.0 * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = BUCKET_BOUNDS[index - 1] if index > 0 else 0.0
+                upper = BUCKET_BOUNDS[index] if index < len(BUCKET_BOUNDS) else self.max
+                estimate = lower + (upper - lower) * (rank - seen) / bucket_count
+                return min(max(estimate, self.min), self.max)
+            seen += bucket_count
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary for statistics and JSON serialization"""
+        if self.count == 0:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 4),
+            "min": round(self.min, 4),
+            "max": round(self.max, 4),
+            "p50": round(self.percentile(50), 4),
+            "p90": round(self.percentile(90), 4),
+            "p95": round(self.percentile(95), 4),
+            "p99": round(self.percentile(99), 4),
+        }
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    """Attribute value in OTLP/JSON encoding"""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}  # int64 is a string in OTLP/JSON
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class Span:
+    """One timed operation of a trace"""
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        parent: Optional["Span"],
+        kind: int,
+        attributes: Optional[Dict[str, Any]],
+    ):
+        self.tracer = tracer
+        self.name = name
+        self.kind = kind
+        self.trace_id = parent.trace_id if parent else os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.parent_span_id = parent.span_id if parent else None
+        self.attributes = dict(attributes or {})
+        self.status_code = STATUS_CODE_UNSET
+        self.status_message = ""
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+
+    def set_attribute(self, key: str, value: Any):
+        """Set an attribute (OTel semantic names where they exist)"""
+        self.attributes[key] = value
+
+    def set_error(self, message: str):
+        """Mark the operation as failed"""
+        self.status_code = STATUS_CODE_ERROR
+        self.status_message = message or "error"
+
+    def end(self):
+        """Finish the span and hand it to the exporter"""
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+            if self.status_code == STATUS_CODE_UNSET:
+                self.status_code = STATUS_CODE_OK
+            self.tracer.export(self)
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """Span in OTLP/JSON encoding"""
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)}
+                for key, value in self.attributes.items()
+                if value is not None
+            ],
+            "status": {"code": self.status_code},
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+        return span
+
+
+class FileSpanExporter:
+    """
+    Writes finished spans to a local file as OTLP/JSON lines
+
+    Each line is a complete ExportTraceServiceRequest, the format of the
+    OpenTelemetry Collector's file exporter, so the file can be replayed
+    into a collector or opened by trace viewers that read OTLP/JSON.
+    """
+
+    def __init__(self, file_path: Path, batch_size: int = EXPORT_BATCH_SIZE):
+        """
+        Initialize exporter
+
+        Args:
+            file_path: File spans are appended to
+            batch_size: Spans buffered before a line is written
+        """
+        self.file_path = Path(file_path)
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self._buffer: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def export(self, span: Span):
+        """Buffer a finished span, writing a line when the batch is full"""
+        with self._lock:
+            self._buffer.append(span.to_otlp())
+            if len(self._buffer) >= self.batch_size:
+                self._write_locked()
+
+    def flush(self):
+        """Write all buffered spans"""
+        with self._lock:
+            self._write_locked()
+
+    def _write_locked(self):
+        if not self._buffer:
+            return
+        request = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {
+                                "key": "service.name",
+                                "value": {"stringValue": SERVICE_NAME},
+                            }
+                        ]
+                    },
+                    "scopeSpans": [
+                        {"scope": {"name": "mcp_client"}, "spans": self._buffer}
+                    ],
+                }
+            ]
+        }
+        self._buffer = []
+        try:
+            with open(self.file_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(request, separators=(",", ":")) + "\n")
+        except OSError as e:
+            logger.warning(f"Could not write spans to {self.file_path}: {e}")
+
+    def shutdown(self):
+        """Flush and stop exporting at interpreter exit"""
+        self.flush()
+        atexit.unregister(self.flush)
+
+
+class Tracer:
+    """Creates spans, parented to the span of the current task"""
+
+    def __init__(self, exporter: Optional[FileSpanExporter] = None):
+        """
+        Initialize tracer
+
+        Args:
+            exporter: Destination of finished spans (None drops them)
+        """
+        self.exporter = exporter
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        kind: int = SPAN_KIND_INTERNAL,
+    ) -> Iterator[Span]:
+        """Run a block as a span that is current for nested spans"""
+        span = Span(self, name, _current_span.get(), kind, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.set_error(repr(e))
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+
+    def export(self, span: Span):
+        """Pass a finished span to the exporter"""
+        if self.exporter is not None:
+            self.exporter.export(span)
+
+    def shutdown(self):
+        """Flush pending spans"""
+        if self.exporter is not None:
+            self.exporter.shutdown()
+
+
+class ClientMetrics:
+    """
+    Latency, concurrency and throughput metrics of an MCP client
+
+    Updated from the client's event loop and read from any thread (the UI
+    polls it for the status bar), so all state is guarded by a lock.
+    """
+
+    def __init__(self, tracer: Optional[Tracer] = None):
+        """
+        Initialize metrics
+
+        Args:
+            tracer: Tracer recording spans (spans are dropped if omitted)
+        """
+        self.tracer = tracer or Tracer()
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Clear all metrics"""
+        with self._lock:
+            self.latency = {path: LatencyHistogram() for path in LATENCY_PATHS}
+            self.queue_wait = LatencyHistogram()
+            self.service_time = LatencyHistogram()
+            self.in_flight_requests = 0
+            self.in_flight_calls = 0
+            self.max_in_flight_requests = 0
+            self.max_in_flight_calls = 0
+            self.tool_calls = 0
+            # Payload bytes of all tool calls, retries included
+            self.bytes_requested = 0
+            self._completions: deque = deque()
+
+    @contextmanager
+    def request(self, image_path: Path) -> Iterator[Span]:
+        """
+        Track one analyze_image call from entry to result
+
+        Yields:
+            Span: The request's root span
+        """
+        start = time.perf_counter()
+        with self._lock:
+            self.in_flight_requests += 1
+            self.max_in_flight_requests = max(
+                self.max_in_flight_requests, self.in_flight_requests
+            )
+        state = {"start": start, "sent": False}
+        token = _request_state.set(state)
+        try:
+            with self.tracer.span(
+                "analyze_image", {"image.path": str(image_path)}
+            ) as span:
+                yield span
+        finally:
+            _request_state.reset(token)
+            now = time.perf_counter()
+            with self._lock:
+                self.in_flight_requests -= 1
+                self.latency["total"].record(now - start)
+                self._completions.append(time.monotonic())
+
+    def request_start(self) -> Optional[float]:
+        """perf_counter start of the current request, if any"""
+        state = _request_state.get()
+        return state["start"] if state else None
+
+    def mark_sent(self):
+        """Note that the current request's queue wait was recorded elsewhere"""
+        state = _request_state.get()
+        if state is not None:
+            state["sent"] = True
+
+    @staticmethod
+    def detach():
+        """
+        Run the rest of the current task outside any request
+
+        For tasks doing work shared by several requests, such as a batch,
+        which would otherwise inherit the request that created them.
+        """
+        _request_state.set(None)
+        _current_span.set(None)
+
+    def record_queue_wait(self, seconds: float):
+        """Record the time an image waited before its request was sent"""
+        with self._lock:
+            self.queue_wait.record(seconds)
+
+    @contextmanager
+    def tool_call(
+        self,
+        path: str,
+        tool: str,
+        payload_bytes: int = 0,
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Span]:
+        """
+        Track one MCP tool call
+
+        The first call of a request also records the request's queue wait.
+
+        Args:
+            path: Request path (primary, retry, fallback or batch)
+            tool: Tool name
+            payload_bytes: Size of the image data sent
+            attributes: Extra span attributes
+
+        Yields:
+            Span: The tool call's span
+        """
+        state = _request_state.get()
+        start = time.perf_counter()
+        if state is not None and not state["sent"]:
+            state["sent"] = True
+            self.record_queue_wait(start - state["start"])
+
+        with self._lock:
+            self.in_flight_calls += 1
+            self.max_in_flight_calls = max(
+                self.max_in_flight_calls, self.in_flight_calls
+            )
+            self.tool_calls += 1
+            self.bytes_requested += payload_bytes
+        try:
+            with self.tracer.span(
+                f"mcp.{tool}",
+                {
+                    "mcp.tool": tool,
+                    "mcp.path": path,
+                    "request.bytes": payload_bytes,
+                    **(attributes or {}),
+                },
+                kind=SPAN_KIND_CLIENT,
+            ) as span:
+                yield span
+        finally:
+            duration = time.perf_counter() - start
+            with self._lock:
+                self.in_flight_calls -= 1
+                self.latency[path].record(duration)
+                self.service_time.record(duration)
+
+    def throughput(self, window: float = THROUGHPUT_WINDOW) -> float:
+        """Completed requests per second over the last window"""
+        now = time.monotonic()
+        with self._lock:
+            while self._completions and self._completions[0] < now - window:
+                self._completions.popleft()
+            return len(self._completions) / window
+
+    def snapshot(self) -> Dict[str, Any]:
+        """All metrics as a JSON-ready dictionary"""
+        throughput = self.throughput()
+        with self._lock:
+            return {
+                "latency": {
+                    path: histogram.to_dict()
+                    for path, histogram in self.latency.items()
+                },
+                "queue_wait": self.queue_wait.to_dict(),
+                "service_time": self.service_time.to_dict(),
+                "in_flight": {
+                    "requests": self.in_flight_requests,
+                    "tool_calls": self.in_flight_calls,
+                    "max_requests": self.max_in_flight_requests,
+                    "max_tool_calls": self.max_in_flight_calls,
+                },
+                "tool_calls": self.tool_calls,
+                "bytes_requested": self.bytes_requested,
+                "throughput_per_second": round(throughput, 2),
+            }
+
+
+# Example usage
+def main():
+    """Record a few simulated requests and print the metrics and trace file"""
+    import asyncio
+    import random
+    import tempfile
+
+    trace_path = Path(tempfile.gettempdir()) / "mcp_client_spans.jsonl"
+    trace_path.unlink(missing_ok=True)
+    tracer = Tracer(FileSpanExporter(trace_path))
+    metrics = ClientMetrics(tracer)
+
+    async def fake_request(i: int):
+        with metrics.request(Path(f"sprite_{i}.png")):
+            await asyncio.sleep(random.uniform(0.0, 0.02))  # Preparing the upload
+            with metrics.tool_call("primary", "analyze_image", 4096) as span:
+                await asyncio.sleep(random.lognormvariate(math.log(0.05), 0.5))
+                if i % 7 == 0:
+                    span.set_error("simulated failure")
+            if i % 7 == 0:
+                with metrics.tool_call(
+                    "retry", "analyze_image", 4096, {"retry.attempt": 1}
+                ):
+                    await asyncio.sleep(0.05)
+
+    async def run():
+        await asyncio.gather(*(fake_request(i) for i in range(50)))
+
+    asyncio.run(run())
+    tracer.shutdown()
+
+    print(json.dumps(metrics.snapshot(), indent=2))
+    lines = trace_path.read_text(encoding="utf-8").splitlines()
+    spans = sum(
+        len(scope["spans"])
+        for line in lines
+        for resource in json.loads(line)["resourceSpans"]
+        for scope in resource["scopeSpans"]
+    )
+    print(f"\nWrote {spans} spans in {len(lines)} OTLP/JSON lines to {trace_path}")
+
+
+if __name__ == "__main__":
+    main()
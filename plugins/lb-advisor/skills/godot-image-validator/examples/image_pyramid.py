@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Image Pyramid for Godot Image Validator
+
+This module prepares images for the manual review dialog off the GUI thread. Each image
+is decoded once into a mipmap pyramid (full resolution, then repeated 2x reductions)
+plus a high-quality preview scaled to the dialog, and levels are cut into tiles so a
+zoomed view only converts the tiles it shows. A prefetcher builds pyramids for the
+images around the current review position, within a memory budget.
+"""
+
+import logging
+import math
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Bounding box of the pre-scaled review preview
+DEFAULT_PREVIEW_SIZE = (650, 450)
+
+# Edge length of the square tiles levels are cut into
+DEFAULT_TILE_SIZE = 512
+
+
+class ImagePyramid:
+    """
+    Decoded image as a mipmap pyramid with a pre-scaled preview
+
+    Level 0 is the full-resolution image and each further level halves
+    both dimensions, down to the first level that fits the preview box.
+    Any zoom factor can then be drawn from the smallest level that is at
+    least as detailed, without decoding the file again.
+    """
+
+    def __init__(
+        self,
+        image,
+        preview_size: Tuple[int, int] = DEFAULT_PREVIEW_SIZE,
+        tile_size: int = DEFAULT_TILE_SIZE,
+    ):
+        """
+        Build a pyramid from a decoded image
+
+        Args:
+            image: PIL image (converted to RGB or RGBA)
+            preview_size: Bounding box of the preview
+            tile_size: Edge length of level tiles
+        """
+        from PIL import Image
+
+        # Keep transparency
+        if image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info:
+            mode = "RGBA"
+        else:
+            mode = "RGB"
+        image = image.convert(mode) if image.mode != mode else image
+
+        self.size = image.size
+        self.tile_size = tile_size
+        self.levels = [image]
+        while (
+            self.levels[-1].width > preview_size[0]
+            or self.levels[-1].height > preview_size[1]
+        ) and min(self.levels[-1].size) >= 2:
+            # Box reduction: fast and alias-free for exact halving
+            self.levels.append(self.levels[-1].reduce(2))
+
+        # The preview is resampled once with a high-quality filter
+        self.preview = self.levels[-1].copy()
+        self.preview.thumbnail(preview_size, Image.Resampling.LANCZOS)
+
+    @classmethod
+    def from_path(
+        cls,
+        image_path: Path,
+        preview_size: Tuple[int, int] = DEFAULT_PREVIEW_SIZE,
+        tile_size: int = DEFAULT_TILE_SIZE,
+    ) -> "ImagePyramid":
+        """Decode an image file into a pyramid"""
+        from PIL import Image
+
+        with Image.open(image_path) as img:
+            img.load()
+            return cls(img, preview_size, tile_size)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by all levels and the preview"""
+        images = self.levels + [self.preview]
+        return sum(img.width * img.height * len(img.getbands()) for img in images)
+
+    def level_for_scale(self, scale: float) -> Tuple[int, float]:
+        """
+        Pick the smallest level with at least the detail a zoom factor needs
+
+        Args:
+            scale: Displayed size relative to full resolution
+
+        Returns:
+            Tuple[int, float]: (level index, that level's scale)
+        """
+        if scale >= 1.0:
+            return 0, 1.0
+        level = min(int(math.floor(-math.log2(scale))), len(self.levels) - 1)
+        return level, self.level_scale(level)
+
+    def level_scale(self, level: int) -> float:
+        """Size of a level relative to full resolution"""
+        return self.levels[level].width / self.size[0]
+
+    def tile_grid(self, level: int) -> Tuple[int, int]:
+        """(columns, rows) of tiles in a level"""
+        width, height = self.levels[level].size
+        return (
+            math.ceil(width / self.tile_size),
+            math.ceil(height / self.tile_size),
+        )
+
+    def tile_box(self, level: int, column: int, row: int) -> Tuple[int, int, int, int]:
+        """Pixel box (left, top, right, bottom) of a tile within its level"""
+        width, height = self.levels[level].size
+        left = column * self.tile_size
+        top = row * self.tile_size
+        return (
+            left,
+            top,
+            min(left + self.tile_size, width),
+            min(top + self.tile_size, height),
+        )
+
+    def tile(self, level: int, column: int, row: int):
+        """Crop one tile of a level"""
+        return self.levels[level].crop(self.tile_box(level, column, row))
+
+    def visible_tiles(
+        self, level: int, box: Tuple[float, float, float, float]
+    ) -> List[Tuple[int, int]]:
+        """
+        Tiles of a level intersecting a box in that level's pixels
+
+        Args:
+            level: Level index
+            box: (left, top, right, bottom) in level pixels
+
+        Returns:
+            List[Tuple[int, int]]: (column, row) of each intersecting tile
+        """
+        columns, rows = self.tile_grid(level)
+        first_column = max(0, int(box[0] // self.tile_size))
+        first_row = max(0, int(box[1] // self.tile_size))
+        last_column = min(columns - 1, int(max(box[2] - 1, 0) // self.tile_size))
+        last_row = min(rows - 1, int(max(box[3] - 1, 0) // self.tile_size))
+        return [
+            (column, row)
+            for row in range(first_row, last_row + 1)
+            for column in range(first_column, last_column + 1)
+        ]
+
+
+class ReviewPrefetcher:
+    """
+    Builds image pyramids in the background ahead of the reviewer
+
+    get() returns a Future for any image, starting the work if needed;
+    prefetch() queues the images around the current review position.
+    Finished pyramids are kept in LRU order until they exceed the memory
+    budget, but never those of the images most recently prefetched.
+    """
+
+    def __init__(
+        self,
+        preview_size: Tuple[int, int] = DEFAULT_PREVIEW_SIZE,
+        max_workers: Optional[int] = None,
+        max_bytes: int = 512 * 1024 * 1024,
+    ):
+        """
+        Initialize prefetcher
+
+        Args:
+            preview_size: Bounding box of review previews
+            max_workers: Decoding threads (defaults to min(2, cores))
+            max_bytes: Memory budget for cached pyramids
+        """
+        self.preview_size = preview_size
+        self.max_bytes = max_bytes
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or min(2, os.cpu_count() or 1),
+            thread_name_prefix="review-prefetch",
+        )
+        self._futures: "OrderedDict[Path, Future]" = OrderedDict()
+        self._keep = set()
+        self._lock = threading.RLock()  # Done callbacks may run inside get()
+
+    def get(self, image_path: Path) -> Future:
+        """Future of an image's pyramid, submitting it if not cached"""
+        image_path = Path(image_path)
+        with self._lock:
+            future = self._futures.get(image_path)
+            if future is None or future.cancelled():
+                future = self._executor.submit(
+                    ImagePyramid.from_path, image_path, self.preview_size
+                )
+                future.add_done_callback(lambda _: self._evict())
+                self._futures[image_path] = future
+            self._futures.move_to_end(image_path)
+            return future
+
+    def prefetch(self, image_paths: Iterable[Path]):
+        """
+        Build pyramids for upcoming images, nearest first
+
+        Queued work for images no longer near the reviewer is cancelled.
+
+        Args:
+            image_paths: Images to prepare, in order of urgency
+        """
+        image_paths = [Path(p) for p in image_paths]
+        with self._lock:
+            self._keep = set(image_paths)
+            for image_path, future in list(self._futures.items()):
+                if image_path not in self._keep and future.cancel():
+                    del self._futures[image_path]
+
+        for image_path in image_paths:
+            self.get(image_path)
+
+    def _evict(self):
+        """Drop least recently used pyramids beyond the memory budget"""
+        with self._lock:
+            sizes = {
+                image_path: future.result().nbytes
+                for image_path, future in self._futures.items()
+                if future.done() and not future.cancelled() and not future.exception()
+            }
+            total = sum(sizes.values())
+            for image_path in list(self._futures):
+                if total <= self.max_bytes:
+                    break
+                if image_path in sizes and image_path not in self._keep:
+                    total -= sizes[image_path]
+                    del self._futures[image_path]
+
+    def discard(self, image_path: Path):
+        """Forget an image, e.g. after it changed on disk"""
+        with self._lock:
+            future = self._futures.pop(Path(image_path), None)
+        if future is not None:
+            future.cancel()
+
+    def shutdown(self):
+        """Stop the workers, dropping queued work"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            self._futures.clear()
+
+
+# Example usage
+def main():
+    """Time cold and prefetched review previews for the given images"""
+    import sys
+    import time
+
+    image_paths = [Path(p) for p in sys.argv[1:]]
+    if not image_paths:
+        print("Usage: python image_pyramid.py <image> [<image> ...]")
+        return
+
+    # Synchronous decode per image, as the dialog did before prefetching
+    start_time = time.time()
+    for image_path in image_paths:
+        ImagePyramid.from_path(image_path)
+    cold = time.time() - start_time
+    print(f"Synchronous: {cold / len(image_paths) * 1000:.1f}ms per image")
+
+    # With prefetching, only the wait for an already-built pyramid is visible
+    prefetcher = ReviewPrefetcher()
+    waits = []
+    for i, image_path in enumerate(image_paths):
+        prefetcher.prefetch(image_paths[i : i + 3])
+        start_time = time.time()
+        pyramid = prefetcher.get(image_path).result()
+        waits.append(time.time() - start_time)
+        time.sleep(0.2)  # Time spent reviewing
+    prefetcher.shutdown()
+
+    print(f"Prefetched: {sum(waits[1:]) / max(1, len(waits) - 1) * 1000:.1f}ms wait")
+    print(
+        f"Last pyramid: {len(pyramid.levels)} levels, "
+        f"{pyramid.tile_grid(0)} tiles at full size"
+    )
+
+
+if __name__ == "__main__":
+    main()
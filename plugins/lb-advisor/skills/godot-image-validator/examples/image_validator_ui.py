@@ -3,15 +3,18 @@
 Godot Image Validator UI
 
 Main PyQt6 user interface for interactive image validation.
-Displays images in a grid layout with confidence indicators and provides
+Displays images in a virtualized grid with confidence indicators and provides
 manual review workflow for low-confidence images.
 """
 
 import sys
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import json
 import asyncio
+import bisect
+from collections import OrderedDict
+from concurrent.futures import Future
 from datetime import datetime
 
 # Add parent directory to path for imports
@@ -26,8 +29,9 @@ from PyQt6.QtWidgets import (
     QGridLayout,
     QLabel,
     QPushButton,
-    QScrollArea,
-    QFrame,
+    QListView,
+    QStyledItemDelegate,
+    QStyle,
     QDialog,
     QTextEdit,
     QProgressBar,
@@ -36,13 +40,34 @@ from PyQt6.QtWidgets import (
     QFileDialog,
     QStatusBar,
     QToolBar,
-    QAction,
     QSpinBox,
     QCheckBox,
     QGroupBox,
+    QScrollArea,
+)
+from PyQt6.QtCore import (
+    Qt,
+    QThread,
+    pyqtSignal,
+    QSettings,
+    QAbstractListModel,
+    QModelIndex,
+    QPoint,
+    QRect,
+    QRectF,
+    QSize,
+    QTimer,
+)
+from PyQt6.QtGui import (
+    QAction,
+    QPixmap,
+    QFont,
+    QKeySequence,
+    QShortcut,
+    QPainter,
+    QColor,
+    QPen,
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSettings
-from PyQt6.QtGui import QPixmap, QFont, QKeySequence, QShortcut
 
 # Import our modules
 try:
@@ -50,169 +75,553 @@ try:
     from confidence_scorer import (
         ConfidenceScorer,
         ThresholdConfig,
+        TriageIndex,
         AspectWeights,
         ValidationLevel,
+        STATUS_COLORS,
     )
+    from technical_profile import TechnicalPreAnalyzer
+    from analysis_scheduler import AnalysisScheduler, asset_importance
+    from compact_results import CompactResults, select_results
+    from validation_pipeline import ValidationPipeline
+    from result_store import (
+        LazyResults,
+        ResultFile,
+        ResultWriter,
+        default_results_dir,
+        export_columnar,
+        find_interrupted_run,
+    )
+    from asset_scanner import ScanConfig, iter_asset_paths, iter_chunks
+    from asset_watcher import AssetWatcher, DELETED, merge_change
+    from thumbnail_service import (
+        PRIORITY_PREFETCH,
+        PRIORITY_VISIBLE,
+        PYRAMID_LEVELS,
+        ThumbnailService,
+        pyramid_level,
+    )
+    from image_pyramid import ImagePyramid, ReviewPrefetcher
 except ImportError as e:
     print(f"Error importing modules: {e}")
     print("Make sure you're running from the correct directory")
     sys.exit(1)
 
 
-class ImageCard(QFrame):
-    """Card widget displaying an image for validation"""
+# Grid zoom levels: edge of the square thumbnail area of a card, in pixels.
+# Each is drawn from the smallest thumbnail pyramid level at least as large.
+GRID_ZOOM_LEVELS = (64, 96, 128, 192, 256, 384, 512)
+DEFAULT_GRID_ZOOM = 192
+
+# Memory for decoded grid thumbnails, evicted least recently shown first
+DEFAULT_THUMBNAIL_BUDGET_MB = 32
+THUMBNAIL_ENTRY_BYTES = 256  # Cache bookkeeping per thumbnail (or error text)
+
+# Card geometry around the thumbnail area
+CARD_MIN_WIDTH = 140  # Room for the confidence text
+CARD_TEXT_HEIGHT = 72
+
+PENDING_COLOR = "#9E9E9E"  # Gray until the analysis finishes
 
-    selected = pyqtSignal()
-    manual_review_requested = pyqtSignal(Path, Dict[str, Any])
+# Quiet time after scrolling or selecting before the analysis order is re-ranked
+PRIORITIZE_DELAY_MS = 100
+
+# Review images prepared ahead of and behind the current one
+REVIEW_PREFETCH = 3
+
+# Zoom factors offered in the review dialog
+ZOOM_STEPS = (0.0625, 0.125, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0)
+
+
+class ResultListModel(QAbstractListModel):
+    """
+    List model over the validator's images and results
+
+    Rows follow the image paths; images without a result yet (loaded but not
+    validated) are shown with a neutral card. The model holds references to
+    the validator's lists, so an item costs nothing until the view asks for
+    it; cards read only the pending flag and confidence, which a
+    CompactResults list serves without building the result. Thumbnails are
+    requested from a background ThumbnailService on first paint (the item
+    shows "Loading..." meanwhile) and kept in an LRU of QPixmaps under a
+    memory budget, so memory doesn't grow with the number of images.
+    Zooming switches the thumbnail pyramid level; a cached thumbnail of
+    another level is scaled in until the new one arrives from the service's
+    disk cache.
+    """
+
+    RESULT_ROLE = Qt.ItemDataRole.UserRole + 1
+    LEVEL_ROLE = Qt.ItemDataRole.UserRole + 2
+    STATE_ROLE = Qt.ItemDataRole.UserRole + 3  # (pending, confidence)
+
+    # Emitted from thumbnail worker threads; delivered queued on the GUI thread
+    thumbnail_loaded = pyqtSignal(object, object, object, object)
 
     def __init__(
-        self, image_path: Path, validation_result: Dict[str, Any], parent=None
+        self,
+        level_func,
+        thumbnail_budget_bytes: int = DEFAULT_THUMBNAIL_BUDGET_MB * 1024 * 1024,
+        prefetch: int = 8,
+        zoom: int = DEFAULT_GRID_ZOOM,
+        parent=None,
     ):
+        """
+        Initialize result model
+
+        Args:
+            level_func: Maps a confidence to its ValidationLevel
+            thumbnail_budget_bytes: Memory for thumbnails kept decoded
+            prefetch: Items after a visible one to render at low priority
+            zoom: Edge of the card thumbnail area in pixels
+        """
         super().__init__(parent)
-        self.image_path = image_path
-        self.validation_result = validation_result
-        self.selected_state = False
-        self.setup_ui()
+        self.level_func = level_func
+        self.thumbnail_budget_bytes = thumbnail_budget_bytes
+        self.prefetch = prefetch
+        self.zoom = zoom
+        self.pyramid_level = pyramid_level(zoom)
+        self.image_paths: List[Path] = []
+        self.results: List[Dict[str, Any]] = []
+        self._rows: Dict[Path, int] = {}
+        # (path, pyramid level) -> QPixmap or error message
+        self._thumbnails: "OrderedDict[tuple, Any]" = OrderedDict()
+        self._cached_bytes = 0
+        self.analyzing = False  # Pending results are being analyzed
+
+        self.thumbnail_service = ThumbnailService(self.thumbnail_loaded.emit)
+        self.thumbnail_loaded.connect(self.on_thumbnail_loaded)
+
+    def set_zoom(self, zoom: int):
+        """Resize cards, switching thumbnail pyramid level if needed"""
+        self.zoom = zoom
+        self.pyramid_level = pyramid_level(zoom)
+
+        # Requests for the old level are no longer worth serving
+        self.thumbnail_service.cancel_pending()
+        self.layoutChanged.emit()
+
+    def card_size(self) -> QSize:
+        """Size of a card at the current zoom"""
+        return QSize(max(self.zoom + 16, CARD_MIN_WIDTH), self.zoom + CARD_TEXT_HEIGHT)
+
+    def set_results(self, image_paths: List[Path], results: List[Dict[str, Any]]):
+        """Show a new set of images and results"""
+        self.beginResetModel()
+        self.image_paths = image_paths
+        self.results = results
+        self._rows = {image_path: row for row, image_path in enumerate(image_paths)}
+        self.endResetModel()
+
+        # Requests for the previous rows are no longer worth rendering
+        self.thumbnail_service.cancel_pending()
+
+    def clear(self):
+        """Remove all items and cached thumbnails"""
+        self.set_results([], [])
+        self._thumbnails.clear()
+        self._cached_bytes = 0
+
+    def set_analyzing(self, analyzing: bool):
+        """Show pending results as being analyzed, or as not validated"""
+        self.analyzing = analyzing
+        if self.rowCount():
+            self.dataChanged.emit(self.index(0), self.index(self.rowCount() - 1))
+
+    def set_thumbnail_budget(self, budget_bytes: int):
+        """Change the thumbnail memory budget, evicting down to it"""
+        self.thumbnail_budget_bytes = budget_bytes
+        self._evict_thumbnails()
+
+    def thumbnail_memory(self) -> int:
+        """Bytes held by cached thumbnails"""
+        return self._cached_bytes
+
+    def shutdown(self):
+        """Stop the thumbnail workers"""
+        self.thumbnail_service.shutdown()
+
+    def append_images(self, image_paths: List[Path]):
+        """
+        Append streamed image paths as new rows
+
+        Extends the path list shared with the validator window.
+        """
+        if not image_paths:
+            return
 
-    def setup_ui(self):
-        """Setup the card UI components"""
-        self.setFrameStyle(QFrame.Shape.Box)
-        self.setLineWidth(2)
-        self.setMinimumSize(220, 280)
-        self.setMaximumSize(220, 280)
+        first = len(self.image_paths)
+        self.beginInsertRows(QModelIndex(), first, first + len(image_paths) - 1)
+        self.image_paths.extend(image_paths)
+        for row, image_path in enumerate(image_paths, first):
+            self._rows[image_path] = row
+        self.endInsertRows()
+
+    def result_at(self, row: int) -> Optional[Dict[str, Any]]:
+        """Result of a row, or None if it hasn't been validated"""
+        return self.results[row] if row < len(self.results) else None
+
+    def state_at(self, row: int) -> Optional[tuple]:
+        """(pending, confidence) of a row, or None if it hasn't been validated"""
+        if row >= len(self.results):
+            return None
+        if isinstance(self.results, CompactResults):
+            return self.results.state(row)
+        result = self.results[row]
+        return result.get("pending", False), result.get("confidence", 0.0)
+
+    def invalidate_thumbnail(self, image_path: Path):
+        """Forget the thumbnails of an image after it changed"""
+        removed = False
+        for level in PYRAMID_LEVELS:
+            thumbnail = self._thumbnails.pop((image_path, level), None)
+            if thumbnail is not None:
+                self._cached_bytes -= self._bytes(thumbnail)
+                removed = True
+
+        row = self._rows.get(image_path)
+        if removed and row is not None:
+            self.result_changed(row)
+
+    def row_of(self, image_path: Path) -> Optional[int]:
+        """Row of an image path, or None if it isn't shown"""
+        return self._rows.get(Path(image_path))
+
+    def result_changed(self, row: int):
+        """Repaint one item after its result was replaced"""
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.image_paths)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= self.rowCount():
+            return None
+
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.image_paths[row].name
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return str(self.image_paths[row])
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self.thumbnail(row)
+        if role == self.RESULT_ROLE:
+            return self.result_at(row)
+        if role == self.STATE_ROLE:
+            return self.state_at(row)
+        if role == self.LEVEL_ROLE:
+            state = self.state_at(row)
+            if state is None or state[0]:
+                return None  # Pending results have no level yet
+            return self.level_func(state[1])
+        return None
+
+    def thumbnail(self, row: int):
+        """
+        Get the thumbnail of a row
+
+        Returns:
+            QPixmap, an error message to draw instead, or None while loading
+        """
+        image_path = self.image_paths[row]
+        level = self.pyramid_level
+        thumbnail = self._thumbnails.get((image_path, level))
+        if thumbnail is not None:
+            self._thumbnails.move_to_end((image_path, level))
+            return thumbnail
+
+        # Only painted (visible) rows get here; queue their neighbours behind them
+        self.thumbnail_service.request(image_path, level, PRIORITY_VISIBLE)
+        for next_path in self.image_paths[row + 1 : row + 1 + self.prefetch]:
+            if (next_path, level) not in self._thumbnails:
+                self.thumbnail_service.request(next_path, level, PRIORITY_PREFETCH)
+
+        # Until it arrives, scale another level in (larger ones look better)
+        for other_level in sorted(PYRAMID_LEVELS, reverse=True):
+            thumbnail = self._thumbnails.get((image_path, other_level))
+            if isinstance(thumbnail, QPixmap):
+                return thumbnail
+        return None
+
+    @staticmethod
+    def _bytes(thumbnail) -> int:
+        """Memory held by a cached thumbnail or error message"""
+        if isinstance(thumbnail, QPixmap):
+            return (
+                thumbnail.width() * thumbnail.height() * thumbnail.depth() // 8
+                + THUMBNAIL_ENTRY_BYTES
+            )
+        return THUMBNAIL_ENTRY_BYTES
+
+    def _evict_thumbnails(self):
+        """Drop least recently shown thumbnails until within the budget"""
+        while self._cached_bytes > self.thumbnail_budget_bytes and (
+            len(self._thumbnails) > 1
+        ):
+            _, evicted = self._thumbnails.popitem(last=False)
+            self._cached_bytes -= self._bytes(evicted)
+
+    def on_thumbnail_loaded(
+        self,
+        image_path: Path,
+        level: int,
+        data: Optional[bytes],
+        error: Optional[str],
+    ):
+        """Convert a rendered thumbnail to a QPixmap and repaint its item"""
+        if data is not None:
+            thumbnail = QPixmap()
+            if not thumbnail.loadFromData(data, "PNG"):
+                thumbnail = "Load Error"
+        else:
+            thumbnail = error or "Load Error"
 
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(5, 5, 5, 5)
-        layout.setSpacing(5)
+        key = (image_path, level)
+        previous = self._thumbnails.pop(key, None)
+        if previous is not None:
+            self._cached_bytes -= self._bytes(previous)
+        self._thumbnails[key] = thumbnail
+        self._cached_bytes += self._bytes(thumbnail)
+        self._evict_thumbnails()
 
-        # Image preview
-        self.image_label = QLabel()
-        self.image_label.setMinimumSize(200, 150)
-        self.image_label.setMaximumSize(200, 150)
-        self.image_label.setScaledContents(True)
-        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        row = self._rows.get(image_path)
+        if row is not None:
+            self.result_changed(row)
 
-        # Load and scale image
-        self.load_image_preview()
-        layout.addWidget(self.image_label, 0, Qt.AlignmentFlag.AlignCenter)
 
-        # Confidence indicator
-        confidence = self.validation_result.get("confidence", 0.0)
-        self.confidence_label = QLabel(f"Confidence: {confidence:.1%}")
-        self.confidence_label.setFont(QFont("Arial", 9, QFont.Weight.Bold))
+class ImageCardDelegate(QStyledItemDelegate):
+    """Paints a result as a card: thumbnail, confidence and file name"""
 
-        # Set color based on confidence
-        color = self.get_confidence_color(confidence)
-        self.confidence_label.setStyleSheet(f"color: {color};")
-        layout.addWidget(self.confidence_label)
+    def sizeHint(self, option, index) -> QSize:
+        return index.model().card_size()
 
-        # File name
-        file_label = QLabel(self.image_path.name)
-        file_label.setWordWrap(True)
-        file_label.setFont(QFont("Arial", 8))
-        file_label.setMaximumHeight(30)
-        layout.addWidget(file_label)
+    def paint(self, painter: QPainter, option, index: QModelIndex):
+        state = index.data(ResultListModel.STATE_ROLE)
+        level = index.data(ResultListModel.LEVEL_ROLE)
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
 
-        # Status indicator (colored border)
-        self.update_status_color()
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
 
-        # Make clickable
-        self.setCursor(Qt.CursorShape.PointingHandCursor)
+        # Card frame, colored by validation level
+        card = option.rect.adjusted(2, 2, -2, -2)
+        if selected:
+            painter.setPen(QPen(QColor("#2196F3"), 3))
+            painter.setBrush(QColor("#E3F2FD"))
+        else:
+            color = PENDING_COLOR if level is None else STATUS_COLORS[level]
+            painter.setPen(QPen(QColor(color), 2))
+            painter.setBrush(QColor("white"))
+        painter.drawRect(card)
+
+        # Image preview, fitted and centered in the thumbnail area
+        edge = index.model().zoom
+        preview = QRect(
+            card.left() + (card.width() - edge) // 2, card.top() + 6, edge, edge
+        )
+        thumbnail = index.data(Qt.ItemDataRole.DecorationRole)
+        if isinstance(thumbnail, QPixmap) and not thumbnail.isNull():
+            target = thumbnail.size().scaled(
+                preview.size(), Qt.AspectRatioMode.KeepAspectRatio
+            )
+            if thumbnail.width() <= edge and thumbnail.height() <= edge:
+                target = thumbnail.size()  # Small images are never enlarged
+            x = preview.left() + (edge - target.width()) // 2
+            y = preview.top() + (edge - target.height()) // 2
+            painter.drawPixmap(QRect(x, y, target.width(), target.height()), thumbnail)
+        elif thumbnail is None:
+            painter.setPen(QColor(PENDING_COLOR))
+            painter.drawText(preview, Qt.AlignmentFlag.AlignCenter, "Loading...")
+        else:
+            painter.setPen(QColor("red" if thumbnail != "PIL Required" else "orange"))
+            painter.drawText(preview, Qt.AlignmentFlag.AlignCenter, str(thumbnail))
 
-    def load_image_preview(self):
-        """Load and scale image preview"""
-        try:
-            from PIL import Image
+        # Confidence indicator
+        text_rect = QRect(card.left() + 8, preview.bottom() + 8, card.width() - 16, 20)
+        painter.setFont(QFont("Arial", 9, QFont.Weight.Bold))
+        if state is None:
+            painter.setPen(QColor(PENDING_COLOR))
+            painter.drawText(text_rect, Qt.AlignmentFlag.AlignLeft, "Not validated")
+        elif state[0]:
+            painter.setPen(QColor(PENDING_COLOR))
+            text = "Analyzing..." if index.model().analyzing else "Not validated"
+            painter.drawText(text_rect, Qt.AlignmentFlag.AlignLeft, text)
+        else:
+            confidence = state[1]
+            color = PENDING_COLOR if level is None else STATUS_COLORS[level]
+            painter.setPen(QColor(color))
+            painter.drawText(
+                text_rect, Qt.AlignmentFlag.AlignLeft, f"Confidence: {confidence:.1%}"
+            )
 
-            # Check if file exists
-            if not self.image_path.exists():
-                self.image_label.setText("File Not Found")
-                self.image_label.setStyleSheet("color: red;")
-                return
+        # File name
+        name_rect = QRect(
+            text_rect.left(), text_rect.bottom() + 4, text_rect.width(), 30
+        )
+        painter.setFont(QFont("Arial", 8))
+        painter.setPen(QColor("black"))
+        painter.drawText(
+            name_rect,
+            Qt.AlignmentFlag.AlignLeft.value | Qt.TextFlag.TextWordWrap.value,
+            index.data(Qt.ItemDataRole.DisplayRole),
+        )
 
-            # Load and scale image
-            with Image.open(self.image_path) as img:
-                img.thumbnail((200, 150))
+        painter.restore()
 
-                # Convert to QPixmap
-                if img.mode in ("RGBA", "LA"):
-                    # Handle transparency
-                    img = img.convert("RGBA")
-                    qimg = ImageQt.ImageQt(img)
-                    pixmap = QPixmap.fromImage(qimg)
-                else:
-                    img = img.convert("RGB")
-                    qimg = ImageQt.ImageQt(img)
-                    pixmap = QPixmap.fromImage(qimg)
 
-                self.image_label.setPixmap(pixmap)
+def pil_to_pixmap(image) -> QPixmap:
+    """Convert a PIL image to a QPixmap"""
+    return QPixmap.fromImage(ImageQt.ImageQt(image))
 
-        except ImportError:
-            # Fallback if PIL not available
-            self.image_label.setText("PIL Required")
-            self.image_label.setStyleSheet("color: orange;")
-        except Exception as e:
-            self.image_label.setText("Load Error")
-            self.image_label.setStyleSheet("color: red;")
-            print(f"Error loading image {self.image_path}: {e}")
 
-    def get_confidence_color(self, confidence: float) -> str:
-        """Get color based on confidence level"""
-        if confidence >= 0.85:
-            return "#4CAF50"  # Green
-        elif confidence >= 0.60:
-            return "#FFC107"  # Yellow
-        elif confidence >= 0.30:
-            return "#FF9800"  # Orange
+class TiledImageView(QWidget):
+    """
+    Draws an ImagePyramid fitted or at a zoom factor
+
+    Fitted, the pre-scaled preview is drawn as is. Zoomed, only the tiles
+    of the matching pyramid level that intersect the exposed area are
+    converted to pixmaps, and those are kept in a small LRU, so scrolling
+    and zooming a large texture never decodes or converts all of it.
+    """
+
+    # Ctrl+wheel: +1 zooms in, -1 zooms out
+    zoom_requested = pyqtSignal(int)
+
+    def __init__(self, tile_cache_size: int = 64, parent=None):
+        super().__init__(parent)
+        self.tile_cache_size = tile_cache_size
+        self.pyramid: Optional[ImagePyramid] = None
+        self.zoom: Optional[float] = None  # None = fit
+        self.message = ""
+        self._preview: Optional[QPixmap] = None
+        self._tiles: "OrderedDict[tuple, QPixmap]" = OrderedDict()
+
+    def set_pyramid(self, pyramid: ImagePyramid):
+        """Show a new image"""
+        self.pyramid = pyramid
+        self.message = ""
+        self._preview = pil_to_pixmap(pyramid.preview)
+        self._tiles.clear()
+        self.update()
+
+    def clear(self):
+        """Release the image and its tiles"""
+        self.pyramid = None
+        self._preview = None
+        self._tiles.clear()
+
+    def set_message(self, message: str):
+        """Show a message instead of an image"""
+        self.message = message
+        self.update()
+
+    def fit_zoom(self) -> float:
+        """Zoom factor of the fitted preview"""
+        if self.pyramid is None:
+            return 1.0
+        return self.pyramid.preview.width / self.pyramid.size[0]
+
+    def set_zoom(self, zoom: Optional[float]):
+        """Fit (None) or draw at a zoom factor, resizing to the zoomed image"""
+        self.zoom = zoom
+        if zoom is not None and self.pyramid is not None:
+            width, height = self.pyramid.size
+            self.resize(max(1, round(width * zoom)), max(1, round(height * zoom)))
+        self.update()
+
+    def tile_pixmap(self, level: int, column: int, row: int) -> QPixmap:
+        """Pixmap of one pyramid tile, converted on first use"""
+        key = (level, column, row)
+        pixmap = self._tiles.get(key)
+        if pixmap is None:
+            pixmap = pil_to_pixmap(self.pyramid.tile(level, column, row))
+            self._tiles[key] = pixmap
+            while len(self._tiles) > self.tile_cache_size:
+                self._tiles.popitem(last=False)
         else:
-            return "#F44336"  # Red
-
-    def update_status_color(self):
-        """Update the card border color based on confidence"""
-        confidence = self.validation_result.get("confidence", 0.0)
-        color = self.get_confidence_color(confidence)
-        self.setStyleSheet(
-            f"QFrame {{ border: 2px solid {color}; background: white; }}"
-        )
+            self._tiles.move_to_end(key)
+        return pixmap
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        if self.pyramid is None:
+            painter.setPen(QColor("red" if self.message != "Loading..." else "gray"))
+            painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, self.message)
+            return
 
-        if self.selected_state:
-            self.setStyleSheet(
-                "QFrame { border: 3px solid #2196F3; background: #E3F2FD; }"
-            )
+        if self.zoom is None:
+            x = (self.width() - self._preview.width()) // 2
+            y = (self.height() - self._preview.height()) // 2
+            painter.drawPixmap(max(0, x), max(0, y), self._preview)
+            return
 
-    def mousePressEvent(self, event):
-        """Handle mouse click events"""
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.selected_state = not self.selected_state
-            self.update_status_color()
-            self.selected.emit()
-
-            # If low confidence, request manual review
-            confidence = self.validation_result.get("confidence", 0.0)
-            if confidence < 0.85:
-                self.manual_review_requested.emit(
-                    self.image_path, self.validation_result
-                )
+        level, level_scale = self.pyramid.level_for_scale(self.zoom)
+        factor = self.zoom / level_scale  # Level pixels to widget pixels
 
-        super().mousePressEvent(event)
+        # Magnified pixel art stays crisp; reductions are smoothed
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, factor < 1.0)
 
-    def set_selected(self, selected: bool):
-        """Set selection state"""
-        self.selected_state = selected
-        self.update_status_color()
+        exposed = event.rect()
+        box = (
+            exposed.left() / factor,
+            exposed.top() / factor,
+            (exposed.right() + 1) / factor,
+            (exposed.bottom() + 1) / factor,
+        )
+        for column, row in self.pyramid.visible_tiles(level, box):
+            left, top, right, bottom = self.pyramid.tile_box(level, column, row)
+            pixmap = self.tile_pixmap(level, column, row)
+            target = QRectF(
+                left * factor,
+                top * factor,
+                (right - left) * factor,
+                (bottom - top) * factor,
+            )
+            painter.drawPixmap(target, pixmap, QRectF(pixmap.rect()))
+
+    def wheelEvent(self, event):
+        if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+            self.zoom_requested.emit(1 if event.angleDelta().y() > 0 else -1)
+            event.accept()
+        else:
+            super().wheelEvent(event)
 
 
 class ManualReviewDialog(QDialog):
     """Dialog for manual review of low-confidence images"""
 
-    review_completed = pyqtSignal(Path, Dict[str, Any])
+    review_completed = pyqtSignal(object, dict)
+
+    # Delivered on the GUI thread when a prefetched pyramid finishes
+    pyramid_loaded = pyqtSignal(object)
 
-    def __init__(self, image_path: Path, analysis_result: Dict[str, Any], parent=None):
+    def __init__(
+        self,
+        image_path: Path,
+        analysis_result: Dict[str, Any],
+        parent=None,
+        pyramid_future: Optional[Future] = None,
+    ):
+        """
+        Initialize review dialog
+
+        Args:
+            image_path: Image under review
+            analysis_result: Its validation result
+            parent: Parent widget
+            pyramid_future: Pyramid being prepared in the background; the
+                image is decoded synchronously if omitted
+        """
         super().__init__(parent)
         self.image_path = image_path
         self.analysis_result = analysis_result
+        self.pyramid_future = pyramid_future
         self.selected_categories = set()
         self.notes = ""
+        self.direction = 1  # -1 when closed with Previous
+        self.closed = False  # Set once done; late pyramids are ignored
         self.setup_ui()
 
     def setup_ui(self):
@@ -227,12 +636,37 @@ class ManualReviewDialog(QDialog):
         preview_group = QGroupBox("Image Preview")
         preview_layout = QVBoxLayout(preview_group)
 
-        self.image_label = QLabel()
-        self.image_label.setMinimumHeight(300)
-        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.image_label.setStyleSheet("border: 1px solid #ccc; background: #f9f9f9;")
+        self.image_view = TiledImageView()
+        self.image_view.zoom_requested.connect(self.step_zoom)
+        self.scroll_area = QScrollArea()
+        self.scroll_area.setMinimumHeight(300)
+        self.scroll_area.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.scroll_area.setStyleSheet("border: 1px solid #ccc; background: #f9f9f9;")
+        self.scroll_area.setWidget(self.image_view)
+        self.scroll_area.setWidgetResizable(True)
+        preview_layout.addWidget(self.scroll_area)
+
+        # Zoom controls
+        zoom_layout = QHBoxLayout()
+        fit_button = QPushButton("Fit")
+        fit_button.clicked.connect(lambda: self.set_zoom(None))
+        zoom_layout.addWidget(fit_button)
+        zoom_out_button = QPushButton("−")
+        zoom_out_button.clicked.connect(lambda: self.step_zoom(-1))
+        zoom_layout.addWidget(zoom_out_button)
+        zoom_in_button = QPushButton("+")
+        zoom_in_button.clicked.connect(lambda: self.step_zoom(1))
+        zoom_layout.addWidget(zoom_in_button)
+        actual_size_button = QPushButton("1:1")
+        actual_size_button.clicked.connect(lambda: self.set_zoom(1.0))
+        zoom_layout.addWidget(actual_size_button)
+        self.zoom_label = QLabel("Fit")
+        zoom_layout.addWidget(self.zoom_label)
+        zoom_layout.addStretch()
+        preview_layout.addLayout(zoom_layout)
+
+        self.pyramid_loaded.connect(self.on_pyramid_loaded)
         self.load_full_image()
-        preview_layout.addWidget(self.image_label)
 
         # File info
         info_label = QLabel(f"File: {self.image_path}")
@@ -340,29 +774,61 @@ class ManualReviewDialog(QDialog):
         layout.addLayout(button_layout)
 
     def load_full_image(self):
-        """Load full image for preview"""
+        """Show the image, waiting for its pyramid if it is still being built"""
+        if ImageQt is None:
+            self.image_view.set_message("PIL Required")
+            return
+        if not self.image_path.exists():
+            self.image_view.set_message("File not found")
+            return
+
+        if self.pyramid_future is None:
+            try:
+                self.image_view.set_pyramid(ImagePyramid.from_path(self.image_path))
+            except Exception as e:
+                self.image_view.set_message(f"Error: {e}")
+        elif self.pyramid_future.done():
+            self.on_pyramid_loaded(self.pyramid_future)
+        else:
+            self.image_view.set_message("Loading...")
+            self.pyramid_future.add_done_callback(self._forward_pyramid)
+
+    def _forward_pyramid(self, future: Future):
+        """Hand a finished pyramid to the GUI thread (runs on a worker thread)"""
+        if self.closed:
+            return
         try:
-            from PIL import ImageQt
-
-            if self.image_path.exists():
-                with Image.open(self.image_path) as img:
-                    # Scale to fit dialog width while maintaining aspect ratio
-                    max_width = 650
-                    if img.width > max_width:
-                        ratio = max_width / img.width
-                        new_height = int(img.height * ratio)
-                        img = img.resize((max_width, new_height))
-
-                    qimg = ImageQt.ImageQt(img)
-                    pixmap = QPixmap.fromImage(qimg)
-                    self.image_label.setPixmap(pixmap)
-            else:
-                self.image_label.setText("File not found")
-                self.image_label.setStyleSheet("color: red; font-size: 18px;")
+            self.pyramid_loaded.emit(future)
+        except RuntimeError:
+            pass  # Dialog deleted meanwhile
 
-        except Exception as e:
-            self.image_label.setText(f"Error: {e}")
-            self.image_label.setStyleSheet("color: red; font-size: 16px;")
+    def on_pyramid_loaded(self, future: Future):
+        """Show a finished pyramid (or why it failed)"""
+        if self.closed:
+            return
+        if future.cancelled():
+            self.image_view.set_message("Load cancelled")
+        elif future.exception() is not None:
+            self.image_view.set_message(f"Error: {future.exception()}")
+        else:
+            self.image_view.set_pyramid(future.result())
+            self.set_zoom(self.image_view.zoom)
+
+    def set_zoom(self, zoom: Optional[float]):
+        """Fit the image (None) or show it at a zoom factor"""
+        self.scroll_area.setWidgetResizable(zoom is None)
+        self.image_view.set_zoom(zoom)
+        self.zoom_label.setText("Fit" if zoom is None else f"{zoom:.0%}")
+
+    def step_zoom(self, steps: int):
+        """Move to the next larger (1) or smaller (-1) zoom step"""
+        current = self.image_view.zoom or self.image_view.fit_zoom()
+        if steps > 0:
+            larger = [zoom for zoom in ZOOM_STEPS if zoom > current * 1.001]
+            self.set_zoom(larger[0] if larger else ZOOM_STEPS[-1])
+        else:
+            smaller = [zoom for zoom in ZOOM_STEPS if zoom < current / 1.001]
+            self.set_zoom(smaller[-1] if smaller else ZOOM_STEPS[0])
 
     def get_confidence_color(self, confidence: float) -> str:
         """Get color based on confidence level"""
@@ -383,9 +849,9 @@ class ManualReviewDialog(QDialog):
             self.selected_categories.discard(category)
 
     def go_previous(self):
-        """Navigate to previous item"""
-        self.accept()  # Signal to move to previous
-        self.reject()  # But don't save current changes
+        """Navigate to previous item without saving the current one"""
+        self.direction = -1
+        super().reject()
 
     def go_next(self):
         """Navigate to next item"""
@@ -406,10 +872,20 @@ class ManualReviewDialog(QDialog):
         self.notes = self.notes_input.toPlainText()
         super().accept()
 
+    def done(self, result: int):
+        """Close the dialog, releasing the image so only the prefetcher holds it"""
+        self.closed = True
+        self.pyramid_future = None
+        self.image_view.clear()
+        super().done(result)
+
 
 class ImageValidatorUI(QMainWindow):
     """Main UI for image validation"""
 
+    # Emitted from the asset watcher thread; delivered queued on the GUI thread
+    assets_changed = pyqtSignal(dict)
+
     def __init__(self):
         super().__init__()
         self.settings = QSettings("GodotImageValidator", "UI")
@@ -423,6 +899,22 @@ class ImageValidatorUI(QMainWindow):
         self.image_paths = []
         self.current_review_index = 0
         self.pending_reviews = []
+        self.triage = TriageIndex()  # Analyzed results sorted by confidence
+        self.selected_rows = set()  # Kept in sync with the view's selection
+        self.scan_config = ScanConfig()
+
+        # Results are streamed to a JSON Lines file as they arrive
+        self.results_writer: Optional[ResultWriter] = None
+        self.loaded_results: Optional[LazyResults] = None  # Open result file
+
+        # Review images are decoded and pre-scaled ahead of the reviewer
+        self.review_prefetcher = ReviewPrefetcher()
+
+        # Watch mode
+        self.folder_root: Optional[Path] = None
+        self.asset_watcher: Optional[AssetWatcher] = None
+        self.watch_changes: Dict[Path, str] = {}  # Held back while busy
+        self.assets_changed.connect(self.on_assets_changed)
 
         self.setup_ui()
         self.load_settings()
@@ -446,6 +938,13 @@ class ImageValidatorUI(QMainWindow):
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Ready")
 
+        # Live analysis throughput, polled from the client's metrics
+        self.throughput_label = QLabel()
+        self.status_bar.addPermanentWidget(self.throughput_label)
+        self.throughput_timer = QTimer(self)
+        self.throughput_timer.timeout.connect(self.update_throughput)
+        self.throughput_timer.start(1000)
+
         # Create central widget
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -481,6 +980,11 @@ class ImageValidatorUI(QMainWindow):
         open_action.triggered.connect(self.open_images)
         file_menu.addAction(open_action)
 
+        open_folder_action = QAction("Open Folder...", self)
+        open_folder_action.setShortcut(QKeySequence("Ctrl+Shift+O"))
+        open_folder_action.triggered.connect(self.open_folder)
+        file_menu.addAction(open_folder_action)
+
         file_menu.addSeparator()
 
         save_action = QAction("Save Results...", self)
@@ -527,6 +1031,12 @@ class ImageValidatorUI(QMainWindow):
         # Tools menu
         tools_menu = menubar.addMenu("Tools")
 
+        self.watch_action = QAction("Watch Folder", self)
+        self.watch_action.setCheckable(True)
+        self.watch_action.setEnabled(False)
+        self.watch_action.toggled.connect(self.toggle_watch)
+        tools_menu.addAction(self.watch_action)
+
         settings_action = QAction("Settings...", self)
         settings_action.triggered.connect(self.show_settings)
         tools_menu.addAction(settings_action)
@@ -548,6 +1058,10 @@ class ImageValidatorUI(QMainWindow):
         open_action.triggered.connect(self.open_images)
         toolbar.addAction(open_action)
 
+        open_folder_action = QAction("Open Folder", self)
+        open_folder_action.triggered.connect(self.open_folder)
+        toolbar.addAction(open_folder_action)
+
         toolbar.addSeparator()
 
         # Validate button
@@ -556,6 +1070,17 @@ class ImageValidatorUI(QMainWindow):
         self.validate_action.setEnabled(False)
         toolbar.addAction(self.validate_action)
 
+        # Pause/resume and cancel for in-flight batches
+        self.pause_action = QAction("Pause", self)
+        self.pause_action.triggered.connect(self.toggle_pause)
+        self.pause_action.setEnabled(False)
+        toolbar.addAction(self.pause_action)
+
+        self.cancel_action = QAction("Cancel", self)
+        self.cancel_action.triggered.connect(self.cancel_validation)
+        self.cancel_action.setEnabled(False)
+        toolbar.addAction(self.cancel_action)
+
         toolbar.addSeparator()
 
         # Manual review button
@@ -594,19 +1119,37 @@ class ImageValidatorUI(QMainWindow):
         self.progress_bar.setVisible(False)
         layout.addWidget(self.progress_bar)
 
-        # Scrollable image grid
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        # Virtualized image grid: only visible cards are painted
+        self.result_model = ResultListModel(
+            self.confidence_scorer.get_validation_level, parent=self
+        )
+        self.image_view = QListView()
+        self.image_view.setViewMode(QListView.ViewMode.IconMode)
+        self.image_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.image_view.setMovement(QListView.Movement.Static)
+        self.image_view.setUniformItemSizes(True)
+        self.image_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.image_view.setBatchSize(200)
+        self.image_view.setSpacing(5)
+        self.image_view.setSelectionMode(QListView.SelectionMode.MultiSelection)
+        self.image_view.setItemDelegate(ImageCardDelegate(self.image_view))
+        self.image_view.setModel(self.result_model)
+        self.image_view.setGridSize(self.result_model.card_size())
+        self.image_view.clicked.connect(self.on_image_clicked)
+        self.image_view.selectionModel().selectionChanged.connect(
+            self.on_selection_changed
+        )
 
-        self.image_grid = QWidget()
-        self.grid_layout = QGridLayout(self.image_grid)
-        self.grid_layout.setSpacing(10)
-        self.grid_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        scroll_area.setWidget(self.image_grid)
+        # Cards scrolled into view are analyzed first; re-rank once scrolling settles
+        self.prioritize_timer = QTimer(self)
+        self.prioritize_timer.setSingleShot(True)
+        self.prioritize_timer.setInterval(PRIORITIZE_DELAY_MS)
+        self.prioritize_timer.timeout.connect(self.prioritize_validation)
+        self.image_view.verticalScrollBar().valueChanged.connect(
+            lambda _: self.prioritize_timer.start()
+        )
 
-        layout.addWidget(scroll_area)
+        layout.addWidget(self.image_view)
 
         return panel
 
@@ -667,6 +1210,18 @@ class ImageValidatorUI(QMainWindow):
 
         layout.addWidget(stats_group)
 
+        # Display
+        display_group = QGroupBox("Display")
+        display_layout = QHBoxLayout(display_group)
+        display_layout.addWidget(QLabel("Thumbnail Memory:"))
+        self.thumbnail_budget_spin = QSpinBox()
+        self.thumbnail_budget_spin.setRange(8, 4096)
+        self.thumbnail_budget_spin.setValue(DEFAULT_THUMBNAIL_BUDGET_MB)
+        self.thumbnail_budget_spin.setSuffix(" MB")
+        self.thumbnail_budget_spin.valueChanged.connect(self.set_thumbnail_budget)
+        display_layout.addWidget(self.thumbnail_budget_spin)
+        layout.addWidget(display_group)
+
         # Actions
         layout.addWidget(QLabel(""))  # Spacer
 
@@ -678,6 +1233,18 @@ class ImageValidatorUI(QMainWindow):
         self.validate_button.setEnabled(False)
         actions_layout.addWidget(self.validate_button)
 
+        run_layout = QHBoxLayout()
+        self.pause_button = QPushButton("Pause")
+        self.pause_button.clicked.connect(self.toggle_pause)
+        self.pause_button.setEnabled(False)
+        run_layout.addWidget(self.pause_button)
+
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.cancel_validation)
+        self.cancel_button.setEnabled(False)
+        run_layout.addWidget(self.cancel_button)
+        actions_layout.addLayout(run_layout)
+
         self.review_button = QPushButton("Process Manual Reviews")
         self.review_button.clicked.connect(self.start_manual_review)
         self.review_button.setEnabled(False)
@@ -708,30 +1275,75 @@ class ImageValidatorUI(QMainWindow):
         if file_paths:
             self.load_images([Path(p) for p in file_paths])
 
+    def open_folder(self):
+        """Open a folder and stream in the images below it"""
+        folder = QFileDialog.getExistingDirectory(self, "Select Folder")
+        if folder:
+            self.load_folder(Path(folder))
+
     def load_images(self, image_paths: List[Path]):
         """Load images for validation"""
-        self.image_paths = image_paths
+        self.cancel_scan()
+        self.stop_watch()
+        self.folder_root = None
+        self.watch_action.setEnabled(False)
+        self.close_results()
+        self.image_paths = list(image_paths)
         self.validation_results = []
         self.pending_reviews = []
+        self.triage.clear()
 
-        # Clear existing grid
-        self.clear_image_grid()
+        # Show the images (not yet validated) in the grid
+        self.display_validation_results()
 
         # Update UI
         self.update_stats()
         self.status_bar.showMessage(f"Loaded {len(image_paths)} images")
 
         # Enable buttons
-        self.validate_action.setEnabled(True)
-        self.validate_button.setEnabled(True)
+        self.validate_action.setEnabled(bool(image_paths))
+        self.validate_button.setEnabled(bool(image_paths))
+
+    def load_folder(self, folder: Path):
+        """Scan a folder in the background, adding images as they are found"""
+        folder = Path(folder).resolve()  # Matches the paths the watcher reports
+        self.load_images([])
+        self.folder_root = folder
+        self.watch_action.setEnabled(True)
+
+        self.scan_thread = FolderScanThread(folder, self.scan_config)
+        self.scan_thread.paths_found.connect(self.on_paths_found)
+        self.scan_thread.scan_finished.connect(self.on_scan_finished)
+        self.scan_thread.start()
+        self.status_bar.showMessage(f"Scanning {folder}...")
+
+    def on_paths_found(self, image_paths: List[Path]):
+        """Append a chunk of scanned images to the grid"""
+        self.result_model.append_images(image_paths)
+        self.update_stats()
+        self.status_bar.showMessage(f"Scanning... {len(self.image_paths)} images")
+
+    def on_scan_finished(self, found: int, cancelled: bool):
+        """Handle the end of a folder scan"""
+        if cancelled:
+            return
+
+        self.status_bar.showMessage(f"Loaded {found} images")
+        self.validate_action.setEnabled(found > 0)
+        self.validate_button.setEnabled(found > 0)
+        self.apply_asset_changes()
+
+    def cancel_scan(self):
+        """Stop a running folder scan"""
+        thread = getattr(self, "scan_thread", None)
+        if thread is not None and thread.isRunning():
+            thread.cancel()
+            thread.wait()
 
     def clear_image_grid(self):
         """Clear the image grid"""
-        # Remove all widgets from grid
-        for i in reversed(range(self.grid_layout.count())):
-            child = self.grid_layout.itemAt(i).widget()
-            if child:
-                child.setParent(None)
+        self.result_model.clear()
+        self.selected_rows.clear()
 
     def start_validation(self):
         """Start the validation process"""
@@ -747,41 +1359,239 @@ class ImageValidatorUI(QMainWindow):
         # Disable buttons
         self.validate_action.setEnabled(False)
         self.validate_button.setEnabled(False)
+        self.set_run_controls_enabled(True)
+
+        # Show placeholder cards that fill in as results arrive
+        self.validation_results = CompactResults.pending(self.image_paths)
+        self.pending_reviews = []
+        self.triage.clear()
+        self.display_validation_results()
+
+        # Journal the batch so an interrupted run can be resumed
+        self.close_results()
+        self.open_results_writer(
+            default_results_dir()
+            / f"validation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl",
+            manifest=self.image_paths,
+        )
 
         # Start async validation
         self.validate_thread = ValidationThread(
             self.image_paths, self.mcp_client, self.confidence_scorer
         )
         self.validate_thread.progress_updated.connect(self.update_progress)
-        self.validate_thread.validation_completed.connect(self.on_validation_completed)
+        self.validate_thread.result_ready.connect(self.on_result_ready)
+        self.validate_thread.validation_finished.connect(self.on_validation_finished)
+        self.result_model.set_analyzing(True)
+        self.validate_thread.start()
+        self.prioritize_validation()
+
+    def offer_resume(self):
+        """Offer to resume the newest batch that was interrupted"""
+        journal = find_interrupted_run()
+        if journal is None:
+            return
+
+        try:
+            with ResultFile(journal) as result_file:
+                resumable = result_file.is_resumable()
+                done = len(result_file)
+                remaining = len(result_file.remaining())
+        except (OSError, ValueError) as e:
+            self.status_bar.showMessage(f"Could not read {journal}: {e}")
+            return
+
+        if resumable:
+            reply = QMessageBox.question(
+                self,
+                "Resume Validation",
+                f"A validation run was interrupted after {done} images.\n"
+                f"Resume it with the remaining {remaining} images?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            )
+            if reply == QMessageBox.StandardButton.Yes:
+                self.resume_validation(journal)
+                return
+
+        # Finished or declined: don't offer it again
+        with ResultWriter(journal) as writer:
+            writer.mark_complete(abandoned=resumable)
+
+    def resume_validation(self, journal: Path):
+        """
+        Continue an interrupted batch from its journal
+
+        Finished images are loaded from the journal, the scorer is restored
+        to the configuration the batch started with, and only the images
+        that have no record yet are analyzed, appending to the same journal.
+        """
+        try:
+            self.load_jsonl(journal)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to resume: {e}")
+            return
+
+        # Rows for the images left, so their results find a card and get journaled
+        remaining = self.loaded_results.result_file.remaining()
+        self.validation_results.extend(
+            {"image_path": image_path, "pending": True, "confidence": 0.0}
+            for image_path in remaining
+        )
+        self.result_model.append_images(remaining)
+        self.rebuild_triage()
+        self.update_stats()
+
+        self.progress_bar.setMaximum(len(remaining))
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        self.validate_action.setEnabled(False)
+        self.validate_button.setEnabled(False)
+        self.set_run_controls_enabled(True)
+
+        # Rows are looked up by path, as for incremental runs
+        self.validate_thread = ValidationThread(
+            remaining, self.mcp_client, self.confidence_scorer
+        )
+        self.validate_thread.progress_updated.connect(self.update_progress)
+        self.validate_thread.result_ready.connect(self.on_incremental_result_ready)
+        self.validate_thread.validation_finished.connect(self.on_validation_finished)
+        self.result_model.set_analyzing(True)
         self.validate_thread.start()
+        self.prioritize_validation()
+        self.status_bar.showMessage(
+            f"Resuming validation: {len(remaining)} images left"
+        )
+
+    def update_throughput(self):
+        """Show analyses per second and requests in flight while validating"""
+        metrics = self.mcp_client.metrics
+        rate = metrics.throughput()
+        in_flight = metrics.in_flight_requests
+        if rate == 0 and in_flight == 0:
+            self.throughput_label.clear()
+            return
+
+        p95 = metrics.latency["total"].percentile(95)
+        self.throughput_label.setText(
+            f"{rate:.1f} images/s | {in_flight} in flight | p95 {p95:.1f}s"
+        )
 
     def update_progress(self, current: int, total: int):
         """Update progress bar"""
         self.progress_bar.setValue(current)
         self.status_bar.showMessage(f"Validating... {current}/{total}")
 
-    def on_validation_completed(self, results: List[Dict[str, Any]]):
-        """Handle validation completion"""
-        self.validation_results = results
+    def on_result_ready(self, index: int, result: Dict[str, Any]):
+        """Handle a single finished analysis, in whatever order they complete"""
+        self.validation_results[index] = result
+        self.update_image_card(index, result)
+        if self.results_writer is not None:
+            self.results_writer.write(result)
+
+        confidence = result.get("confidence", 0.0)
+        self.triage.add(index, confidence)
+        if confidence < self.confidence_scorer.thresholds.auto_accept:
+            bisect.insort(self.pending_reviews, index)
+
+        self.update_stats()
+
+    def toggle_pause(self):
+        """Pause or resume the running validation"""
+        thread = getattr(self, "validate_thread", None)
+        if thread is None or not thread.isRunning():
+            return
+
+        if thread.is_paused():
+            thread.resume()
+            label = "Pause"
+            self.status_bar.showMessage("Validation resumed")
+        else:
+            thread.pause()
+            label = "Resume"
+            self.status_bar.showMessage("Validation paused")
+
+        self.pause_action.setText(label)
+        self.pause_button.setText(label)
+
+    def visible_rows(self) -> range:
+        """Rows of the cards currently on screen"""
+        grid = self.image_view.gridSize()
+        viewport = self.image_view.viewport().rect()
+        first = self.image_view.indexAt(QPoint(grid.width() // 2, grid.height() // 2))
+        if not first.isValid() or grid.width() <= 0 or grid.height() <= 0:
+            return range(0)
+
+        columns = max(1, viewport.width() // grid.width())
+        rows = viewport.height() // grid.height() + 2  # Partial rows at both edges
+        last = min(self.result_model.rowCount(), first.row() + columns * rows)
+        return range(first.row(), last)
+
+    def prioritize_validation(self):
+        """Move visible and selected images to the front of the running validation"""
+        thread = getattr(self, "validate_thread", None)
+        if thread is None or not thread.isRunning():
+            return
+
+        count = len(self.image_paths)
+        visible = [self.image_paths[row] for row in self.visible_rows() if row < count]
+        selected = [self.image_paths[row] for row in self.selected_rows if row < count]
+        thread.prioritize(visible, selected)
+
+    def cancel_validation(self):
+        """Cancel the running validation, keeping results that already finished"""
+        thread = getattr(self, "validate_thread", None)
+        if thread is not None and thread.isRunning():
+            thread.cancel()
+            self.status_bar.showMessage("Cancelling validation...")
+
+    def set_run_controls_enabled(self, enabled: bool):
+        """Enable or disable the pause/cancel controls"""
+        for control in (
+            self.pause_action,
+            self.cancel_action,
+            self.pause_button,
+            self.cancel_button,
+        ):
+            control.setEnabled(enabled)
+
+        self.pause_action.setText("Pause")
+        self.pause_button.setText("Pause")
+
+    def on_validation_finished(self, completed: int, cancelled: bool):
+        """Handle validation completion or cancellation"""
         self.progress_bar.setVisible(False)
+        self.set_run_controls_enabled(False)
 
-        # Find items needing manual review
-        auto_accept_threshold = self.confidence_scorer.thresholds.auto_accept
-        self.pending_reviews = [
-            i
-            for i, result in enumerate(results)
-            if result.get("confidence", 0.0) < auto_accept_threshold
-        ]
+        # A batch stays resumable from its journal until every image has a record
+        if (
+            not cancelled
+            and self.results_writer is not None
+            and len(self.triage) == len(self.validation_results)
+        ):
+            self.results_writer.mark_complete()
 
-        # Display results
-        self.display_validation_results()
+        # Images never analyzed stay loaded, shown as not validated
+        self.result_model.set_analyzing(False)
+
+        # Find items needing manual review
+        self.rebuild_triage()
 
         # Update UI
         self.update_stats()
-        self.status_bar.showMessage(
-            f"Validation complete - {len(self.pending_reviews)} need manual review"
-        )
+        if cancelled:
+            self.status_bar.showMessage(
+                f"Validation cancelled after {completed} images - "
+                f"{len(self.pending_reviews)} need manual review"
+            )
+        else:
+            self.status_bar.showMessage(
+                f"Validation complete - {len(self.pending_reviews)} need manual review"
+            )
+        if self.results_writer is not None:
+            self.status_bar.showMessage(
+                f"{self.status_bar.currentMessage()} "
+                f"(results in {self.results_writer.file_path})"
+            )
 
         # Enable buttons
         self.validate_action.setEnabled(True)
@@ -791,25 +1601,240 @@ class ImageValidatorUI(QMainWindow):
         self.export_action.setEnabled(True)
         self.export_button.setEnabled(True)
 
-    def display_validation_results(self):
-        """Display validation results in the grid"""
-        self.clear_image_grid()
+        # Changes that arrived during the run
+        self.apply_asset_changes()
+
+    def rebuild_triage(self):
+        """Rebuild the triage index and review queue from all analyzed results"""
+        if isinstance(self.validation_results, (LazyResults, CompactResults)):
+            # Confidences come from the file index or the confidence column
+            confidences = self.validation_results.confidences()
+        else:
+            confidences = {
+                i: result.get("confidence", 0.0)
+                for i, result in enumerate(self.validation_results)
+                if not result.get("pending", False)
+            }
+        self.triage.rebuild(confidences)
+        self.pending_reviews = self.triage.indices_below(
+            self.confidence_scorer.thresholds.auto_accept
+        )
+
+    def toggle_watch(self, enabled: bool):
+        """Start or stop watching the opened folder for changed images"""
+        if not enabled:
+            self.stop_watch()
+            return
+        if self.folder_root is None or self.asset_watcher is not None:
+            return
+
+        self.asset_watcher = AssetWatcher(
+            self.folder_root, self.assets_changed.emit, self.scan_config
+        )
+        self.asset_watcher.start()
+        self.status_bar.showMessage(
+            f"Watching {self.folder_root} ({self.asset_watcher.backend})"
+        )
+
+    def stop_watch(self):
+        """Stop watch mode"""
+        if self.asset_watcher is not None:
+            self.asset_watcher.stop()
+            self.asset_watcher = None
+        self.watch_changes.clear()
+        self.watch_action.setChecked(False)
+
+    def is_busy(self) -> bool:
+        """Check if a scan or validation run is in progress"""
+        return any(
+            thread is not None and thread.isRunning()
+            for thread in (
+                getattr(self, "scan_thread", None),
+                getattr(self, "validate_thread", None),
+            )
+        )
+
+    def on_assets_changed(self, changes: Dict[Path, str]):
+        """Queue debounced file changes, applying them unless a run is active"""
+        if self.asset_watcher is None:
+            return  # Stopped while the signal was in flight
+
+        for image_path, change in changes.items():
+            merged = merge_change(self.watch_changes.get(image_path), change)
+            if merged is None:
+                self.watch_changes.pop(image_path, None)
+            else:
+                self.watch_changes[image_path] = merged
+
+        if not self.is_busy():
+            self.apply_asset_changes()
+
+    def apply_asset_changes(self):
+        """
+        Merge queued file changes into the result set
+
+        Deleted images are removed, added images get new cards, and if the
+        set has been validated, added and modified images are re-analyzed;
+        every other result is kept.
+        """
+        if not self.watch_changes or self.is_busy():
+            return
+        changes, self.watch_changes = self.watch_changes, {}
+
+        deleted = {path for path, change in changes.items() if change == DELETED}
+        if deleted:
+            self.remove_images(deleted)
+
+        analyzed = bool(self.validation_results)
+        added, changed = [], []
+        for image_path, change in changes.items():
+            if change == DELETED:
+                continue
+            row = self.result_model.row_of(image_path)
+            self.result_model.invalidate_thumbnail(image_path)
+            self.review_prefetcher.discard(image_path)
+            if row is None:
+                added.append(image_path)
+                continue
+
+            changed.append(image_path)
+            if analyzed:
+                # Re-analyzed below; drop the stale result from the triage
+                self.validation_results[row] = {
+                    "image_path": image_path,
+                    "pending": True,
+                    "confidence": 0.0,
+                }
+                self.triage.remove(row)
+                position = bisect.bisect_left(self.pending_reviews, row)
+                if (
+                    position < len(self.pending_reviews)
+                    and self.pending_reviews[position] == row
+                ):
+                    del self.pending_reviews[position]
+                self.update_image_card(row, self.validation_results[row])
+
+        if added:
+            if analyzed:
+                self.validation_results.extend(
+                    {"image_path": image_path, "pending": True, "confidence": 0.0}
+                    for image_path in added
+                )
+            self.result_model.append_images(added)
+
+        self.update_stats()
+        if analyzed and (added or changed):
+            self.start_incremental_validation(added + changed)
+        else:
+            self.status_bar.showMessage(
+                f"{len(added)} added, {len(changed)} modified, {len(deleted)} removed"
+            )
+
+    def remove_images(self, image_paths: set):
+        """Remove deleted images and their results"""
+        keep = [i for i, path in enumerate(self.image_paths) if path not in image_paths]
+        if len(keep) == len(self.image_paths):
+            return
+
+        if self.validation_results:
+            self.validation_results = select_results(self.validation_results, keep)
+        self.image_paths = [self.image_paths[i] for i in keep]
+        self.display_validation_results()
+        self.rebuild_triage()
+
+    def start_incremental_validation(self, image_paths: List[Path]):
+        """Analyze only changed images, merging results into the current set"""
+        self.progress_bar.setMaximum(len(image_paths))
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        self.validate_action.setEnabled(False)
+        self.validate_button.setEnabled(False)
+        self.set_run_controls_enabled(True)
+
+        self.validate_thread = ValidationThread(
+            image_paths, self.mcp_client, self.confidence_scorer
+        )
+        self.validate_thread.progress_updated.connect(self.update_progress)
+        self.validate_thread.result_ready.connect(self.on_incremental_result_ready)
+        self.validate_thread.validation_finished.connect(
+            self.on_incremental_validation_finished
+        )
+        self.result_model.set_analyzing(True)
+        self.validate_thread.start()
+        self.prioritize_validation()
+        self.status_bar.showMessage(
+            f"Re-validating {len(image_paths)} changed images..."
+        )
 
-        # Add image cards
-        cols = 4
-        for i, result in enumerate(self.validation_results):
-            if i < len(self.image_paths):
-                image_path = self.image_paths[i]
+    def on_incremental_result_ready(self, index: int, result: Dict[str, Any]):
+        """Route an incremental result to its row in the full result set"""
+        row = self.result_model.row_of(result["image_path"])
+        if row is not None:
+            self.on_result_ready(row, result)
 
-                card = ImageCard(image_path, result)
-                card.selected.connect(self.on_image_selected)
-                card.manual_review_requested.connect(self.show_manual_review_dialog)
+    def on_incremental_validation_finished(self, completed: int, cancelled: bool):
+        """Handle the end of an incremental run"""
+        self.progress_bar.setVisible(False)
+        self.set_run_controls_enabled(False)
+        self.result_model.set_analyzing(False)
+
+        if cancelled:
+            # Leave visible error results rather than cards stuck on "Analyzing..."
+            for image_path in self.validate_thread.image_paths:
+                row = self.result_model.row_of(image_path)
+                if row is None or not self.validation_results[row].get("pending"):
+                    continue
+                self.validation_results[row] = {
+                    "image_path": image_path,
+                    "success": False,
+                    "confidence": 0.0,
+                    "categories": [],
+                    "issues": ["Re-validation cancelled"],
+                    "metadata": {},
+                }
+                self.on_result_ready(row, self.validation_results[row])
 
-                row = i // cols
-                col = i % cols
-                self.grid_layout.addWidget(card, row, col)
+        self.update_stats()
+        self.status_bar.showMessage(
+            f"Re-validated {completed} changed images - "
+            f"{len(self.pending_reviews)} need manual review"
+        )
+        self.validate_action.setEnabled(True)
+        self.validate_button.setEnabled(True)
+        self.review_action.setEnabled(len(self.pending_reviews) > 0)
+        self.review_button.setEnabled(len(self.pending_reviews) > 0)
 
-        self.image_grid.update()
+        self.apply_asset_changes()
+
+    def display_validation_results(self):
+        """Display validation results in the grid"""
+        self.result_model.set_results(self.image_paths, self.validation_results)
+        self.selected_rows.clear()  # A model reset drops the view's selection
+
+    def on_image_clicked(self, index: QModelIndex):
+        """Open the manual review dialog for a clicked low-confidence image"""
+        row = index.row()
+        if row >= len(self.validation_results):
+            return  # Not validated yet
+        result = self.validation_results[row]
+        level = self.get_result_level(result)
+
+        # Pending results have no level yet
+        if level is not None and level != ValidationLevel.AUTO_ACCEPT:
+            self.show_manual_review_dialog(self.image_paths[row], result)
+
+    def on_selection_changed(self, selected, deselected):
+        """Apply a selection delta to the selected-row set"""
+        for selection_range in deselected:
+            self.selected_rows.difference_update(
+                range(selection_range.top(), selection_range.bottom() + 1)
+            )
+        for selection_range in selected:
+            self.selected_rows.update(
+                range(selection_range.top(), selection_range.bottom() + 1)
+            )
+        self.on_image_selected()
+        self.prioritize_timer.start()
 
     def on_image_selected(self):
         """Handle image selection"""
@@ -822,11 +1847,15 @@ class ImageValidatorUI(QMainWindow):
 
     def show_manual_review_dialog(self, image_path: Path, result: Dict[str, Any]):
         """Show manual review dialog for an image"""
-        dialog = ManualReviewDialog(image_path, result, self)
+        dialog = ManualReviewDialog(
+            image_path, result, self, self.review_prefetcher.get(image_path)
+        )
 
-        if dialog.exec() == QDialog.DialogCode.Accepted:
+        accepted = dialog.exec() == QDialog.DialogCode.Accepted
+        review_result = dialog.get_result()
+        dialog.deleteLater()
+        if accepted:
             # Update result with manual review data
-            review_result = dialog.get_result()
             self.apply_manual_review(review_result)
 
     def start_manual_review(self):
@@ -841,61 +1870,87 @@ class ImageValidatorUI(QMainWindow):
         self.show_next_manual_review()
 
     def show_next_manual_review(self):
-        """Show next manual review dialog"""
-        if self.current_review_index >= len(self.pending_reviews):
-            self.finish_manual_review()
-            return
+        """Show review dialogs from the current position until the queue is done"""
+        while self.current_review_index < len(self.pending_reviews):
+            # Get current review item
+            result_index = self.pending_reviews[self.current_review_index]
+            image_path = self.image_paths[result_index]
+            result = self.validation_results[result_index]
+            self.prefetch_reviews()
+
+            # Create and show dialog
+            dialog = ManualReviewDialog(
+                image_path, result, self, self.review_prefetcher.get(image_path)
+            )
 
-        # Get current review item
-        result_index = self.pending_reviews[self.current_review_index]
-        image_path = self.image_paths[result_index]
-        result = self.validation_results[result_index]
+            # Update previous/next buttons
+            dialog.prev_button.setEnabled(self.current_review_index > 0)
+            dialog.next_button.setEnabled(
+                self.current_review_index < len(self.pending_reviews) - 1
+            )
 
-        # Create and show dialog
-        dialog = ManualReviewDialog(image_path, result, self)
-        dialog.review_completed.connect(self.apply_manual_review)
+            accepted = dialog.exec() == QDialog.DialogCode.Accepted
+            review_result = dialog.get_result()
+            direction = dialog.direction
+            dialog.deleteLater()
+
+            if accepted:
+                self.apply_manual_review(review_result)
+                self.current_review_index += 1
+            elif direction < 0:
+                self.current_review_index -= 1
+            else:
+                return  # Review stopped
 
-        # Update previous/next buttons
-        dialog.prev_button.setEnabled(self.current_review_index > 0)
-        dialog.next_button.setEnabled(
-            self.current_review_index < len(self.pending_reviews) - 1
-        )
+        self.finish_manual_review()
 
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            self.current_review_index += 1
-            self.show_next_manual_review()
+    def prefetch_reviews(self):
+        """Prepare the images around the current review position, nearest first"""
+        position = self.current_review_index
+        rows = [self.pending_reviews[position]]
+        for distance in range(1, REVIEW_PREFETCH + 1):
+            for neighbour in (position + distance, position - distance):
+                if 0 <= neighbour < len(self.pending_reviews):
+                    rows.append(self.pending_reviews[neighbour])
+        self.review_prefetcher.prefetch(self.image_paths[row] for row in rows)
 
     def apply_manual_review(self, review_result: Dict[str, Any]):
         """Apply manual review result"""
         # Find and update the validation result
-        for i, result in enumerate(self.validation_results):
-            if result.get("image_path") == review_result["image_path"]:
-                # Update categories
-                result["categories"] = review_result["categories"]
-                result["manual_review"] = True
-                result["review_notes"] = review_result.get("notes", "")
-                result["review_timestamp"] = review_result.get("timestamp")
-
-                # Update confidence for manual review
-                result["confidence"] = 1.0  # Manual review = full confidence
-
-                # Update the image card
-                self.update_image_card(i, result)
-                break
+        i = self.result_model.row_of(review_result["image_path"])
+        if i is None:
+            return
+        result = self.validation_results[i]
+
+        # Update categories
+        result["categories"] = review_result["categories"]
+        result["manual_review"] = True
+        result["review_notes"] = review_result.get("notes", "")
+        result["review_timestamp"] = review_result.get("timestamp")
+
+        # Update confidence for manual review
+        result["confidence"] = 1.0  # Manual review = full confidence
+        self.triage.add(i, 1.0)
+
+        # Loaded results are copies; store the change and record it
+        self.validation_results[i] = result
+        if self.results_writer is not None:
+            self.results_writer.write(result)
+
+        # Update the image card
+        self.update_image_card(i, result)
 
     def update_image_card(self, index: int, result: Dict[str, Any]):
-        """Update an image card with new result"""
-        # Find the card at this grid position
-        cols = 4
-        item = self.grid_layout.itemAtPosition(index // cols, index % cols)
-        if item and item.widget():
-            card = item.widget()
-            if isinstance(card, ImageCard):
-                card.validation_result = result
-                card.confidence_label.setText(
-                    f"Confidence: {result.get('confidence', 0.0):.1%}"
-                )
-                card.update_status_color()
+        """Repaint the card of a result (the model reads the result list)"""
+        self.result_model.result_changed(index)
+
+    def get_result_level(self, result: Dict[str, Any]) -> Optional[ValidationLevel]:
+        """Validation level of a result under the current thresholds"""
+        if result.get("pending", False):
+            return None
+        return self.confidence_scorer.get_validation_level(
+            result.get("confidence", 0.0)
+        )
 
     def finish_manual_review(self):
         """Finish manual review process"""
@@ -911,7 +1966,9 @@ class ImageValidatorUI(QMainWindow):
             QMessageBox.information(self, "No Selection", "Please select images first.")
 
     def update_thresholds(self):
-        """Update confidence thresholds"""
+        """Update confidence thresholds and re-triage existing results"""
+        old_thresholds = ThresholdConfig(**self.confidence_scorer.thresholds.to_dict())
+
         self.confidence_scorer.thresholds.auto_accept = (
             self.auto_threshold_spin.value() / 100.0
         )
@@ -919,73 +1976,82 @@ class ImageValidatorUI(QMainWindow):
             self.manual_threshold_spin.value() / 100.0
         )
 
+        # Re-partition the analyzed results; no analysis is re-run
+        changed = self.triage.retriage(
+            old_thresholds, self.confidence_scorer.thresholds
+        )
+        self.pending_reviews = self.triage.indices_below(
+            self.confidence_scorer.thresholds.auto_accept
+        )
+
+        for index in changed:
+            self.update_image_card(index, self.validation_results[index])
+
+        self.update_stats()
+        has_reviews = len(self.pending_reviews) > 0
+        self.review_action.setEnabled(has_reviews)
+        self.review_button.setEnabled(has_reviews)
+
     def count_selected_images(self) -> int:
         """Count selected images"""
-        count = 0
-        for i in range(self.grid_layout.count()):
-            item = self.grid_layout.itemAt(i)
-            if item and item.widget():
-                widget = item.widget()
-                if isinstance(widget, ImageCard) and widget.selected_state:
-                    count += 1
-        return count
+        return len(self.selected_rows)
 
     def get_selected_images(self) -> List[int]:
         """Get indices of selected images"""
-        selected = []
-        for i in range(self.grid_layout.count()):
-            item = self.grid_layout.itemAt(i)
-            if item and item.widget():
-                widget = item.widget()
-                if isinstance(widget, ImageCard) and widget.selected_state:
-                    selected.append(i)
-        return selected
+        return sorted(self.selected_rows)
 
     def select_all(self):
         """Select all images"""
-        for i in range(self.grid_layout.count()):
-            item = self.grid_layout.itemAt(i)
-            if item and item.widget():
-                widget = item.widget()
-                if isinstance(widget, ImageCard):
-                    widget.set_selected(True)
+        self.image_view.selectAll()
 
     def clear_selection(self):
         """Clear selection"""
-        for i in range(self.grid_layout.count()):
-            item = self.grid_layout.itemAt(i)
-            if item and item.widget():
-                widget = item.widget()
-                if isinstance(widget, ImageCard):
-                    widget.set_selected(False)
+        self.image_view.clearSelection()
 
     def zoom_in(self):
         """Zoom in images"""
-        # TODO: Implement zoom functionality
-        self.status_bar.showMessage("Zoom not implemented yet")
+        larger = [zoom for zoom in GRID_ZOOM_LEVELS if zoom > self.result_model.zoom]
+        if larger:
+            self.set_grid_zoom(larger[0])
 
     def zoom_out(self):
         """Zoom out images"""
-        # TODO: Implement zoom functionality
-        self.status_bar.showMessage("Zoom not implemented yet")
+        smaller = [zoom for zoom in GRID_ZOOM_LEVELS if zoom < self.result_model.zoom]
+        if smaller:
+            self.set_grid_zoom(smaller[-1])
+
+    def set_grid_zoom(self, zoom: int):
+        """Resize the grid cards to a zoom level"""
+        self.result_model.set_zoom(zoom)
+        self.image_view.setGridSize(self.result_model.card_size())
+        self.prioritize_timer.start()
+        self.status_bar.showMessage(f"Thumbnail size {zoom}px")
+
+    def set_thumbnail_budget(self, megabytes: int):
+        """Limit the memory of decoded grid thumbnails"""
+        self.result_model.set_thumbnail_budget(megabytes * 1024 * 1024)
 
     def update_stats(self):
         """Update statistics display"""
         if self.validation_results:
             total = len(self.validation_results)
-            auto_accept = sum(
-                1
-                for r in self.validation_results
-                if r.get("confidence", 0)
-                >= self.confidence_scorer.thresholds.auto_accept
-            )
+            level_counts = self.triage.level_counts(self.confidence_scorer.thresholds)
+            auto_accept = level_counts[ValidationLevel.AUTO_ACCEPT]
             manual_review = len(self.pending_reviews)
+            unanalyzed = total - len(self.triage)
 
             stats_text = f"Total: {total}\n"
             stats_text += f"Auto-accepted: {auto_accept}\n"
             stats_text += f"Manual review: {manual_review}"
+            if unanalyzed:
+                label = (
+                    "In progress" if self.result_model.analyzing else "Not validated"
+                )
+                stats_text += f"\n{label}: {unanalyzed}"
 
             self.stats_label.setText(stats_text)
+        elif self.image_paths:
+            self.stats_label.setText(f"Loaded: {len(self.image_paths)} (not validated)")
         else:
             self.stats_label.setText("No images loaded")
 
@@ -998,43 +2064,62 @@ class ImageValidatorUI(QMainWindow):
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Save Results",
-            f"validation_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-            "JSON Files (*.json);;CSV Files (*.csv);;All Files (*)",
+            f"validation_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl",
+            "JSON Lines (*.jsonl);;JSON Files (*.json);;CSV Files (*.csv);;"
+            "Parquet (*.parquet);;Arrow (*.arrow *.feather);;All Files (*)",
         )
 
         if file_path:
             try:
-                if file_path.endswith(".csv"):
+                suffix = Path(file_path).suffix.lower()
+                if suffix == ".csv":
                     self.save_csv(file_path)
+                elif suffix == ".jsonl":
+                    self.save_jsonl(file_path)
+                elif suffix in (".parquet", ".arrow", ".feather"):
+                    export_columnar(self.analyzed_results(), Path(file_path))
                 else:
                     self.save_json(file_path)
                 QMessageBox.information(self, "Saved", f"Results saved to {file_path}")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to save: {e}")
 
+    def analyzed_results(self):
+        """Iterate over results, skipping images still waiting for analysis"""
+        for result in self.validation_results:
+            if not result.get("pending", False):
+                yield result
+
+    def save_jsonl(self, file_path: str):
+        """Save results as JSON Lines, one record per image"""
+        with ResultWriter(
+            Path(file_path),
+            {"scorer": self.confidence_scorer.export_config()},
+            append=False,
+        ) as writer:
+            writer.write_all(self.analyzed_results())
+
     def save_json(self, file_path: str):
-        """Save results as JSON"""
-        data = {
+        """Save results as JSON, writing one result at a time"""
+        header = {
             "timestamp": datetime.now().isoformat(),
             "thresholds": self.confidence_scorer.export_config(),
-            "results": [],
         }
 
-        for i, result in enumerate(self.validation_results):
-            if i < len(self.image_paths):
-                data["results"].append(
-                    {
-                        "image_path": str(self.image_paths[i]),
-                        "confidence": result.get("confidence", 0.0),
-                        "categories": result.get("categories", []),
-                        "issues": result.get("issues", []),
-                        "manual_review": result.get("manual_review", False),
-                        "notes": result.get("review_notes", ""),
-                    }
-                )
-
         with open(file_path, "w") as f:
-            json.dump(data, f, indent=2)
+            # Header fields, then the results array streamed record by record
+            f.write(json.dumps(header)[:-1] + ', "results": [')
+            for i, result in enumerate(self.analyzed_results()):
+                record = {
+                    "image_path": str(result["image_path"]),
+                    "confidence": result.get("confidence", 0.0),
+                    "categories": result.get("categories", []),
+                    "issues": result.get("issues", []),
+                    "manual_review": result.get("manual_review", False),
+                    "notes": result.get("review_notes", ""),
+                }
+                f.write(("," if i else "") + "\n" + json.dumps(record, default=str))
+            f.write("\n]}\n")
 
     def save_csv(self, file_path: str):
         """Save results as CSV"""
@@ -1053,53 +2138,142 @@ class ImageValidatorUI(QMainWindow):
                 ]
             )
 
-            for i, result in enumerate(self.validation_results):
-                if i < len(self.image_paths):
-                    writer.writerow(
-                        [
-                            str(self.image_paths[i]),
-                            f"{result.get('confidence', 0.0):.2%}",
-                            ", ".join(result.get("categories", [])),
-                            "; ".join(result.get("issues", [])),
-                            "Yes" if result.get("manual_review", False) else "No",
-                            result.get("review_notes", ""),
-                        ]
-                    )
+            for result in self.analyzed_results():
+                writer.writerow(
+                    [
+                        str(result["image_path"]),
+                        f"{result.get('confidence', 0.0):.2%}",
+                        ", ".join(result.get("categories", [])),
+                        "; ".join(result.get("issues", [])),
+                        "Yes" if result.get("manual_review", False) else "No",
+                        result.get("review_notes", ""),
+                    ]
+                )
 
     def load_results(self):
         """Load validation results"""
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Load Results", "", "JSON Files (*.json);;All Files (*)"
+            self,
+            "Load Results",
+            str(default_results_dir()),
+            "Result Files (*.jsonl *.json);;All Files (*)",
         )
 
         if file_path:
             try:
-                with open(file_path, "r") as f:
-                    data = json.load(f)
-
-                # Load configuration
-                if "thresholds" in data:
-                    config = data["thresholds"]
-                    if "thresholds" in config:
-                        self.confidence_scorer.import_config(config)
-                        self.auto_threshold_spin.setValue(
-                            int(self.confidence_scorer.thresholds.auto_accept * 100)
-                        )
-                        self.manual_threshold_spin.setValue(
-                            int(
-                                self.confidence_scorer.thresholds.manual_review_suggested
-                                * 100
-                            )
-                        )
-
-                # Load results
-                # TODO: Implement result loading and UI update
-                QMessageBox.information(
-                    self, "Loaded", f"Results loaded from {file_path}"
-                )
-
+                if file_path.endswith(".jsonl"):
+                    self.load_jsonl(Path(file_path))
+                else:
+                    self.load_json(Path(file_path))
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to load: {e}")
+                return
+
+            self.show_loaded_results()
+            self.status_bar.showMessage(
+                f"Loaded {len(self.validation_results)} results from {file_path}"
+            )
+
+    def load_jsonl(self, file_path: Path):
+        """
+        Load a JSON Lines result file lazily
+
+        Records stay in the memory-mapped file and are parsed a page at a
+        time as the grid shows them. Reviews and re-validations are appended
+        to the same file, continuing after its last complete record.
+        """
+        result_file = ResultFile(file_path)
+        self.load_images(result_file.image_paths)
+        if "scorer" in result_file.header:
+            self.apply_scorer_config(result_file.header["scorer"])
+
+        self.loaded_results = LazyResults(result_file)
+        self.validation_results = self.loaded_results
+        self.open_results_writer(file_path)
+
+    def load_json(self, file_path: Path):
+        """Load a JSON result file saved by save_json"""
+        with open(file_path, "r") as f:
+            data = json.load(f)
+
+        results = CompactResults(
+            {
+                "image_path": Path(record["image_path"]),
+                "success": True,
+                "confidence": record.get("confidence", 0.0),
+                "categories": record.get("categories", []),
+                "issues": record.get("issues", []),
+                "manual_review": record.get("manual_review", False),
+                "review_notes": record.get("notes", ""),
+                "metadata": {},
+            }
+            for record in data.get("results", [])
+        )
+        self.load_images(list(results.paths))
+
+        # Load configuration
+        config = data.get("thresholds", {})
+        if "thresholds" in config:
+            self.apply_scorer_config(config)
+
+        self.validation_results = results
+
+    def apply_scorer_config(self, config: Dict[str, Any]):
+        """Apply a saved scorer configuration and show its thresholds"""
+        self.confidence_scorer.import_config(config)
+        self.auto_threshold_spin.setValue(
+            int(self.confidence_scorer.thresholds.auto_accept * 100)
+        )
+        self.manual_threshold_spin.setValue(
+            int(self.confidence_scorer.thresholds.manual_review_suggested * 100)
+        )
+
+    def show_loaded_results(self):
+        """Show loaded results and rebuild the review queue"""
+        self.display_validation_results()
+        self.rebuild_triage()
+        self.update_stats()
+
+        has_results = bool(self.validation_results)
+        self.review_action.setEnabled(len(self.pending_reviews) > 0)
+        self.review_button.setEnabled(len(self.pending_reviews) > 0)
+        self.export_action.setEnabled(has_results)
+        self.export_button.setEnabled(has_results)
+
+    def open_results_writer(
+        self, file_path: Path, manifest: Optional[List[Path]] = None
+    ):
+        """
+        Stream results to a JSON Lines file, continuing it if it exists
+
+        Args:
+            file_path: Result file
+            manifest: Images of a new batch, recorded so it can be resumed
+        """
+        if self.results_writer is not None:
+            self.results_writer.close()
+            self.results_writer = None
+
+        header = {"scorer": self.confidence_scorer.export_config()}
+        if manifest is not None:
+            header["manifest"] = [str(image_path) for image_path in manifest]
+
+        try:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            self.results_writer = ResultWriter(file_path, header)
+        except OSError as e:
+            self.status_bar.showMessage(f"Results will not be saved: {e}")
+
+    def close_results(self):
+        """Close the streamed and loaded result files"""
+        if self.results_writer is not None:
+            self.results_writer.close()
+            self.results_writer = None
+        if self.loaded_results is not None:
+            if self.validation_results is self.loaded_results:
+                self.validation_results = []
+            self.loaded_results.close()
+            self.loaded_results = None
 
     def export_results(self):
         """Export validation results"""
@@ -1131,99 +2305,159 @@ class ImageValidatorUI(QMainWindow):
         if geometry:
             self.restoreGeometry(geometry)
 
+        # Folder scan options (max depth, exclude globs, ...)
+        scan_config = self.settings.value("scan/config")
+        if scan_config:
+            try:
+                self.scan_config = ScanConfig(**json.loads(scan_config))
+                self.scan_config.validate()
+            except (TypeError, ValueError):
+                self.scan_config = ScanConfig()
+
+        # Grid thumbnail size
+        zoom = self.settings.value("view/zoom", DEFAULT_GRID_ZOOM, type=int)
+        if zoom in GRID_ZOOM_LEVELS and zoom != self.result_model.zoom:
+            self.set_grid_zoom(zoom)
+
+        # Thumbnail memory budget
+        self.thumbnail_budget_spin.setValue(
+            self.settings.value(
+                "view/thumbnail_budget_mb", DEFAULT_THUMBNAIL_BUDGET_MB, type=int
+            )
+        )
+
     def save_settings(self):
         """Save application settings"""
         # Save window geometry
         self.settings.setValue("geometry", self.saveGeometry())
+        self.settings.setValue("scan/config", json.dumps(self.scan_config.to_dict()))
+        self.settings.setValue("view/zoom", self.result_model.zoom)
+        self.settings.setValue(
+            "view/thumbnail_budget_mb", self.thumbnail_budget_spin.value()
+        )
 
     def closeEvent(self, event):
         """Handle close event"""
+        self.cancel_scan()
+        self.stop_watch()
+        thread = getattr(self, "validate_thread", None)
+        if thread is not None and thread.isRunning():
+            thread.cancel()
+            thread.wait()
+
+        self.close_results()
+        self.throughput_timer.stop()
+        self.mcp_client.close()
+        self.confidence_scorer.shutdown()
+        self.result_model.shutdown()
+        self.review_prefetcher.shutdown()
         self.save_settings()
         event.accept()
 
 
+class FolderScanThread(QThread):
+    """Worker thread that enumerates a folder and streams paths in chunks"""
+
+    paths_found = pyqtSignal(list)
+    scan_finished = pyqtSignal(int, bool)
+
+    def __init__(self, folder: Path, config: ScanConfig, chunk_size: int = 500):
+        super().__init__()
+        self.folder = folder
+        self.config = config
+        self.chunk_size = chunk_size
+        self._cancelled = False
+
+    def cancel(self):
+        """Stop after the current chunk"""
+        self._cancelled = True
+
+    def run(self):
+        """Walk the folder, emitting chunks until done or cancelled"""
+        found = 0
+        paths = iter_asset_paths(self.folder, self.config)
+        for chunk in iter_chunks(paths, self.chunk_size):
+            if self._cancelled:
+                break
+            found += len(chunk)
+            self.paths_found.emit(chunk)
+
+        self.scan_finished.emit(found, self._cancelled)
+
+
 class ValidationThread(QThread):
-    """Worker thread for image validation"""
+    """Worker thread running the shared validation pipeline"""
 
     progress_updated = pyqtSignal(int, int)
-    validation_completed = pyqtSignal(list)
+    result_ready = pyqtSignal(int, dict)
+    validation_finished = pyqtSignal(int, bool)
 
-    def __init__(self, image_paths: List[Path], mcp_client, confidence_scorer):
+    def __init__(
+        self,
+        image_paths: List[Path],
+        mcp_client,
+        confidence_scorer,
+        max_concurrent: int = 4,
+        pre_analyzer: TechnicalPreAnalyzer = None,
+    ):
         super().__init__()
         self.image_paths = image_paths
-        self.mcp_client = mcp_client
-        self.confidence_scorer = confidence_scorer
-        self.results = []
+        self.pipeline = ValidationPipeline(
+            mcp_client, confidence_scorer, max_concurrent, pre_analyzer
+        )
+        self.scheduler = AnalysisScheduler(len(image_paths))
+        self._path_index = {path: index for index, path in enumerate(image_paths)}
 
     def run(self):
         """Run validation in background thread"""
-        self.results = []
+        # Scene references and recent changes are ranked off the GUI thread
+        self.scheduler.add_flags(asset_importance(self.image_paths))
 
         # Create event loop for async operations
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
 
         try:
-            for i, image_path in enumerate(self.image_paths):
-                # Run async validation
-                result = loop.run_until_complete(self.validate_single_image(image_path))
-                self.results.append(result)
-
-                # Emit progress
-                self.progress_updated.emit(i + 1, len(self.image_paths))
-
+            loop.run_until_complete(
+                self.pipeline.run(self.image_paths, self._emit_result, self.scheduler)
+            )
         finally:
             loop.close()
 
         # Emit completion
-        self.validation_completed.emit(self.results)
+        self.validation_finished.emit(self.pipeline.completed, self.pipeline.cancelled)
+
+    def _emit_result(self, index: int, result: Dict[str, Any]):
+        """Forward a finished result to the GUI thread"""
+        self.result_ready.emit(index, result)
+        self.progress_updated.emit(self.pipeline.completed, len(self.image_paths))
+
+    def prioritize(self, visible_paths: List[Path], selected_paths: List[Path]):
+        """Analyze on-screen and selected images next (thread-safe)"""
+        self.scheduler.set_visible(self._indices(visible_paths))
+        self.scheduler.set_selected(self._indices(selected_paths))
+
+    def _indices(self, image_paths: List[Path]) -> List[int]:
+        """Indices of the given images within this run"""
+        return [
+            self._path_index[path] for path in image_paths if path in self._path_index
+        ]
 
-    async def validate_single_image(self, image_path: Path) -> Dict[str, Any]:
-        """Validate a single image"""
-        try:
-            # Analyze with MCP client
-            analysis_result = await self.mcp_client.analyze_image(image_path)
-
-            if analysis_result.success:
-                # Calculate confidence
-                confidence = self.confidence_scorer.calculate_confidence(
-                    {
-                        "content_match": analysis_result.confidence,
-                        "quality_assessment": analysis_result.confidence * 0.9,
-                        "category_confidence": analysis_result.confidence,
-                        "technical_analysis": 0.9,
-                    }
-                )
+    def pause(self):
+        """Stop starting new analyses until resumed"""
+        self.pipeline.pause()
 
-                # Apply custom rules
-                modified_result = self.confidence_scorer.apply_custom_rules(
-                    image_path, {"confidence": confidence}
-                )
+    def resume(self):
+        """Resume a paused validation"""
+        self.pipeline.resume()
 
-                return {
-                    "success": True,
-                    "confidence": modified_result.get("confidence", confidence),
-                    "categories": analysis_result.categories,
-                    "issues": analysis_result.issues,
-                    "metadata": analysis_result.metadata,
-                }
-            else:
-                return {
-                    "success": False,
-                    "confidence": 0.0,
-                    "categories": ["other"],
-                    "issues": [analysis_result.error_message or "Analysis failed"],
-                    "metadata": {},
-                }
+    def is_paused(self) -> bool:
+        """Check if the validation is paused"""
+        return self.pipeline.is_paused()
 
-        except Exception as e:
-            return {
-                "success": False,
-                "confidence": 0.0,
-                "categories": ["other"],
-                "issues": [str(e)],
-                "metadata": {},
-            }
+    def cancel(self):
+        """Cancel the validation, abandoning in-flight analyses"""
+        self.pipeline.cancel()
 
 
 # Required import for PIL ImageQt
@@ -1245,9 +2479,14 @@ def main():
 
     # Handle command line arguments
     if len(sys.argv) > 1:
-        # Load images from command line
+        # Load images (or a single folder) from command line
         image_paths = [Path(p) for p in sys.argv[1:]]
-        window.load_images(image_paths)
+        if len(image_paths) == 1 and image_paths[0].is_dir():
+            window.load_folder(image_paths[0])
+        else:
+            window.load_images(image_paths)
+    else:
+        window.offer_resume()
 
     sys.exit(app.exec())
 
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Texture Heuristics for Godot Image Validator
+
+This module runs vectorized NumPy checks on decoded RGBA pixels: the native pixel grid of
+upscaled pixel art (from the run-length histogram of color changes), palette size, alpha
+edges that will show dark halos under filtering (unbled or premultiplied), and blurry
+upscales. It also reads the Godot .import settings (mipmaps, alpha border fix) that decide
+which findings matter. The checks run inside the technical pre-analysis worker processes.
+"""
+
+import logging
+import math
+import re
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, Any
+
+import numpy as np
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Largest native pixel scale looked for
+MAX_PIXEL_SCALE = 16
+
+# Share of runs that must be multiples of a scale for it to count
+PIXEL_SCALE_AGREEMENT = 0.95
+
+# Rows (and columns) sampled for the run-length histogram
+MAX_SAMPLED_LINES = 256
+
+# Pixels sampled for the palette count
+MAX_PALETTE_PIXELS = 256 * 1024
+
+# Palettes up to this size are treated as hand-picked (pixel art, UI)
+SMALL_PALETTE = 256
+
+# Half-resolution vs full-resolution edge strength above which an image looks
+# like a smooth (bilinear/bicubic) upscale; images with any sharp edge sit near
+# 1.0-1.3, smooth 2x-4x upscales around 1.8
+BLURRY_UPSCALE_RATIO = 1.5
+
+# Percentile of horizontal steps taken as the image's strongest edges
+EDGE_PERCENTILE = 99.9
+
+# Images larger than this are not analyzed (header checks still apply)
+MAX_HEURISTIC_PIXELS = 4096 * 4096
+
+# .import keys read by read_import_settings
+_IMPORT_SETTINGS = {
+    "mipmaps/generate": "mipmaps",
+    "process/fix_alpha_border": "fix_alpha_border",
+}
+_IMPORT_SETTING_PATTERN = re.compile(
+    r"^(mipmaps/generate|process/fix_alpha_border)\s*=\s*(true|false)", re.MULTILINE
+)
+
+
+@dataclass
+class TextureMetrics:
+    """Pixel-level properties of a texture"""
+
+    pixel_scale: int = 1  # Size of one art pixel in image pixels (1 = native)
+    palette_size: int = 0  # Distinct visible colors
+    unbled_edge_ratio: float = 0.0  # Transparent edge pixels with black RGB
+    premultiplied_edges: bool = False  # Semi-transparent RGB darkened by alpha
+    blur_ratio: float = 0.0  # Half-res / full-res edge strength
+    blurry_upscale: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return asdict(self)
+
+
+def to_rgba_array(image) -> np.ndarray:
+    """Decode a PIL image into an (H, W, 4) uint8 array"""
+    if image.mode != "RGBA":
+        image = image.convert("RGBA")
+    return np.asarray(image, dtype=np.uint8)
+
+
+def _run_lengths(rgba: np.ndarray) -> np.ndarray:
+    """
+    Lengths of the runs of identical pixels along each row
+
+    Works on a sample of rows; runs never span two rows.
+    """
+    height, width = rgba.shape[:2]
+    if height > MAX_SAMPLED_LINES:
+        rows = np.linspace(0, height - 1, MAX_SAMPLED_LINES).astype(np.intp)
+        rgba = rgba[rows]
+        height = len(rows)
+
+    # Pack RGBA into one integer per pixel so a change is a single compare
+    packed = rgba.view(np.uint32).reshape(height, width)
+    boundaries = np.ones((height, width + 1), dtype=bool)
+    boundaries[:, 1:width] = packed[:, 1:] != packed[:, :-1]
+
+    positions = np.flatnonzero(boundaries)
+    runs = np.diff(positions)
+    # Drop the step from each row's end to the next row's start
+    return runs[positions[:-1] % (width + 1) != width]
+
+
+def _axis_pixel_scale(runs: np.ndarray, length: int) -> int:
+    """Largest scale that (nearly) all runs are multiples of"""
+    # Lines of a single color say nothing about the grid
+    runs = runs[runs < length]
+    if len(runs) < 16:
+        return 1
+
+    lengths, counts = np.unique(runs, return_counts=True)
+    total = counts.sum()
+    for scale in range(MAX_PIXEL_SCALE, 1, -1):
+        if counts[lengths % scale == 0].sum() >= PIXEL_SCALE_AGREEMENT * total:
+            return scale
+    return 1
+
+
+def detect_pixel_scale(rgba: np.ndarray) -> int:
+    """
+    Detect the native pixel grid of nearest-neighbor upscaled art
+
+    An image scaled up by k only changes color every k pixels, so the
+    histogram of run lengths along rows and columns only has mass at
+    multiples of k.
+
+    Args:
+        rgba: (H, W, 4) uint8 pixels
+
+    Returns:
+        int: Art pixel size in image pixels (1 if not upscaled)
+    """
+    if min(rgba.shape[:2]) < 4:
+        return 1
+
+    height, width = rgba.shape[:2]
+    scale_x = _axis_pixel_scale(_run_lengths(rgba), width)
+    if scale_x == 1:
+        return 1
+    columns = np.ascontiguousarray(rgba.swapaxes(0, 1))
+    scale_y = _axis_pixel_scale(_run_lengths(columns), height)
+    return math.gcd(scale_x, scale_y)
+
+
+def count_palette(rgba: np.ndarray) -> int:
+    """Number of distinct colors among visible pixels"""
+    pixels = rgba.reshape(-1, 4)
+    if len(pixels) > MAX_PALETTE_PIXELS:
+        pixels = pixels[:: len(pixels) // MAX_PALETTE_PIXELS + 1]
+    visible = pixels[pixels[:, 3] > 0]
+    if len(visible) == 0:
+        return 0
+    return len(np.unique(np.ascontiguousarray(visible).view(np.uint32)))
+
+
+def _neighbors_any(mask: np.ndarray) -> np.ndarray:
+    """Pixels with at least one 4-connected neighbor in the mask"""
+    result = np.zeros_like(mask)
+    result[1:, :] |= mask[:-1, :]
+    result[:-1, :] |= mask[1:, :]
+    result[:, 1:] |= mask[:, :-1]
+    result[:, :-1] |= mask[:, 1:]
+    return result
+
+
+def alpha_edge_metrics(rgba: np.ndarray) -> tuple:
+    """
+    Check transparent borders for colors that cause halos when filtered
+
+    Returns:
+        tuple: (unbled_edge_ratio, premultiplied_edges). unbled_edge_ratio is
+        the share of fully transparent pixels next to visible ones whose RGB
+        is black; premultiplied_edges is True when semi-transparent pixels
+        look darkened by their alpha although Godot expects straight alpha.
+    """
+    alpha = rgba[..., 3]
+    rgb = rgba[..., :3]
+    transparent = alpha == 0
+    visible = ~transparent
+    if not transparent.any() or not visible.any():
+        return 0.0, False
+
+    edge = transparent & _neighbors_any(visible)
+    edge_count = int(edge.sum())
+    unbled = 0.0
+    if edge_count:
+        unbled = float((rgb[edge].max(axis=1) == 0).sum()) / edge_count
+
+    partial = (alpha > 0) & (alpha < 255)
+    premultiplied = False
+    if partial.sum() >= 32 and (alpha == 255).any():
+        partial_rgb = rgb[partial].astype(np.int16)
+        partial_alpha = alpha[partial].astype(np.int16)[:, None]
+        within_alpha = (partial_rgb <= partial_alpha + 2).all(axis=1).mean()
+        partial_brightness = partial_rgb.mean()
+        opaque_brightness = rgb[alpha == 255].mean()
+        premultiplied = bool(
+            within_alpha >= 0.98 and partial_brightness < 0.6 * opaque_brightness
+        )
+    return unbled, premultiplied
+
+
+def blur_ratio(rgba: np.ndarray) -> float:
+    """
+    Strongest edges at half resolution relative to full resolution
+
+    A sharp edge is a one-pixel step at any resolution, so the ratio
+    stays near 1 as long as the image has some. A smooth upscale spreads
+    every edge over several pixels, so halving the resolution nearly
+    doubles the steps and the ratio approaches 2. Looking only at the
+    strongest edges keeps smooth gradients in sharp art from counting.
+    """
+    height, width = rgba.shape[:2]
+    if min(height, width) < 32:
+        return 0.0
+
+    # Luminance weighted by alpha, so hidden colors don't count
+    weights = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+    luminance = (rgba[..., :3].astype(np.float32) @ weights) * (
+        rgba[..., 3].astype(np.float32) / 255.0
+    )
+
+    full = np.percentile(np.abs(np.diff(luminance, axis=1)), EDGE_PERCENTILE)
+    if full < 1.0:
+        return 0.0  # Flat image
+
+    even = luminance[: height // 2 * 2, : width // 2 * 2]
+    half = (
+        even[0::2, 0::2] + even[1::2, 0::2] + even[0::2, 1::2] + even[1::2, 1::2]
+    ) / 4
+    return float(np.percentile(np.abs(np.diff(half, axis=1)), EDGE_PERCENTILE) / full)
+
+
+def analyze_texture(rgba: np.ndarray) -> TextureMetrics:
+    """
+    Compute all pixel heuristics of a texture
+
+    Args:
+        rgba: (H, W, 4) uint8 pixels
+
+    Returns:
+        TextureMetrics: Heuristic results
+    """
+    pixel_scale = detect_pixel_scale(rgba)
+
+    # Further checks run on the native grid, which is also far cheaper
+    native = rgba[::pixel_scale, ::pixel_scale] if pixel_scale > 1 else rgba
+    palette_size = count_palette(native)
+    unbled, premultiplied = alpha_edge_metrics(native)
+
+    # Pixel art and small palettes are never smooth upscales
+    ratio = 0.0
+    if pixel_scale == 1 and palette_size > SMALL_PALETTE:
+        ratio = blur_ratio(rgba)
+
+    return TextureMetrics(
+        pixel_scale=pixel_scale,
+        palette_size=palette_size,
+        unbled_edge_ratio=round(unbled, 3),
+        premultiplied_edges=premultiplied,
+        blur_ratio=round(ratio, 3),
+        blurry_upscale=ratio >= BLURRY_UPSCALE_RATIO,
+    )
+
+
+def read_import_settings(image_path: Path) -> Dict[str, bool]:
+    """
+    Texture import settings that change how heuristics apply
+
+    Args:
+        image_path: Path to the image file
+
+    Returns:
+        Dict[str, bool]: "mipmaps" and "fix_alpha_border" as set in the
+        image's .import file; settings that aren't found are left out
+    """
+    import_path = Path(f"{image_path}.import")
+    try:
+        text = import_path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return {}
+
+    settings = {}
+    for match in _IMPORT_SETTING_PATTERN.finditer(text):
+        settings[_IMPORT_SETTINGS[match.group(1)]] = match.group(2) == "true"
+    return settings
+
+
+def make_sprite_corpus(count: int, seed: int = 0) -> list:
+    """
+    Synthetic 2D sprites: small palettes and black transparent borders,
+    cycling through native, nearest 4x, bicubic 4x and nearest 2x sizes
+
+    Args:
+        count: Number of sprites
+        seed: Random seed
+
+    Returns:
+        list: (H, W, 4) uint8 arrays
+    """
+    from PIL import Image
+
+    rng = np.random.default_rng(seed)
+    sprites = []
+    for i in range(count):
+        size = int(rng.choice([16, 24, 32, 48, 64]))
+        palette = rng.integers(
+            0, 256, size=(int(rng.integers(4, 24)), 4), dtype=np.uint8
+        )
+        palette[:, 3] = 255
+        art = palette[rng.integers(0, len(palette), size=(size, size))]
+
+        # Transparent surroundings
+        mask = np.zeros((size, size), dtype=bool)
+        margin = size // 8
+        mask[margin:-margin, margin:-margin] = True
+        art[~mask] = 0
+
+        image = Image.fromarray(art, "RGBA")
+        kind = i % 4
+        if kind == 1:
+            image = image.resize((size * 4, size * 4), Image.Resampling.NEAREST)
+        elif kind == 2:
+            image = image.resize((size * 4, size * 4), Image.Resampling.BICUBIC)
+        elif kind == 3:
+            image = image.resize((size * 2, size * 2), Image.Resampling.NEAREST)
+        sprites.append(np.asarray(image.convert("RGBA"), dtype=np.uint8))
+    return sprites
+
+
+# Example usage
+def main():
+    """Benchmark the heuristics on a synthetic sprite corpus"""
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Benchmark texture heuristics")
+    parser.add_argument("--count", type=int, default=2000, help="Sprites to analyze")
+    args = parser.parse_args()
+
+    sprites = make_sprite_corpus(args.count)
+    pixels = sum(sprite.shape[0] * sprite.shape[1] for sprite in sprites)
+
+    start_time = time.time()
+    results = [analyze_texture(sprite) for sprite in sprites]
+    elapsed = time.time() - start_time
+
+    print(
+        f"Analyzed {len(sprites)} sprites ({pixels / 1e6:.1f} MPixels) in "
+        f"{elapsed:.2f}s: {len(sprites) / elapsed:.0f} sprites/s on one core"
+    )
+    for kind, label in enumerate(["native", "nearest 4x", "bicubic 4x", "nearest 2x"]):
+        group = results[kind::4]
+        scales = sorted({r.pixel_scale for r in group})
+        blurry = sum(r.blurry_upscale for r in group)
+        print(
+            f"  {label:>10}: pixel scales {scales}, "
+            f"{blurry}/{len(group)} flagged as blurry upscales"
+        )
+
+
+if __name__ == "__main__":
+    main()
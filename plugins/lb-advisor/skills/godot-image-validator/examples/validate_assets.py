@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+Headless Batch Validator for Godot Image Validator
+
+This module is a command line entry point that validates images without a display. It
+runs the same ValidationPipeline as the PyQt6 UI, streams one JSON line per image as
+soon as it is validated, skips unchanged images using a persistent result cache, and
+exits non-zero when any asset falls below the manual_review_required threshold, so it
+can gate CI jobs and build boxes. Qt is never imported.
+
+Usage:
+    python validate_assets.py res/textures --output results.jsonl
+    python validate_assets.py sprite.png icon.svg --config scorer.json --rules rules.yaml
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional, TextIO
+
+from asset_scanner import ScanConfig, iter_asset_paths
+from confidence_scorer import ConfidenceScorer
+from mcp_client import DedupConfig, MCPClient, PreprocessConfig
+from validation_pipeline import ValidationPipeline
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Exit codes
+EXIT_OK = 0
+EXIT_BELOW_THRESHOLD = 1
+EXIT_USAGE = 2
+
+
+def default_result_cache_path() -> Path:
+    """Result cache file under the XDG cache home"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "godot-image-validator" / "results.json"
+
+
+class ResultCache:
+    """
+    Persistent validation results for unchanged images
+
+    Entries are keyed by absolute path, mtime and file size, so an edited
+    image misses the cache. The whole cache is dropped when the scorer
+    configuration changes, since cached confidences would no longer match.
+    """
+
+    def __init__(self, cache_path: Path, fingerprint: str):
+        """
+        Initialize result cache
+
+        Args:
+            cache_path: JSON file holding the cache
+            fingerprint: Hash of the configuration results depend on
+        """
+        self.cache_path = Path(cache_path)
+        self.fingerprint = fingerprint
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.hits = 0
+
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("fingerprint") == fingerprint:
+            self.entries = data.get("entries", {})
+
+    @staticmethod
+    def key(image_path: Path) -> Optional[str]:
+        """Cache key for an image, or None if it can't be stat'ed"""
+        try:
+            stat = os.stat(image_path)
+        except OSError:
+            return None
+        return f"{Path(image_path).resolve()}\0{stat.st_mtime_ns}\0{stat.st_size}"
+
+    def get(self, image_path: Path) -> Optional[Dict[str, Any]]:
+        """Get a cached result, or None on a miss"""
+        key = self.key(image_path)
+        result = self.entries.get(key) if key else None
+        if result is not None:
+            self.hits += 1
+        return result
+
+    def put(self, image_path: Path, result: Dict[str, Any]):
+        """Cache a successful result (failures are always retried)"""
+        key = self.key(image_path)
+        if key and result.get("success"):
+            self.entries[key] = result
+
+    def save(self):
+        """Write the cache; failures only cost future cache misses"""
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so an interrupted save keeps the old cache
+            temp_path = self.cache_path.with_suffix(f".{os.getpid()}.tmp")
+            temp_path.write_text(
+                json.dumps(
+                    {"fingerprint": self.fingerprint, "entries": self.entries},
+                    default=str,
+                ),
+                encoding="utf-8",
+            )
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(f"Could not save result cache {self.cache_path}: {e}")
+
+
+def config_fingerprint(confidence_scorer: ConfidenceScorer, extra: Dict) -> str:
+    """Hash of the scorer and client settings that affect results"""
+    payload = json.dumps(
+        {"scorer": confidence_scorer.export_config(), "client": extra},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def iter_inputs(inputs: List[str], scan_config: ScanConfig) -> Iterator[Path]:
+    """Expand files and folders into image paths, dropping duplicates"""
+    seen = set()
+    for item in inputs:
+        path = Path(item)
+        paths = iter_asset_paths(path, scan_config) if path.is_dir() else [path]
+        for image_path in paths:
+            resolved = image_path.resolve()
+            if resolved not in seen:
+                seen.add(resolved)
+                yield image_path
+
+
+def to_record(
+    result: Dict[str, Any], confidence_scorer: ConfidenceScorer, cached: bool
+) -> Dict[str, Any]:
+    """JSON-ready output record for a result"""
+    record = dict(result)
+    record["image_path"] = str(result["image_path"])
+    record["level"] = confidence_scorer.get_validation_level(result["confidence"]).value
+    record["cached"] = cached
+    return record
+
+
+class BatchValidator:
+    """Validates images headlessly and streams results as JSON lines"""
+
+    def __init__(
+        self,
+        mcp_client: MCPClient,
+        confidence_scorer: ConfidenceScorer,
+        output: TextIO,
+        max_concurrent: int = 4,
+        cache: Optional[ResultCache] = None,
+        fail_below: Optional[float] = None,
+    ):
+        """
+        Initialize batch validator
+
+        Args:
+            mcp_client: Client used for image analysis
+            confidence_scorer: Scorer for confidence and custom rules
+            output: Stream receiving one JSON object per line
+            max_concurrent: Maximum analyses in flight
+            cache: Result cache for unchanged images
+            fail_below: Confidence below which an image fails the run
+                (defaults to the manual_review_required threshold)
+        """
+        self.confidence_scorer = confidence_scorer
+        self.output = output
+        self.cache = cache
+        self.pipeline = ValidationPipeline(
+            mcp_client, confidence_scorer, max_concurrent
+        )
+        self.fail_below = (
+            fail_below
+            if fail_below is not None
+            else confidence_scorer.thresholds.manual_review_required
+        )
+        self.counts: Dict[str, int] = {}
+        self.failing = 0
+
+    def emit(self, result: Dict[str, Any], cached: bool = False):
+        """Write one result and flush it so consumers see it immediately"""
+        record = to_record(result, self.confidence_scorer, cached)
+        self.counts[record["level"]] = self.counts.get(record["level"], 0) + 1
+        if record["confidence"] < self.fail_below:
+            self.failing += 1
+        self.output.write(json.dumps(record, default=str) + "\n")
+        self.output.flush()
+
+    async def run(self, image_paths: List[Path]) -> int:
+        """
+        Validate images, serving unchanged ones from the cache
+
+        Returns:
+            int: Number of images with a result
+        """
+        pending = []
+        for image_path in image_paths:
+            cached = self.cache.get(image_path) if self.cache else None
+            if cached is not None:
+                self.emit(cached, cached=True)
+            else:
+                pending.append(image_path)
+
+        def on_result(index: int, result: Dict[str, Any]):
+            if self.cache:
+                self.cache.put(
+                    pending[index], {**result, "image_path": str(pending[index])}
+                )
+            self.emit(result)
+
+        completed = await self.pipeline.run(pending, on_result)
+        return len(image_paths) - len(pending) + completed
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Command line arguments"""
+    parser = argparse.ArgumentParser(
+        prog="validate_assets",
+        description="Validate Godot image assets without a display",
+    )
+    parser.add_argument("inputs", nargs="+", help="Image files or folders to validate")
+    parser.add_argument(
+        "-o", "--output", help="JSON Lines output file (default: stdout)"
+    )
+    parser.add_argument(
+        "-j", "--concurrency", type=int, default=4, help="Analyses in flight"
+    )
+    parser.add_argument("--config", help="Scorer configuration JSON (as exported)")
+    parser.add_argument(
+        "--rules", action="append", default=[], help="Declarative rules file"
+    )
+    parser.add_argument("--max-depth", type=int, default=None)
+    parser.add_argument("--exclude", action="append", default=[], help="Exclude glob")
+    parser.add_argument("--imported-only", action="store_true")
+    parser.add_argument(
+        "--cache", help=f"Result cache file (default: {default_result_cache_path()})"
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Ignore cached results")
+    parser.add_argument(
+        "--preprocess", action="store_true", help="Downscale images before upload"
+    )
+    parser.add_argument(
+        "--dedup", action="store_true", help="Reuse results for near-duplicates"
+    )
+    parser.add_argument(
+        "--fail-below",
+        type=float,
+        default=None,
+        help="Fail on confidence below this (default: manual_review_required)",
+    )
+    parser.add_argument(
+        "--trace", help="Append OpenTelemetry spans to this file (OTLP/JSON lines)"
+    )
+    parser.add_argument("-q", "--quiet", action="store_true", help="Only log errors")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the batch validator and return the process exit code"""
+    args = build_parser().parse_args(argv)
+    if args.quiet:
+        logging.getLogger().setLevel(logging.ERROR)
+    if args.concurrency < 1:
+        print("validate_assets: --concurrency must be at least 1", file=sys.stderr)
+        return EXIT_USAGE
+
+    try:
+        confidence_scorer = ConfidenceScorer()
+        if args.config:
+            with open(args.config, "r", encoding="utf-8") as f:
+                confidence_scorer.import_config(json.load(f))
+        for rules_path in args.rules:
+            confidence_scorer.load_rules(Path(rules_path))
+
+        scan_config = ScanConfig(
+            max_depth=args.max_depth, imported_only=args.imported_only
+        )
+        scan_config.exclude_globs.extend(args.exclude)
+        scan_config.validate()
+
+        mcp_client = MCPClient(
+            preprocess_config=PreprocessConfig() if args.preprocess else None,
+            dedup_config=DedupConfig() if args.dedup else None,
+            trace_path=Path(args.trace) if args.trace else None,
+        )
+    except (OSError, ValueError, ImportError) as e:
+        print(f"validate_assets: {e}", file=sys.stderr)
+        return EXIT_USAGE
+
+    cache = None
+    if not args.no_cache:
+        fingerprint = config_fingerprint(
+            confidence_scorer, {"preprocess": args.preprocess, "dedup": args.dedup}
+        )
+        cache = ResultCache(
+            Path(args.cache) if args.cache else default_result_cache_path(),
+            fingerprint,
+        )
+
+    image_paths = list(iter_inputs(args.inputs, scan_config))
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+
+    start_time = time.time()
+    validator = BatchValidator(
+        mcp_client, confidence_scorer, output, args.concurrency, cache, args.fail_below
+    )
+    try:
+        completed = asyncio.run(validator.run(image_paths))
+    except KeyboardInterrupt:
+        validator.pipeline.cancel()
+        completed = sum(validator.counts.values())
+        print("validate_assets: interrupted", file=sys.stderr)
+    finally:
+        if cache:
+            cache.save()
+        if output is not sys.stdout:
+            output.close()
+        confidence_scorer.shutdown()
+        mcp_client.close()
+
+    elapsed = time.time() - start_time
+    levels = ", ".join(f"{n} {level}" for level, n in sorted(validator.counts.items()))
+    print(
+        f"Validated {completed}/{len(image_paths)} images in {elapsed:.2f}s"
+        f" ({cache.hits if cache else 0} cached): {levels or 'nothing to do'}",
+        file=sys.stderr,
+    )
+    latency = mcp_client.metrics.latency["total"]
+    if latency.count:
+        print(
+            f"Analysis latency p50 {latency.percentile(50):.2f}s,"
+            f" p95 {latency.percentile(95):.2f}s",
+            file=sys.stderr,
+        )
+    if validator.failing:
+        print(
+            f"{validator.failing} image(s) below confidence"
+            f" {validator.fail_below:.2f}",
+            file=sys.stderr,
+        )
+        return EXIT_BELOW_THRESHOLD
+    return EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Validation Pipeline for Godot Image Validator
+
+This module holds the Qt-free validation engine shared by the PyQt6 UI and the headless
+CLI. It runs technical pre-analysis on all cores, analyzes images with a bounded number
+of concurrent MCP calls, scores them and applies custom rules, delivering each result
+as soon as it is ready. Images are taken in priority order from an AnalysisScheduler
+that other threads may re-rank mid-run. Runs can be paused, resumed and cancelled from
+another thread.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Any, List, Optional
+
+from analysis_scheduler import AnalysisScheduler
+from confidence_scorer import ConfidenceScorer, ImageContext, ImageHeader
+from mcp_client import MCPClient
+from technical_profile import TechnicalPreAnalyzer, TechnicalProfile
+
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Images pre-analyzed ahead of the workers, per pre-analysis process
+PROFILE_LOOKAHEAD_PER_WORKER = 4
+
+
+class ValidationPipeline:
+    """Validates a list of images with bounded concurrency"""
+
+    def __init__(
+        self,
+        mcp_client: MCPClient,
+        confidence_scorer: ConfidenceScorer,
+        max_concurrent: int = 4,
+        pre_analyzer: Optional[TechnicalPreAnalyzer] = None,
+    ):
+        """
+        Initialize validation pipeline
+
+        Args:
+            mcp_client: Client used for image analysis
+            confidence_scorer: Scorer for confidence and custom rules
+            max_concurrent: Maximum analyses in flight
+            pre_analyzer: Technical pre-analysis pool (one is created if omitted)
+        """
+        self.mcp_client = mcp_client
+        self.confidence_scorer = confidence_scorer
+        self.max_concurrent = max_concurrent
+        self.pre_analyzer = pre_analyzer or TechnicalPreAnalyzer()
+        self.completed = 0
+        self._profile_futures = {}
+
+        # Control state shared with other threads
+        self.cancelled = False
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        self._loop = None
+        self._workers = []
+
+    async def run(
+        self,
+        image_paths: List[Path],
+        on_result: Callable[[int, Dict[str, Any]], None],
+        scheduler: Optional[AnalysisScheduler] = None,
+    ) -> int:
+        """
+        Validate all images, calling on_result(index, result) as each finishes
+
+        Results arrive in completion order, not input order.
+
+        Args:
+            image_paths: Paths to the image files
+            on_result: Receives the input index and result of each image
+            scheduler: Priority order of the images (input order if omitted)
+
+        Returns:
+            int: Number of images validated (fewer if cancelled)
+        """
+        if scheduler is None:
+            scheduler = AnalysisScheduler(len(image_paths))
+        elif len(scheduler) != len(image_paths):
+            raise ValueError(
+                f"Scheduler holds {len(scheduler)} jobs for {len(image_paths)} images"
+            )
+
+        self.completed = 0
+        self._loop = asyncio.get_running_loop()
+
+        try:
+            # Local technical checks run on all cores just ahead of the MCP calls
+            self._prefetch_profiles(scheduler, image_paths)
+
+            worker_count = max(1, min(self.max_concurrent, len(image_paths)))
+            self._workers = [
+                asyncio.ensure_future(self._worker(scheduler, image_paths, on_result))
+                for _ in range(worker_count)
+            ]
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        finally:
+            self.pre_analyzer.shutdown()
+            self._profile_futures = {}
+            self._workers = []
+            self._loop = None
+
+        return self.completed
+
+    async def _worker(
+        self,
+        scheduler: AnalysisScheduler,
+        image_paths: List[Path],
+        on_result: Callable[[int, Dict[str, Any]], None],
+    ):
+        """Take the most important image and deliver its result as soon as it is ready"""
+        while not self.cancelled:
+            # Paused workers finish their current image, then wait here
+            while not self._resume_event.is_set():
+                await asyncio.sleep(0.1)
+            if self.cancelled:
+                return
+
+            index = scheduler.pop()
+            if index is None:
+                return
+
+            self._prefetch_profiles(scheduler, image_paths, index)
+            profile = await self._get_profile(index, image_paths[index])
+            start_time = time.perf_counter()
+            result = await self.validate_single_image(image_paths[index], profile)
+            result["processing_time"] = time.perf_counter() - start_time
+            if self.cancelled:
+                return
+
+            self.completed += 1
+            on_result(index, result)
+
+    def _prefetch_profiles(
+        self,
+        scheduler: AnalysisScheduler,
+        image_paths: List[Path],
+        current: Optional[int] = None,
+    ):
+        """
+        Submit pre-analysis for the image being started and the next in line
+
+        Submitting only a short lookahead instead of every image up front lets
+        re-ranked images skip the pre-analysis backlog as well.
+        """
+        lookahead = PROFILE_LOOKAHEAD_PER_WORKER * self.pre_analyzer.max_workers
+        upcoming = scheduler.peek(max(lookahead, self.max_concurrent))
+        for index in ([current] if current is not None else []) + upcoming:
+            if index not in self._profile_futures:
+                self._profile_futures[index] = self.pre_analyzer.submit(
+                    image_paths[index]
+                )
+
+    async def _get_profile(
+        self, index: int, image_path: Path
+    ) -> Optional[TechnicalProfile]:
+        """Wait for the technical profile of an image, if pre-analysis succeeded"""
+        future = self._profile_futures.pop(index, None)
+        if future is None:
+            return None
+
+        try:
+            return await asyncio.wrap_future(future)
+        except Exception as e:
+            logger.warning(f"Technical pre-analysis failed for {image_path}: {e}")
+            return None
+
+    def pause(self):
+        """Stop starting new analyses until resumed"""
+        self._resume_event.clear()
+
+    def resume(self):
+        """Resume a paused run"""
+        self._resume_event.set()
+
+    def is_paused(self) -> bool:
+        """Check if the run is paused"""
+        return not self._resume_event.is_set()
+
+    def cancel(self):
+        """Cancel the run, abandoning in-flight analyses (thread-safe)"""
+        self.cancelled = True
+        self._resume_event.set()
+
+        loop = self._loop
+        if loop is not None:
+            try:
+                loop.call_soon_threadsafe(self._cancel_workers)
+            except RuntimeError:
+                pass  # Loop already closed
+
+    def _cancel_workers(self):
+        """Cancel worker tasks (runs on the pipeline's loop)"""
+        for worker in self._workers:
+            worker.cancel()
+
+    async def validate_single_image(
+        self, image_path: Path, profile: Optional[TechnicalProfile] = None
+    ) -> Dict[str, Any]:
+        """Validate a single image"""
+        # Obviously broken assets don't need an inference call
+        if profile is not None and profile.is_broken():
+            return {
+                "image_path": image_path,
+                "success": False,
+                "confidence": 0.0,
+                "categories": ["other"],
+                "issues": [profile.broken_reason()],
+                "metadata": {
+                    "technical_profile": profile.to_dict(),
+                    "short_circuited": True,
+                },
+            }
+
+        try:
+            # Analyze with MCP client
+            analysis_result = await self.mcp_client.analyze_image(image_path)
+
+            if analysis_result.success:
+                technical_score = 0.9
+                issues = list(analysis_result.issues)
+                metadata = dict(analysis_result.metadata)
+                if profile is not None:
+                    technical_score = profile.technical_score()
+                    issues.extend(profile.get_issues())
+                    metadata["technical_profile"] = profile.to_dict()
+
+                # Calculate confidence
+                confidence = self.confidence_scorer.calculate_confidence(
+                    {
+                        "content_match": analysis_result.confidence,
+                        "quality_assessment": analysis_result.confidence * 0.9,
+                        "category_confidence": analysis_result.confidence,
+                        "technical_analysis": technical_score,
+                    }
+                )
+
+                # Apply custom rules against one shared image context,
+                # reusing the header the pre-analysis already read
+                header = None
+                if profile is not None and profile.decoded:
+                    header = ImageHeader(
+                        profile.width,
+                        profile.height,
+                        profile.mode,
+                        profile.image_format,
+                    )
+                # Rules may block (file or network I/O, timeouts), so they run
+                # off the event loop while other images keep progressing
+                loop = asyncio.get_running_loop()
+                with ImageContext(image_path, header) as context:
+                    modified_result = await loop.run_in_executor(
+                        None,
+                        self.confidence_scorer.apply_custom_rules,
+                        context,
+                        {
+                            "confidence": confidence,
+                            "categories": analysis_result.categories,
+                            "issues": issues,
+                        },
+                    )
+
+                return {
+                    "image_path": image_path,
+                    "success": True,
+                    "confidence": modified_result.get("confidence", confidence),
+                    "categories": modified_result.get(
+                        "categories", analysis_result.categories
+                    ),
+                    "issues": modified_result.get("issues", issues),
+                    "metadata": metadata,
+                }
+            else:
+                return {
+                    "image_path": image_path,
+                    "success": False,
+                    "confidence": 0.0,
+                    "categories": ["other"],
+                    "issues": [analysis_result.error_message or "Analysis failed"],
+                    "metadata": {},
+                }
+
+        except Exception as e:
+            return {
+                "image_path": image_path,
+                "success": False,
+                "confidence": 0.0,
+                "categories": ["other"],
+                "issues": [str(e)],
+                "metadata": {},
+            }